@@ -0,0 +1,89 @@
+"""
+Bulk parsing benchmarks.
+
+Compares CalmarendianDate.parse_many, which turns a column of date strings into an array of ADRs without creating
+any date objects, with the per-row alternative of calling CalmarendianDate.from_date_string and keeping each
+date's ADR.
+
+Also compares CalmarendianDate.numbers_from_adrs, which decodes a column of ADRs into five columns of GCN elements,
+in pure Python and (where NumPy is installed) vectorized, with calling CalmarendianDate.numbers_from_adr per row,
+and the bulk formatters with the per-date formatting methods.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk
+"""
+
+import random
+from array import array
+from typing import List
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+SAMPLE_SIZE = 100_000
+
+
+def sample(notation: str, sample_size: int = SAMPLE_SIZE) -> List[str]:
+    """
+    Return date strings, in the given notation, for random dates across the range that notation can represent.
+    """
+    rng = random.Random(777)
+    if notation == "GCN":
+        dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR)) for _ in range(sample_size)]
+        return [d.gcn() for d in dates]
+    max_adr = CalmarendianDate.from_date_string("9999-7-51-4").adr
+    dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, max_adr)) for _ in range(sample_size)]
+    return [d.csn() for d in dates]
+
+
+def per_row(date_strings: List[str]) -> array:
+    return array('l', [CalmarendianDate.from_date_string(s).adr for s in date_strings])
+
+
+def decode_per_row(adrs: array) -> List[array]:
+    rows = [CalmarendianDate.numbers_from_adr(adr) for adr in adrs]
+    return [array('l', column) for column in zip(*rows)]
+
+
+def main() -> None:
+    print(f"{'notation':<12}{'rows':>10}{'per row (ms)':>16}{'parse_many (ms)':>18}{'speedup':>10}")
+    for notation in ("GCN", "CSN"):
+        date_strings = sample(notation)
+        assert per_row(date_strings) == CalmarendianDate.parse_many(date_strings)
+        t_per_row = best_of(lambda: per_row(date_strings)) * 1000
+        t_bulk = best_of(lambda: CalmarendianDate.parse_many(date_strings)) * 1000
+        print(f"{notation:<12}{len(date_strings):>10}{t_per_row:>16.1f}{t_bulk:>18.1f}{t_per_row / t_bulk:>9.2f}x")
+
+    rng = random.Random(777)
+    adrs = array('l', [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(SAMPLE_SIZE)])
+    t_per_row = best_of(lambda: decode_per_row(adrs)) * 1000
+    print(f"\n{'decoder':<28}{'rows':>10}{'time (ms)':>12}{'speedup':>10}")
+    print(f"{'numbers_from_adr per row':<28}{len(adrs):>10}{t_per_row:>12.1f}")
+    t_pure = best_of(lambda: CalmarendianDate.numbers_from_adrs(adrs)) * 1000
+    print(f"{'numbers_from_adrs':<28}{len(adrs):>10}{t_pure:>12.1f}{t_per_row / t_pure:>9.2f}x")
+    if bulk.numpy is not None:
+        np_adrs = bulk.numpy.asarray(adrs)
+        t_numpy = best_of(lambda: CalmarendianDate.numbers_from_adrs(np_adrs)) * 1000
+        print(f"{'numbers_from_adrs (NumPy)':<28}{len(adrs):>10}{t_numpy:>12.1f}{t_per_row / t_numpy:>9.2f}x")
+
+    dates = [CalmarendianDate(adr) for adr in adrs]
+    for date in dates:
+        date.date_elements()
+    formatters = [
+        ("GCN", lambda: [d.grand_cycle_notation() for d in dates], lambda: bulk.grand_cycle_notations(adrs)),
+        ("CSN", lambda: [d.common_symbolic_notation() for d in dates], lambda: bulk.common_symbolic_notations(adrs)),
+        ("colloquial",
+         lambda: [d.colloquial_date(verbose=True) for d in dates],
+         lambda: bulk.colloquial_dates(adrs, verbose=True)),
+    ]
+    print(f"\n{'format':<12}{'rows':>10}{'per date (ms)':>16}{'bulk (ms)':>12}{'speedup':>10}")
+    for description, per_date, column in formatters:
+        t_per_date = best_of(per_date) * 1000
+        t_column = best_of(column) * 1000
+        print(f"{description:<12}{len(adrs):>10}{t_per_date:>16.1f}{t_column:>12.1f}{t_per_date / t_column:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Comparison, sorting and hashing benchmarks.
+
+Compares CalmarendianDate's hand-written rich comparisons and ADR-based hash with the arrangement they replaced:
+functools.total_ordering deriving <=, > and >= from __eq__ and __lt__, with sets and dictionaries keyed on d.adr
+because dates could not be hashed.
+
+Run from the repository root:
+    python -m benchmarks.bench_comparisons
+"""
+
+import random
+from functools import total_ordering
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+SAMPLE_SIZE = 100_000
+
+
+@total_ordering
+class TotalOrderingDate(object):
+    """
+    A stand-in for CalmarendianDate ordered, and left unhashable, the way CalmarendianDate used to be.
+    """
+    __slots__ = ('_absolute_day_reference',)
+
+    def __init__(self, adr: int):
+        self._absolute_day_reference = adr
+
+    @property
+    def adr(self) -> int:
+        return self._absolute_day_reference
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TotalOrderingDate):
+            return NotImplemented
+        return self.adr == other.adr
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, TotalOrderingDate):
+            return NotImplemented
+        return self.adr < other.adr
+
+
+def cases(sample_size: int = SAMPLE_SIZE) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    """
+    Return (description, previous way, current way) triples for each benchmarked operation.
+    """
+    rng = random.Random(777)
+    adrs = [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(sample_size)]
+    dates = [CalmarendianDate(adr) for adr in adrs]
+    old_dates = [TotalOrderingDate(adr) for adr in adrs]
+    by_adr = {d.adr: d for d in dates}
+    by_date = {d: d for d in dates}
+    probes = dates[::10]
+
+    return [
+        ("sorted() by __lt__", lambda: sorted(old_dates), lambda: sorted(dates)),
+        ("sorted(reverse=True)", lambda: sorted(old_dates, reverse=True), lambda: sorted(dates, reverse=True)),
+        ("pairwise >=",
+         lambda: [a >= b for a, b in zip(old_dates, old_dates[1:])],
+         lambda: [a >= b for a, b in zip(dates, dates[1:])]),
+        ("set() de-duplication", lambda: {d.adr: d for d in dates}.values(), lambda: set(dates)),
+        ("dict lookup", lambda: [by_adr[d.adr] for d in probes], lambda: [by_date[d] for d in probes]),
+    ]
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'previous (ms)':>16}{'current (ms)':>16}{'speedup':>10}")
+    for description, previous, current in cases():
+        t_previous = best_of(previous) * 1000
+        t_current = best_of(current) * 1000
+        print(f"{description:<24}{t_previous:>16.2f}{t_current:>16.2f}{t_previous / t_current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
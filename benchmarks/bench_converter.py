@@ -0,0 +1,50 @@
+"""
+Bulk conversion benchmarks.
+
+Compares converter.convert_many, in a single process and across a pool of worker processes (one per CPU),
+with calling CalmarendianDate.from_date_string and a notation method for each date in a loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_converter
+"""
+
+import os
+import random
+from typing import List
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.converter import Notation, convert_many
+
+SAMPLE_SIZE = 200_000
+
+
+def sample(sample_size: int = SAMPLE_SIZE) -> List[str]:
+    rng = random.Random(777)
+    adrs = [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(sample_size)]
+    return bulk.grand_cycle_notations(adrs)
+
+
+def main() -> None:
+    date_strings = sample()
+    workers = os.cpu_count() or 1
+    cases = [
+        ("from_date_string loop",
+         lambda: [CalmarendianDate.from_date_string(s).colloquial_date() for s in date_strings]),
+        ("convert_many, 1 worker",
+         lambda: convert_many(date_strings, Notation.COLLOQUIAL, workers=1)),
+        (f"convert_many, {workers} worker(s)",
+         lambda: convert_many(date_strings, Notation.COLLOQUIAL, workers=workers)),
+    ]
+    print(f"{'GCN to colloquial':<28}{'rows':>10}{'time (ms)':>12}{'speedup':>10}")
+    baseline = None
+    for description, convert in cases:
+        t = best_of(convert, repeat=3) * 1000
+        baseline = baseline or t
+        print(f"{description:<28}{len(date_strings):>10}{t:>12.1f}{baseline / t:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
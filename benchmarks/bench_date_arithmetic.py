@@ -0,0 +1,61 @@
+"""
+Date arithmetic benchmarks.
+
+Compares shifting dates by a CalmarendianTimeDelta with rebuilding them from their ADRs,
+CalmarendianDate(d.adr + n), which was the only way before dates supported addition and subtraction.
+When the shifted dates' elements are needed, addition reuses the decoded elements of the original date for any
+result within the same cycle, where rebuilding has to decode every date.
+
+Run from the repository root:
+    python -m benchmarks.bench_date_arithmetic
+"""
+
+import random
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate, CalmarendianTimeDelta
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+SAMPLE_SIZE = 100_000
+
+
+def cases(sample_size: int = SAMPLE_SIZE) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    """
+    Return (description, previous way, current way) triples for each benchmarked operation.
+    """
+    rng = random.Random(777)
+    dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR - 400)) for _ in range(sample_size)]
+    for d in dates:
+        d.date_elements()
+    day, week, season = (CalmarendianTimeDelta(days=n) for n in (1, 7, 350))
+
+    return [
+        ("+ 1 day",
+         lambda: [CalmarendianDate(d.adr + 1) for d in dates],
+         lambda: [d + day for d in dates]),
+        ("+ 1 day, elements",
+         lambda: [CalmarendianDate(d.adr + 1).date_elements() for d in dates],
+         lambda: [(d + day).date_elements() for d in dates]),
+        ("+ 1 week, elements",
+         lambda: [CalmarendianDate(d.adr + 7).date_elements() for d in dates],
+         lambda: [(d + week).date_elements() for d in dates]),
+        ("+ 1 season, elements",
+         lambda: [CalmarendianDate(d.adr + 350).date_elements() for d in dates],
+         lambda: [(d + season).date_elements() for d in dates]),
+        ("date - date",
+         lambda: [CalmarendianTimeDelta(days=a.adr - b.adr) for a, b in zip(dates, dates[1:])],
+         lambda: [a - b for a, b in zip(dates, dates[1:])]),
+    ]
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'previous (ms)':>16}{'current (ms)':>16}{'speedup':>10}")
+    for description, previous, current in cases():
+        t_previous = best_of(previous) * 1000
+        t_current = best_of(current) * 1000
+        print(f"{description:<24}{t_previous:>16.2f}{t_current:>16.2f}{t_previous / t_current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
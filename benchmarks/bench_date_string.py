@@ -0,0 +1,92 @@
+"""
+Date string parsing benchmarks.
+
+Compares DateString's single-pass scanner with the RegEx matching it replaced, which tried
+CDateConfig.GCN_DATE_STRING_RE, then CDateConfig.CSN_DATE_STRING_RE, and converted the matched groups one by one.
+(The era marker warnings, which are unchanged, are left out of the RegEx version.)
+Valid and invalid date strings of both notations are timed.
+
+Run from the repository root:
+    python -m benchmarks.bench_date_string
+"""
+
+import warnings
+from math import ceil
+from typing import List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateFormatError
+from npm_calmarendian_date.string_conversions import DateString
+
+NUMBER = 20_000
+
+CASES: List[Tuple[str, str]] = [
+    ("GCN", "02-077-7-03-1"),
+    ("CSN", "777-7-03-1"),
+    ("CSN with era marker", "699-1-01-1 BZ"),
+    ("invalid GCN", "02-877-7-03-1"),
+    ("invalid CSN", "777-7-63-1"),
+    ("garbage", "Monday, Week 3 of Onset 777"),
+]
+
+
+class RegexDateString(object):
+    """
+    DateString as it was: matching against the RegExs and converting the matched groups.
+    """
+
+    def __init__(self, date_string: str):
+        m = CDateConfig.GCN_DATE_STRING_RE.match(date_string)
+        if m:
+            self.gc, self.c, self.s, self.w, self.d = (
+                int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)), int(m.group(5))
+            )
+            return
+        m = CDateConfig.CSN_DATE_STRING_RE.match(date_string)
+        if m:
+            c = int(m.group(1))
+            if m.group(5) and m.group(5).upper() == "BZ":
+                c = -c
+            gc = ceil(c / 700)
+            c += 700 * (1 - gc)
+            self.gc, self.c, self.s, self.w, self.d = gc, c, int(m.group(2)), int(m.group(3)), int(m.group(4))
+            return
+        raise CalmarendianDateFormatError(f"DATE STRING: '{date_string}' is an invalid date string.")
+
+    def elements(self) -> Tuple[int, int, int, int, int]:
+        return self.gc, self.c, self.s, self.w, self.d
+
+
+def regex_parse(date_string: str) -> Tuple[int, int, int, int, int]:
+    return RegexDateString(date_string).elements()
+
+
+def scanner_parse(date_string: str) -> Tuple[int, int, int, int, int]:
+    return DateString(date_string).elements()
+
+
+def timed(parse, date_string: str) -> float:
+    """
+    Return the time, in microseconds, to parse (or reject) the date string.
+    """
+    def run():
+        for _ in range(NUMBER):
+            try:
+                parse(date_string)
+            except CalmarendianDateFormatError:
+                pass
+    return best_of(run) / NUMBER * 1e6
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    print(f"{'input':<22}{'regex (us)':>12}{'scanner (us)':>14}{'speedup':>10}")
+    for description, date_string in CASES:
+        t_regex = timed(regex_parse, date_string)
+        t_scanner = timed(scanner_parse, date_string)
+        print(f"{description:<22}{t_regex:>12.3f}{t_scanner:>14.3f}{t_regex / t_scanner:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Decode table benchmarks.
+
+Compares decoding ADRs by bisecting the cycle boundaries with decoding them by looking them up in the packed grand
+cycle decode table (see npm_calmarendian_date.decode_table): per date with CalmarendianDate.numbers_from_adr and
+the decoding of the elements of new dates, and per column with bulk.numbers_from_adrs. Also times building the
+table in memory and mapping it from a file.
+
+Run from the repository root:
+    python -m benchmarks.bench_decode_table
+"""
+
+import os
+import random
+import tempfile
+import time
+from array import array
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate, decode_table
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+SAMPLE_SIZE = 100_000
+
+
+def cases(adrs: array) -> List[Tuple[str, Callable[[], object]]]:
+    numbers_from_adr = CalmarendianDate.numbers_from_adr
+    result = [
+        ("numbers_from_adr per row", lambda: [numbers_from_adr(adr) for adr in adrs]),
+        ("date_elements of new dates", lambda: [CalmarendianDate(adr).date_elements() for adr in adrs]),
+        ("bulk.numbers_from_adrs", lambda: bulk.numbers_from_adrs(adrs)),
+    ]
+    if bulk.numpy is not None:
+        numpy_adrs = bulk.numpy.asarray(adrs)
+        result.append(("bulk.numbers_from_adrs (NumPy)", lambda: bulk.numbers_from_adrs(numpy_adrs)))
+    return result
+
+
+def main() -> None:
+    rng = random.Random(777)
+    adrs = array('l', [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(SAMPLE_SIZE)])
+    print(f"{'operation':<32}{'rows':>10}{'bisect (ms)':>14}{'table (ms)':>13}{'speedup':>10}")
+    for description, operation in cases(adrs):
+        decode_table.disable_decode_table()
+        t_bisect = best_of(operation) * 1000
+        decode_table.enable_decode_table()
+        decode_table.table()
+        t_table = best_of(operation) * 1000
+        print(f"{description:<32}{len(adrs):>10}{t_bisect:>14.1f}{t_table:>13.1f}{t_bisect / t_table:>9.2f}x")
+    decode_table.disable_decode_table()
+
+    t_build = best_of(decode_table.built_table) * 1000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "decode.cdcf")
+        decode_table.write_decode_table(path)
+        start = time.perf_counter()
+        decode_table.enable_decode_table(path)
+        t_map = (time.perf_counter() - start) * 1000
+        decode_table.disable_decode_table()
+    print(f"\nbuilding the table: {t_build:.1f} ms; mapping it from a file: {t_map:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
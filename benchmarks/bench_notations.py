@@ -0,0 +1,65 @@
+"""
+Notation benchmarks.
+
+Times rendering every date of a sample in Grand Cycle Notation, Common Symbolic Notation and colloquially, and
+then rendering the same dates in GCN and CSN three times over, as templates showing each date several times do,
+with and without notation memoization (see CalmarendianDate.enable_notation_memo).
+
+Run from the repository root:
+    python -m benchmarks.bench_notations
+"""
+
+import random
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+SAMPLE_SIZE = 100_000
+
+
+def cases(sample_size: int = SAMPLE_SIZE) -> List[Tuple[str, Callable[[], object]]]:
+    """
+    Return (description, operation) pairs for each benchmarked operation.
+    """
+    rng = random.Random(777)
+    dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR)) for _ in range(sample_size)]
+    for d in dates:
+        d.date_elements()
+
+    def repeated() -> None:
+        for d in dates:
+            for _ in range(3):
+                d.grand_cycle_notation()
+                d.common_symbolic_notation("CE")
+
+    def memoized_repeated() -> None:
+        # A new memo forgets the notations memoized by any previous run, so the first rendering of each is timed too.
+        CalmarendianDate.enable_notation_memo()
+        try:
+            for d in dates:
+                for _ in range(3):
+                    d.grand_cycle_notation()
+                    d.common_symbolic_notation("CE")
+        finally:
+            CalmarendianDate.disable_notation_memo()
+
+    return [
+        ("GCN", lambda: [d.grand_cycle_notation() for d in dates]),
+        ("CSN", lambda: [d.common_symbolic_notation() for d in dates]),
+        ("colloquial", lambda: [d.colloquial_date() for d in dates]),
+        ("colloquial, verbose", lambda: [d.colloquial_date(era_marker="CE", verbose=True) for d in dates]),
+        ("3 x GCN + CSN", repeated),
+        ("3 x GCN + CSN, memo", memoized_repeated),
+    ]
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'time (ms)':>12}")
+    for description, operation in cases():
+        print(f"{description:<24}{best_of(operation) * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Date range benchmarks.
+
+Compares CalmarendianDate.range, which carries each date's elements forward from the previous date's, with creating
+a CalmarendianDate for each ADR in turn, which decodes every date from scratch.
+Both sides touch every date's elements, as a day-by-day simulation would.
+
+Run from the repository root:
+    python -m benchmarks.bench_range
+"""
+
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+# A little over forty cycles, crossing the turn of Grand Cycles 1 and 2.
+FIRST_ADR = CDateConfig.DAYS_per_GRAND_CYCLE - 50_000
+LAST_ADR = CDateConfig.DAYS_per_GRAND_CYCLE + 50_000
+
+
+def cases() -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    """
+    Return (description, previous way, current way) triples for each benchmarked operation.
+    """
+    return [
+        ("daily, forwards",
+         lambda: [CalmarendianDate(adr).date_elements() for adr in range(FIRST_ADR, LAST_ADR)],
+         lambda: [d.date_elements() for d in CalmarendianDate.range(FIRST_ADR, LAST_ADR)]),
+        ("daily, backwards",
+         lambda: [CalmarendianDate(adr).date_elements() for adr in range(LAST_ADR, FIRST_ADR, -1)],
+         lambda: [d.date_elements() for d in CalmarendianDate.range(LAST_ADR, FIRST_ADR, -1)]),
+        ("weekly",
+         lambda: [CalmarendianDate(adr).date_elements() for adr in range(FIRST_ADR, LAST_ADR, 7)],
+         lambda: [d.date_elements() for d in CalmarendianDate.range(FIRST_ADR, LAST_ADR, 7)]),
+    ]
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'previous (ms)':>16}{'current (ms)':>16}{'speedup':>10}")
+    for description, previous, current in cases():
+        t_previous = best_of(previous) * 1000
+        t_current = best_of(current) * 1000
+        print(f"{description:<24}{t_previous:>16.2f}{t_current:>16.2f}{t_previous / t_current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+strftime benchmarks.
+
+Compares CalmarendianDate.strftime, which compiles each format string once and caches the result, with compiling
+the format string afresh for every date, and with the equivalent hand-written f-strings.
+
+Run from the repository root:
+    python -m benchmarks.bench_strftime
+"""
+
+import random
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.date_format import compiled_format
+
+SAMPLE_SIZE = 50_000
+
+FORMATS = [
+    ("GCN", "%G-%c-%m-%W-%d",
+     lambda d: f"{d.grand_cycle.number:02}-{d.cycle.number:03}-{d.season.number}-{d.week.number:02}-{d.day.number}"),
+    ("report", "%A, Week %W of %B %Y %E",
+     lambda d: f"{d.day.name()}, Week {d.week.number:02} of {d.season.name()} "
+               f"{d.absolute_cycle_ref()[0]:03} {d.absolute_cycle_ref()[1].name}"),
+]
+
+
+def uncached_strftime(date: CalmarendianDate, format_string: str) -> str:
+    template, functions = compiled_format(format_string)
+    elements = date.date_elements()
+    return template.format(*[function(date, elements) for function in functions])
+
+
+def cases(sample_size: int = SAMPLE_SIZE) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    """
+    Return (description, baseline, strftime) triples for each benchmarked format.
+    """
+    rng = random.Random(777)
+    dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR)) for _ in range(sample_size)]
+    for d in dates:
+        d.date_elements()
+
+    triples = []
+    for name, format_string, by_hand in FORMATS:
+        current = (lambda f: lambda: [d.strftime(f) for d in dates])(format_string)
+        triples.append((f"{name} uncached", (lambda f: lambda: [uncached_strftime(d, f) for d in dates])(format_string),
+                        current))
+        triples.append((f"{name} f-string", (lambda f: lambda: [f(d) for d in dates])(by_hand), current))
+    return triples
+
+
+def main() -> None:
+    print(f"{'format':<24}{'baseline (ms)':>16}{'strftime (ms)':>16}{'speedup':>10}")
+    for description, baseline, current in cases():
+        t_baseline = best_of(baseline) * 1000
+        t_current = best_of(current) * 1000
+        print(f"{description:<24}{t_baseline:>16.2f}{t_current:>16.2f}{t_baseline / t_current:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
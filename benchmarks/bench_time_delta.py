@@ -0,0 +1,58 @@
+"""
+Time delta benchmarks.
+
+Compares CalmarendianTimeDelta, which holds a single integer count of microseconds, with the standard library's
+datetime.timedelta (implemented in C) on the same operations.
+
+Run from the repository root:
+    python -m benchmarks.bench_time_delta
+"""
+
+import random
+from datetime import timedelta
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_of
+from npm_calmarendian_date import CalmarendianTimeDelta
+
+SAMPLE_SIZE = 100_000
+
+
+def cases(sample_size: int = SAMPLE_SIZE) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    """
+    Return (description, timedelta way, CalmarendianTimeDelta way) triples for each benchmarked operation.
+    """
+    rng = random.Random(777)
+    values = [(rng.randint(-10_000, 10_000), rng.randint(0, 65_535), rng.randint(0, 999_999))
+              for _ in range(sample_size)]
+    gregorian = [timedelta(days=d, seconds=s, microseconds=us) for d, s, us in values]
+    calmarendian = [CalmarendianTimeDelta(days=d, seconds=s, microseconds=us) for d, s, us in values]
+    g_hour, c_hour = timedelta(hours=1), CalmarendianTimeDelta(hours=1)
+
+    return [
+        ("construct (int)",
+         lambda: [timedelta(days=d, seconds=s, microseconds=us) for d, s, us in values],
+         lambda: [CalmarendianTimeDelta(days=d, seconds=s, microseconds=us) for d, s, us in values]),
+        ("construct (float)",
+         lambda: [timedelta(seconds=s + 0.25) for _, s, _ in values],
+         lambda: [CalmarendianTimeDelta(seconds=s + 0.25) for _, s, _ in values]),
+        ("a + b", lambda: [a + g_hour for a in gregorian], lambda: [a + c_hour for a in calmarendian]),
+        ("a * int", lambda: [a * 3 for a in gregorian], lambda: [a * 3 for a in calmarendian]),
+        ("a * float", lambda: [a * 1.5 for a in gregorian], lambda: [a * 1.5 for a in calmarendian]),
+        ("a // b", lambda: [a // g_hour for a in gregorian], lambda: [a // c_hour for a in calmarendian]),
+        ("a % b", lambda: [a % g_hour for a in gregorian], lambda: [a % c_hour for a in calmarendian]),
+        ("sorted()", lambda: sorted(gregorian), lambda: sorted(calmarendian)),
+        ("set()", lambda: set(gregorian), lambda: set(calmarendian)),
+    ]
+
+
+def main() -> None:
+    print(f"{'operation':<24}{'timedelta (ms)':>16}{'Calmarendian (ms)':>20}{'ratio':>10}")
+    for description, gregorian, calmarendian in cases():
+        t_gregorian = best_of(gregorian) * 1000
+        t_calmarendian = best_of(calmarendian) * 1000
+        print(f"{description:<24}{t_gregorian:>16.2f}{t_calmarendian:>20.2f}{t_calmarendian / t_gregorian:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
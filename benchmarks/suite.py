@@ -0,0 +1,351 @@
+"""
+Benchmark suite with stored baselines.
+
+Times every core operation of the package - construction from ADRs and from numbers, parsing GCN and CSN date
+strings (with and without era markers), decoding elements across grand cycles 0 to 99, every notation formatter,
+comparisons and sorting - over a fixed random sample of dates, and measures the peak memory each one allocates.
+The results, with metadata describing the machine they were measured on, can be written as JSON and compared with
+a baseline: any operation whose time (or peak memory) per row has grown by more than the threshold is reported as
+a regression and the suite exits with status 1.
+
+Times are compared after dividing each by the time of a fixed pure-Python calibration workload measured in the same
+run, so that a baseline recorded on one machine remains a fair yardstick on another of a different speed. Even so,
+compare against a baseline recorded on the same machine where possible, and on a busy machine raise --repeat (or
+--threshold). Operations which appear to have regressed are timed a second time before they are reported.
+Uses the standard library only (timeit and tracemalloc); NumPy, if installed, is not used.
+
+Run from the repository root:
+    python -m benchmarks.suite                        compare with benchmarks/baseline.json
+    python -m benchmarks.suite --output results.json  also write the results
+    python -m benchmarks.suite --update-baseline      record a new baseline
+    python -m benchmarks.suite --filter parse.        run only the operations whose names contain 'parse.'
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Collection, Dict, List, NamedTuple, Optional
+
+from npm_calmarendian_date import CalmarendianDate, CalmarendianDateArray
+from npm_calmarendian_date import bulk, decode_table
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+RESULTS_FORMAT = 1
+SAMPLE_SIZE = 20_000
+REPEATS = 15
+DEFAULT_THRESHOLD = 0.35
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# The last date which can be written in Common Symbolic Notation.
+LAST_CSN_DATE = "9999-7-51-4"
+
+
+class Operation(NamedTuple):
+    """
+    A benchmarked operation: a call which processes the given number of rows (dates or date strings), optionally
+    with the decode table (see npm_calmarendian_date.decode_table) enabled.
+    """
+    name: str
+    rows: int
+    run: Callable[[], object]
+    uses_decode_table: bool = False
+
+
+class Sample(NamedTuple):
+    """
+    The inputs shared by the benchmarked operations.
+    """
+    adrs: List[int]
+    grand_cycle_adrs: List[int]
+    numbers: List[tuple]
+    gcn_strings: List[str]
+    csn_strings: List[str]
+    csn_era_strings: List[str]
+    dates: List[CalmarendianDate]
+
+
+def sample(sample_size: int = SAMPLE_SIZE) -> Sample:
+    """
+    Return the same random sample of inputs on every run.
+    """
+    rng = random.Random(777)
+    adrs = [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(sample_size)]
+    # Equal numbers of dates in each of grand cycles 0 to 99.
+    days = CDateConfig.DAYS_per_GRAND_CYCLE
+    grand_cycle_adrs = []
+    for i in range(sample_size):
+        grand_cycle = i % 100
+        grand_cycle_adrs.append(rng.randint((grand_cycle - 1) * days + 1, grand_cycle * days))
+    last_csn_adr = CalmarendianDate.from_date_string(LAST_CSN_DATE).adr
+    csn_dates = [CalmarendianDate(rng.randint(CDateConfig.MIN_ADR, last_csn_adr)) for _ in range(sample_size)]
+    dates = [CalmarendianDate(adr) for adr in adrs]
+    for date in dates:
+        date.date_elements()
+    return Sample(
+        adrs=adrs,
+        grand_cycle_adrs=grand_cycle_adrs,
+        numbers=[CalmarendianDate.numbers_from_adr(adr) for adr in adrs],
+        gcn_strings=[date.gcn() for date in dates],
+        csn_strings=[date.csn() for date in csn_dates],
+        csn_era_strings=[date.common_symbolic_notation("CE") for date in csn_dates],
+        dates=dates
+    )
+
+
+def operations(s: Sample) -> List[Operation]:
+    """
+    Return the benchmarked operations, each of which processes the whole of (one column of) the sample.
+    """
+    n = len(s.adrs)
+    dates = s.dates
+    shuffled = dates[::-1]
+    date_array = CalmarendianDateArray.from_adrs(s.adrs)
+    from_date_string = CalmarendianDate.from_date_string
+    from_numbers = CalmarendianDate.from_numbers
+
+    def elements_from_adr():
+        return [CalmarendianDate(adr).elements_from_adr() for adr in s.grand_cycle_adrs]
+
+    def sort_date_array():
+        copy = date_array[:]
+        copy.sort()
+        return copy
+
+    return [
+        Operation("construct.adr", n, lambda: [CalmarendianDate(adr) for adr in s.adrs]),
+        Operation("construct.from_numbers", n, lambda: [from_numbers(*numbers) for numbers in s.numbers]),
+        Operation("parse.gcn", n, lambda: [from_date_string(text) for text in s.gcn_strings]),
+        Operation("parse.csn", n, lambda: [from_date_string(text) for text in s.csn_strings]),
+        Operation("parse.csn_era_marker", n, lambda: [from_date_string(text) for text in s.csn_era_strings]),
+        Operation("parse.parse_many", n, lambda: CalmarendianDate.parse_many(s.gcn_strings)),
+        Operation("decode.elements_from_adr", n, elements_from_adr),
+        Operation("decode.elements_from_adr_table", n, elements_from_adr, uses_decode_table=True),
+        Operation("decode.numbers_from_adrs", n, lambda: bulk.numbers_from_adrs(s.grand_cycle_adrs)),
+        Operation("format.gcn", n, lambda: [date.grand_cycle_notation() for date in dates]),
+        Operation("format.csn", n, lambda: [date.common_symbolic_notation() for date in dates]),
+        Operation("format.csn_bh", n, lambda: [date.common_symbolic_notation("BH") for date in dates]),
+        Operation("format.csn_ce", n, lambda: [date.common_symbolic_notation("CE") for date in dates]),
+        Operation("format.colloquial", n, lambda: [date.colloquial_date() for date in dates]),
+        Operation("format.colloquial_verbose", n, lambda: [date.colloquial_date(verbose=True) for date in dates]),
+        Operation("format.colloquial_ce", n, lambda: [date.colloquial_date(era_marker="CE") for date in dates]),
+        Operation("format.strftime", n, lambda: [date.strftime("%A, Week %W of %B %Y %E") for date in dates]),
+        Operation("format.str", n, lambda: [str(date) for date in dates]),
+        Operation("format.bulk_gcn", n, lambda: bulk.grand_cycle_notations(s.adrs)),
+        Operation("format.bulk_csn", n, lambda: bulk.common_symbolic_notations(s.adrs, "CE")),
+        Operation("format.bulk_colloquial", n, lambda: bulk.colloquial_dates(s.adrs, verbose=True)),
+        Operation("compare.eq", n, lambda: [a == b for a, b in zip(dates, shuffled)]),
+        Operation("compare.lt", n, lambda: [a < b for a, b in zip(dates, shuffled)]),
+        Operation("compare.le", n, lambda: [a <= b for a, b in zip(dates, shuffled)]),
+        Operation("compare.hash", n, lambda: set(dates)),
+        Operation("sort.dates", n, lambda: sorted(dates)),
+        Operation("sort.date_array", n, sort_date_array),
+    ]
+
+
+def calibration_time(repeat: int = REPEATS) -> float:
+    """
+    Return the best time, in seconds, of a fixed pure-Python workload against which the operations' times are
+    normalized when they are compared with a baseline.
+    """
+    def workload():
+        total = 0
+        for i in range(200_000):
+            q, r = divmod(i, 7)
+            total += q if r else -q
+        return total
+    return min(timeit.repeat(workload, number=1, repeat=repeat))
+
+
+def peak_memory(run: Callable[[], object]) -> int:
+    """
+    Return the peak number of bytes allocated by a single call of run (including those of its result).
+    """
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def metadata() -> Dict[str, object]:
+    """
+    Return a description of the machine, interpreter and source tree the benchmarks are being run on.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": revision,
+    }
+
+
+def run_suite(
+        name_filter: str = "",
+        sample_size: int = SAMPLE_SIZE,
+        repeat: int = REPEATS,
+        names: Optional[Collection[str]] = None
+) -> Dict[str, object]:
+    """
+    Run the benchmarks whose names contain name_filter (and, if names is given, are among names) and return the
+    results, ready to be written as JSON. Each operation's time is the best of repeat runs; the calibration workload
+    is timed both before and after the operations so that its best time reflects the same conditions as theirs.
+    """
+    calibration = calibration_time(repeat)
+    results = {}
+    for operation in operations(sample(sample_size)):
+        if name_filter not in operation.name or (names is not None and operation.name not in names):
+            continue
+        if operation.uses_decode_table:
+            # Build the table before timing starts.
+            decode_table.enable_decode_table()
+            decode_table.table()
+        try:
+            seconds = min(timeit.repeat(operation.run, number=1, repeat=repeat))
+            peak_bytes = peak_memory(operation.run)
+        finally:
+            decode_table.disable_decode_table()
+        results[operation.name] = {
+            "rows": operation.rows,
+            "seconds_per_row": seconds / operation.rows,
+            "peak_bytes_per_row": peak_bytes / operation.rows,
+        }
+        print(f"{operation.name:<34}{seconds / operation.rows * 1e9:>12.0f} ns/row", file=sys.stderr)
+    return {
+        "format": RESULTS_FORMAT,
+        "metadata": metadata(),
+        "calibration_seconds": min(calibration, calibration_time(repeat)),
+        "results": results,
+    }
+
+
+class Comparison(NamedTuple):
+    """
+    The result of comparing one operation with its baseline. The ratios are current / baseline: above one is worse.
+    """
+    name: str
+    time_ratio: Optional[float]
+    memory_ratio: Optional[float]
+    regressed: bool
+
+
+def compared(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[Comparison]:
+    """
+    Compare each operation in the current results with the baseline, normalizing the times by the calibration
+    times of the two runs. An operation has regressed if either ratio exceeds 1 + threshold.
+    Operations missing from the baseline are reported with ratios of None.
+    """
+    speed = baseline["calibration_seconds"] / current["calibration_seconds"]
+    comparisons = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            comparisons.append(Comparison(name, None, None, False))
+            continue
+        time_ratio = result["seconds_per_row"] * speed / base["seconds_per_row"]
+        memory_ratio = result["peak_bytes_per_row"] / base["peak_bytes_per_row"] if base["peak_bytes_per_row"] else 1.0
+        regressed = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        comparisons.append(Comparison(name, time_ratio, memory_ratio, regressed))
+    return comparisons
+
+
+def report(comparisons: List[Comparison], current: Dict[str, object], baseline: Dict[str, object]) -> None:
+    """
+    Print the comparison of the current results with the baseline.
+    """
+    if current["metadata"].get("platform") != baseline["metadata"].get("platform"):
+        print(f"NOTE: the baseline was recorded on {baseline['metadata'].get('platform')}; times are compared "
+              f"after normalizing by the calibration workload.")
+    print(f"{'operation':<34}{'ns/row':>10}{'time':>10}{'memory':>10}")
+    for comparison in comparisons:
+        ns = current["results"][comparison.name]["seconds_per_row"] * 1e9
+        if comparison.time_ratio is None:
+            print(f"{comparison.name:<34}{ns:>10.0f}{'new':>10}{'new':>10}")
+            continue
+        flag = "  REGRESSION" if comparison.regressed else ""
+        print(f"{comparison.name:<34}{ns:>10.0f}{comparison.time_ratio:>9.2f}x{comparison.memory_ratio:>9.2f}x{flag}")
+
+
+def written(results: Dict[str, object], path: str) -> None:
+    """
+    Write benchmark results to a JSON file.
+    """
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Run the benchmark suite and compare the results with a baseline."
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="the baseline JSON file (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="the fractional slowdown (or memory growth) counted as a regression (default: %(default)s)"
+    )
+    parser.add_argument("--filter", default="", help="run only the operations whose names contain this text")
+    parser.add_argument("--sample-size", type=int, default=SAMPLE_SIZE, help="rows per operation")
+    parser.add_argument("--repeat", type=int, default=REPEATS, help="runs of each operation, of which the best counts")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.filter, args.sample_size, args.repeat)
+    if args.update_baseline:
+        written(current, args.baseline)
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+    if not os.path.exists(args.baseline):
+        if args.output:
+            written(current, args.output)
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("format") != RESULTS_FORMAT:
+        print(f"The baseline at {args.baseline} is of an unsupported format.")
+        return 2
+
+    comparisons = compared(current, baseline, args.threshold)
+    suspects = [comparison.name for comparison in comparisons if comparison.regressed]
+    if suspects:
+        # A burst of activity elsewhere on the machine is far more common than a genuine regression,
+        # so time the suspects again and keep their better times before reporting them.
+        retimed = run_suite(sample_size=args.sample_size, repeat=args.repeat, names=suspects)
+        for name, result in retimed["results"].items():
+            if result["seconds_per_row"] < current["results"][name]["seconds_per_row"]:
+                current["results"][name] = result
+        current["calibration_seconds"] = min(current["calibration_seconds"], retimed["calibration_seconds"])
+        comparisons = compared(current, baseline, args.threshold)
+    if args.output:
+        written(current, args.output)
+    report(comparisons, current, baseline)
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} operation(s) regressed by more than {args.threshold:.0%}:", ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Timing helpers shared by the benchmark scripts.
+"""
+
+import timeit
+from typing import Callable
+
+REPEATS = 5
+
+
+def best_of(statement: Callable[[], object], number: int = 1, repeat: int = REPEATS) -> float:
+    """
+    Return the best time, in seconds per call, of several runs of the given statement.
+    """
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
@@ -1,2 +1,3 @@
 from .calmarendian_date import CalmarendianDate
 from .time_delta import CalmarendianTimeDelta
+from .date_array import CalmarendianDateArray
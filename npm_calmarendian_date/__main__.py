@@ -0,0 +1,79 @@
+"""
+Command-line date converter.
+
+Reads dates, one per line, from the named files (or standard input) and writes them, converted to another
+notation, to standard output. For example:
+    python -m npm_calmarendian_date --to colloquial dates.txt
+    python -m npm_calmarendian_date --to adr --errors annotate < dates.txt
+"""
+
+import argparse
+import fileinput
+import sys
+from typing import List, Optional
+
+from npm_calmarendian_date.converter import Conversion, ErrorPolicy, Notation, converted_chunks, DEFAULT_CHUNK_SIZE
+from npm_calmarendian_date.exceptions import CalmarendianDateError
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m npm_calmarendian_date",
+        description="Convert dates, one per line, between Calmarendian date notations."
+    )
+    parser.add_argument(
+        "files", nargs="*", metavar="FILE",
+        help="files to read; standard input if none are given or FILE is -"
+    )
+    parser.add_argument(
+        "--from", dest="source", choices=["auto", "adr", "arr", "string"], default="auto",
+        help="input notation: absolute day references, apocalypse reckoning references or GCN/CSN date strings;"
+             " auto (the default) takes integers to be ADRs and anything else to be a date string"
+    )
+    parser.add_argument(
+        "--to", dest="target", choices=[n.value for n in Notation], default=Notation.CSN.value,
+        help="output notation (default: csn)"
+    )
+    parser.add_argument(
+        "--era-marker", type=str.upper, choices=["BH", "CE"], help="era markers to include in csn or colloquial output"
+    )
+    parser.add_argument("--verbose", action="store_true", help="verbose colloquial output")
+    parser.add_argument(
+        "--errors", choices=[p.value for p in ErrorPolicy], default=ErrorPolicy.STRICT.value,
+        help="on an invalid line: stop (strict, the default), leave it out (skip)"
+             " or copy it to the output with the error message (annotate)"
+    )
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: the number of CPUs)")
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"number of lines given to a worker at a time (default: {DEFAULT_CHUNK_SIZE})"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = argument_parser().parse_args(argv)
+    source = {"auto": None, "adr": Notation.ADR, "arr": Notation.ARR, "string": Notation.GCN}[args.source]
+    conversion = Conversion(
+        target=Notation(args.target),
+        source=source,
+        era_marker=args.era_marker,
+        verbose=args.verbose,
+        errors=ErrorPolicy(args.errors)
+    )
+    out = sys.stdout
+    try:
+        with fileinput.input(args.files) as lines:
+            for chunk in converted_chunks(lines, conversion, workers=args.workers, chunk_size=args.chunk_size):
+                if chunk:
+                    out.write("\n".join(chunk))
+                    out.write("\n")
+    except (CalmarendianDateError, OSError) as e:
+        out.flush()
+        print(f"{argument_parser().prog}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""
+Bulk Date Operations
+
+Functions which work on whole columns of dates at a time, represented by their absolute day references (ADRs)
+held in compact integer arrays rather than as individual CalmarendianDate objects.
+Building, and later discarding, a Python object for every row is by far the largest cost of handling dates in bulk
+so these functions never do so: they apply the same rules as CalmarendianDate and the date element classes
+directly to the numbers.
+
+NumPy is optional. Where it is installed, results can be returned as NumPy arrays, and NumPy arrays are processed
+with vectorized NumPy operations; without it, results are returned as standard library array('l') objects.
+"""
+
+import warnings
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from npm_calmarendian_date import decode_table
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day, CYCLE_DAYS_PRIOR
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError
+from npm_calmarendian_date.string_conversions import DateString
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The typecode of the integer arrays in which ADRs are held: a C long is at least 32 bits, which comfortably
+# covers the range CDateConfig.MIN_ADR to CDateConfig.MAX_ADR.
+ADR_TYPECODE = 'l'
+
+# FESTIVAL_DAYS[c] is the number of festival days in cycle c (index 0 is unused).
+FESTIVAL_DAYS = tuple(CycleInGrandCycle.festival_days_in_cycle(c) for c in range(701))
+
+# The cycle boundaries of date_elements.CYCLE_DAYS_PRIOR as a NumPy array.
+NUMPY_CYCLE_DAYS_PRIOR = None if numpy is None else numpy.array(CYCLE_DAYS_PRIOR, dtype=numpy.int64)
+
+# The length of the shortest cycle (one with four festival days).
+SHORTEST_CYCLE_DAYS = min(CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1] for c in range(1, 701))
+
+
+def require_numpy() -> None:
+    """
+    Raise an ImportError if NumPy, which is an optional dependency, is not installed.
+    """
+    if numpy is None:
+        raise ImportError("NUMPY: This operation requires NumPy, which is not installed.")
+
+
+def adr_from_numbers(gc: int, c: int, s: int, w: int, d: int) -> int:
+    """
+    Return the absolute day reference of the date with the given grand cycle notation elements.
+    This is the arithmetic of CalmarendianDate.from_numbers without the objects: valid elements are checked against
+    the same rules as the date element classes; anything else is handed to those classes so that invalid elements
+    raise exactly the errors CalmarendianDate.from_numbers would.
+    :param gc: Numeric representation of the grand_cycle number.
+    :param c: Numeric representation of the cycle_in_grand_cycle number.
+    :param s: Numeric representation of the season number.
+    :param w: Numeric representation of the week number.
+    :param d: Numeric representation of the day number.
+    :return: An absolute day reference.
+    """
+    if (
+            0 <= gc <= 99 and 1 <= c <= 700 and 1 <= s <= 7 and 1 <= w <= (51 if s == 7 else 50)
+            and 1 <= d <= (FESTIVAL_DAYS[c] if w == 51 else 7)
+    ):
+        return (gc - 1) * CDateConfig.DAYS_per_GRAND_CYCLE + CYCLE_DAYS_PRIOR[c - 1] + (s - 1) * 350 + (w - 1) * 7 + d
+    grand_cycle = GrandCycle.interned(gc)
+    cycle = CycleInGrandCycle.interned(c)
+    season = Season.interned(s)
+    week = Week.interned(w, season)
+    day = Day.interned(d, week, cycle)
+    return grand_cycle.days_prior() + cycle.days_prior() + season.days_prior() + week.days_prior() + day.number
+
+
+def parse_many(date_strings: Iterable[str], *, as_numpy: bool = False):
+    """
+    Return the absolute day references of the dates represented by the given GCN or CSN date strings.
+    Each date string is parsed by the same rules as CalmarendianDate.from_date_string, issuing the same warnings
+    and raising the same exceptions, but no CalmarendianDate (or DateString) object is created.
+    :param date_strings: An iterable of date strings in either Grand Cycle Notation or Common Symbolic Notation.
+    :param as_numpy: If True, return a NumPy array (which requires NumPy to be installed).
+    :return: An array('l') of ADRs or, if requested, a NumPy array sharing its memory.
+    """
+    if as_numpy:
+        require_numpy()
+    adrs = array(ADR_TYPECODE)
+    append = adrs.append
+    parsed = DateString.parsed
+    for date_string in date_strings:
+        numbers, warning = parsed(date_string)
+        if warning:
+            warnings.warn(warning, category=UserWarning, stacklevel=2)
+        append(adr_from_numbers(*numbers))
+    if as_numpy:
+        return numpy.asarray(adrs)
+    return adrs
+
+
+def numbers_from_adrs(adrs) -> Tuple:
+    """
+    Return the grand cycle notation elements of each of the given absolute day references as five parallel arrays:
+    grand cycles, cycles, seasons, weeks and days. This is the column-wise equivalent of
+    CalmarendianDate.numbers_from_adr, applying the same cycle boundaries (and so the same festival rules).
+
+    A NumPy array of ADRs is decoded with vectorized NumPy operations and the elements are returned as NumPy int64
+    arrays. Any other iterable of ADRs is decoded in pure Python and the elements are returned as array('l')
+    objects. Either way, the decode table is used if it has been enabled (see decode_table).
+    :param adrs: Absolute day references, all of which must lie between CDateConfig.MIN_ADR and CDateConfig.MAX_ADR.
+    :return: A five-tuple of arrays.
+    """
+    if numpy is not None and isinstance(adrs, numpy.ndarray):
+        return _numpy_numbers_from_adrs(adrs)
+    if decode_table.enabled:
+        return _table_numbers_from_adrs(adrs)
+
+    columns = tuple(array(ADR_TYPECODE) for _ in range(5))
+    appenders = tuple(column.append for column in columns)
+    append_gc, append_c, append_s, append_w, append_d = appenders
+    for grand_cycle, cycle, residue in _iter_cycle_days(adrs):
+        season, residue = divmod(residue, 350)
+        if season > 6:
+            season, residue = 6, residue + 350
+        week = residue // 7
+        if week > 50:
+            week = 50
+        append_gc(grand_cycle)
+        append_c(cycle)
+        append_s(season + 1)
+        append_w(week + 1)
+        append_d(residue - week * 7 + 1)
+    return columns
+
+
+def _table_numbers_from_adrs(adrs) -> Tuple:
+    """
+    Return the grand cycle notation elements of the given absolute day references as five array('l') objects,
+    looking each of them up in the decode table.
+    """
+    columns = tuple(array(ADR_TYPECODE) for _ in range(5))
+    append_gc, append_c, append_s, append_w, append_d = (column.append for column in columns)
+    min_adr, max_adr = CDateConfig.MIN_ADR, CDateConfig.MAX_ADR
+    days_per_grand_cycle = CDateConfig.DAYS_per_GRAND_CYCLE
+    table = decode_table.table()
+    cycle_shift, season_shift, week_shift = decode_table.CYCLE_SHIFT, decode_table.SEASON_SHIFT, decode_table.WEEK_SHIFT
+    season_mask, week_mask, day_mask = decode_table.SEASON_MASK, decode_table.WEEK_MASK, decode_table.DAY_MASK
+    for adr in adrs:
+        if not min_adr <= adr <= max_adr:
+            raise CalmarendianDateDomainError(f"ADR: {adr} is out of range.")
+        grand_cycle, residue = divmod(adr - 1, days_per_grand_cycle)
+        value = table[residue]
+        append_gc(grand_cycle + 1)
+        append_c(value >> cycle_shift)
+        append_s((value >> season_shift) & season_mask)
+        append_w((value >> week_shift) & week_mask)
+        append_d(value & day_mask)
+    return columns
+
+
+def _numpy_numbers_from_adrs(adrs) -> Tuple:
+    """
+    Return the grand cycle notation elements of a NumPy array of absolute day references as five NumPy arrays.
+    """
+    if decode_table.enabled:
+        return _numpy_table_numbers_from_adrs(adrs)
+    grand_cycle, cycle, residue = _numpy_cycle_days(adrs)
+    season, residue = numpy.divmod(residue, 350)
+    # The festival days at the end of the cycle belong to season 7...
+    festival = season > 6
+    season[festival] = 6
+    residue[festival] += 350
+    # ...and to week 51.
+    week = numpy.minimum(residue // 7, 50)
+    return grand_cycle, cycle, season + 1, week + 1, residue - week * 7 + 1
+
+
+def _numpy_table_numbers_from_adrs(adrs) -> Tuple:
+    """
+    Return the grand cycle notation elements of a NumPy array of absolute day references as five NumPy arrays,
+    gathering them from the decode table.
+    """
+    adrs = _numpy_verified_adrs(adrs)
+    grand_cycle, residue = numpy.divmod(adrs - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
+    values = numpy.frombuffer(decode_table.table(), dtype=numpy.uint32)[residue].astype(numpy.int64)
+    return (
+        grand_cycle + 1,
+        values >> decode_table.CYCLE_SHIFT,
+        (values >> decode_table.SEASON_SHIFT) & decode_table.SEASON_MASK,
+        (values >> decode_table.WEEK_SHIFT) & decode_table.WEEK_MASK,
+        values & decode_table.DAY_MASK
+    )
+
+
+def _numpy_verified_adrs(adrs):
+    """
+    Return the given absolute day references as a NumPy int64 array; raise an exception if any is out of range.
+    """
+    adrs = numpy.asarray(adrs, dtype=numpy.int64)
+    out_of_range = (adrs < CDateConfig.MIN_ADR) | (adrs > CDateConfig.MAX_ADR)
+    if out_of_range.any():
+        raise CalmarendianDateDomainError(f"ADR: {adrs[out_of_range][0]} is out of range.")
+    return adrs
+
+
+def _numpy_cycle_days(adrs) -> Tuple:
+    """
+    Return the grand cycle and cycle numbers of a NumPy array of absolute day references, and the (zero-based)
+    number of days elapsed in the cycle before each date, as three NumPy arrays.
+    """
+    adrs = _numpy_verified_adrs(adrs)
+    grand_cycle, residue = numpy.divmod(adrs - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
+    # No cycle is shorter than SHORTEST_CYCLE_DAYS so dividing by it overestimates the cycle number; the extra
+    # festival days accumulated over a whole grand cycle amount to less than one cycle so it is out by one at most.
+    # This is much faster than bisecting the cycle boundaries with numpy.searchsorted.
+    cycle = residue // SHORTEST_CYCLE_DAYS + 1
+    cycle -= NUMPY_CYCLE_DAYS_PRIOR[cycle - 1] > residue
+    return grand_cycle + 1, cycle, residue - NUMPY_CYCLE_DAYS_PRIOR[cycle - 1]
+
+
+def _cycle_days(adrs) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Return the grand cycle and cycle numbers of the given absolute day references, and the (zero-based) number of
+    days elapsed in the cycle before each date, as three lists.
+    """
+    if numpy is not None and isinstance(adrs, numpy.ndarray):
+        return tuple(column.tolist() for column in _numpy_cycle_days(adrs))
+
+    grand_cycles, cycles, residues = [], [], []
+    for grand_cycle, cycle, residue in _iter_cycle_days(adrs):
+        grand_cycles.append(grand_cycle)
+        cycles.append(cycle)
+        residues.append(residue)
+    return grand_cycles, cycles, residues
+
+
+def _iter_cycle_days(adrs) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield the grand cycle and cycle numbers of each of the given absolute day references, and the (zero-based)
+    number of days elapsed in the cycle before it, raising an exception for any ADR which is out of range.
+    """
+    min_adr, max_adr = CDateConfig.MIN_ADR, CDateConfig.MAX_ADR
+    days_per_grand_cycle = CDateConfig.DAYS_per_GRAND_CYCLE
+    for adr in adrs:
+        if not min_adr <= adr <= max_adr:
+            raise CalmarendianDateDomainError(f"ADR: {adr} is out of range.")
+        grand_cycle, residue = divmod(adr - 1, days_per_grand_cycle)
+        cycle = bisect_right(CYCLE_DAYS_PRIOR, residue)
+        yield grand_cycle + 1, cycle, residue - CYCLE_DAYS_PRIOR[cycle - 1]
+
+
+def _day_in_cycle_tables() -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return, for each day of the longest cycle, the parts of its date strings which are determined by its position
+    within the cycle alone: the season-week-day part of its GCN and CSN date strings, and the part of its colloquial
+    date string which precedes the cycle number in both its terse and verbose forms.
+    """
+    # Decode every day of a cycle with eight festival days, the 700th of Grand Cycle 1.
+    start = CYCLE_DAYS_PRIOR[699] + 1
+    _, _, seasons, weeks, days = numbers_from_adrs(range(start, start + CYCLE_DAYS_PRIOR[700] - CYCLE_DAYS_PRIOR[699]))
+    notation, terse, verbose = [], [], []
+    for s, w, d in zip(seasons, weeks, days):
+        notation.append(f"{s}-{w:>02}-{d}")
+        if w == 51:
+            terse.append(f"Festival {d} of")
+            verbose.append(f"Festival {Day.LONG_NUMBERS[d - 1]} of")
+        else:
+            season_name = Season.SEASON_NAMES[s - 1]
+            terse.append(f"{Day.DAY_NAMES[d - 1]}, Week {w} of {season_name}")
+            verbose.append(f"{Day.DAY_NAMES[d - 1]} of Week {w} of {season_name}")
+    return tuple(notation), tuple(terse), tuple(verbose)
+
+
+# The fixed-width grand cycle and cycle fields of GCN date strings, each with its trailing dash.
+GCN_GRAND_CYCLE_FIELDS = tuple(f"{gc:>02}-" for gc in range(100))
+GCN_CYCLE_FIELDS = tuple(f"{c:>03}-" for c in range(701))
+
+# Indexed by the number of days elapsed in the cycle: see _day_in_cycle_tables.
+SWD_FIELDS, TERSE_COLLOQUIAL_DAYS, VERBOSE_COLLOQUIAL_DAYS = _day_in_cycle_tables()
+
+# The era markers, terse and verbose, of dates Before Time Zero, Before History and in the Current Era.
+TERSE_ERA_MARKERS = (" BZ", " BH", " CE")
+VERBOSE_ERA_MARKERS = (" Before Time Zero", " Before History", " Current Era")
+
+
+def era_markers(era_marker: Optional[str], verbose: bool = False) -> Tuple[str, str, str]:
+    """
+    Return the suffixes to be appended to dates Before Time Zero, Before History and in the Current Era given the
+    era_marker option of CalmarendianDate.common_symbolic_notation or CalmarendianDate.colloquial_date.
+    """
+    bz, bh, ce = VERBOSE_ERA_MARKERS if verbose else TERSE_ERA_MARKERS
+    if isinstance(era_marker, str):
+        era_marker = era_marker.upper()
+    if era_marker == "CE":
+        return bz, bh, ce
+    if era_marker == "BH":
+        return bz, bh, ""
+    return bz, "", ""
+
+
+def cycle_and_era_suffix(gc: int, c: int, suffixes: Tuple[str, str, str]) -> Tuple[int, str]:
+    """
+    Return the cycle number shown in the CSN or colloquial date string of a date in the given grand cycle and cycle,
+    together with the era suffix (if any) to be appended to it. The cycle number is the absolute cycle reference
+    (see CalmarendianDate.absolute_cycle_ref), counted backwards Before Time Zero, found without building an
+    EraMarker for each date.
+    :param suffixes: The Before Time Zero, Before History and Current Era suffixes returned by era_markers.
+    """
+    acr = (gc - 1) * 700 + c
+    if acr > 500:
+        return acr, suffixes[2]
+    if gc > 0:
+        return acr, suffixes[1]
+    return -acr, suffixes[0]
+
+
+def grand_cycle_notations(adrs) -> List[str]:
+    """
+    Return the Grand Cycle Notation date strings of the given absolute day references:
+    the column-wise equivalent of CalmarendianDate.grand_cycle_notation.
+    :param adrs: A NumPy array, array('l') or other iterable of in-range absolute day references.
+    :return: A list of GCN date strings.
+    """
+    gc_fields, c_fields, swd_fields = GCN_GRAND_CYCLE_FIELDS, GCN_CYCLE_FIELDS, SWD_FIELDS
+    return [gc_fields[gc] + c_fields[c] + swd_fields[r] for gc, c, r in zip(*_cycle_days(adrs))]
+
+
+def common_symbolic_notations(adrs, era_marker: Optional[str] = None) -> List[str]:
+    """
+    Return the Common Symbolic Notation date strings of the given absolute day references:
+    the column-wise equivalent of CalmarendianDate.common_symbolic_notation.
+    :param adrs: A NumPy array, array('l') or other iterable of in-range absolute day references.
+    :param era_marker: If no era marker is supplied, append an era marker only to dates Before Time Zero.
+    If 'BH' is specified, append an era marker to all dates before the Current Era.
+    If 'CE' is specified, append an era marker to all dates.
+    :return: A list of CSN date strings.
+    """
+    suffixes = era_markers(era_marker)
+    swd_fields = SWD_FIELDS
+    strings = []
+    append = strings.append
+    for gc, c, r in zip(*_cycle_days(adrs)):
+        cycle, suffix = cycle_and_era_suffix(gc, c, suffixes)
+        append(f"{cycle:>03}-{swd_fields[r]}{suffix}")
+    return strings
+
+
+def colloquial_dates(adrs, *, era_marker: Optional[str] = None, verbose: bool = False) -> List[str]:
+    """
+    Return the colloquial date strings of the given absolute day references:
+    the column-wise equivalent of CalmarendianDate.colloquial_date, taking the same options.
+    :param adrs: A NumPy array, array('l') or other iterable of in-range absolute day references.
+    :param era_marker: Whether 'CE' and/or 'BH' era markers should be explicitly included.
+    :param verbose: If True, use 'of' rather than a comma after the day-of-the-week, name festival days in full
+    and display era markers in their verbose form.
+    :return: A list of colloquial date strings.
+    """
+    suffixes = era_markers(era_marker, verbose)
+    days = VERBOSE_COLLOQUIAL_DAYS if verbose else TERSE_COLLOQUIAL_DAYS
+    strings = []
+    append = strings.append
+    for gc, c, r in zip(*_cycle_days(adrs)):
+        cycle, suffix = cycle_and_era_suffix(gc, c, suffixes)
+        append(f"{days[r]} {cycle}{suffix}")
+    return strings
@@ -16,6 +16,16 @@ class CDateConfig(object):
     DAYS_per_GRAND_CYCLE: int = 1_718_101
     DAYS_per_CYCLE: float = DAYS_per_GRAND_CYCLE / 700
 
+    # A Calmarendian day lasts 2 ** 16 seconds; hours and minutes are the usual 3,600 and 60 seconds.
+    SECONDS_per_DAY: int = 65_536
+    SECONDS_per_HOUR: int = 3_600
+    SECONDS_per_MINUTE: int = 60
+    MICROSECONDS_per_SECOND: int = 1_000_000
+
+    # The bounds of the days component of a time delta: -MAX_DELTA_DAYS <= days < MAX_DELTA_DAYS.
+    # MAX_DELTA_DAYS, a hundred grand cycles, is the number of days from MIN_ADR to MAX_ADR inclusive.
+    MAX_DELTA_DAYS: int = 171_810_100
+
     # Regex representation of Grand Cycle and Common symbolic Notations
     GCN_DATE_STRING_RE = re.compile(r'^(\d{2})-([0-7]\d{2})-([1-7])-([0-5]\d)-([1-8])$')
     CSN_DATE_STRING_RE = re.compile(r'^([1-9]?\d{3})-([1-7])-([0-5]\d)-([1-8]) *(BZ|BH|CE)?$', re.IGNORECASE)
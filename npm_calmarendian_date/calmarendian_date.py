@@ -1,12 +1,19 @@
+import operator
+import warnings
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from functools import total_ordering
-from math import floor
-from typing import Tuple, Optional
+from typing import Iterable, Iterator, Tuple, Optional, Union
 
+from npm_calmarendian_date import bulk, date_format, decode_table
 from npm_calmarendian_date.c_date_config import CDateConfig
-from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day
+from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day, CYCLE_DAYS_PRIOR
+from npm_calmarendian_date.date_elements import CYCLE_DAY_ELEMENTS
 from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateRangeError
+from npm_calmarendian_date.exceptions import CalmarendianDateValueError
+from npm_calmarendian_date.lru_cache import CacheInfo, LRUCache
 from npm_calmarendian_date.string_conversions import DateString
+from npm_calmarendian_date.time_delta import CalmarendianTimeDelta, MICROSECONDS_per_DAY
 
 
 class EraMarker(Enum):
@@ -15,21 +22,46 @@ class EraMarker(Enum):
     CE = "Current Era"
 
 
+class OverflowPolicy(Enum):
+    """
+    What the calendar-unit arithmetic methods (CalmarendianDate.add_weeks etc.) do when the same day does not exist
+    in the target: CLAMP to the nearest earlier day that does, or RAISE a CalmarendianDateValueError.
+    """
+    CLAMP = "clamp"
+    RAISE = "raise"
+
+
 class DayRefDescriptor(Enum):
     ADR = "Absolute Day Reference"
     ARR = "Apocalypse Reckoning Reference"
 
 
-@total_ordering
 class CalmarendianDate(object):
     """
     The CalmarendianDate class is to the Calendar of Lorelei what, in Python terms, date is to Earth's Gregorian
     Calendar. In particular, CalmarendianDate naively assumes that its calendar always was
     (and always will be) in effect even though it demonstrably was not.
+
+    Like date, CalmarendianDate objects are immutable and hashable, so they can be used as set members and
+    dictionary keys.
     """
 
+    __slots__ = ('_absolute_day_reference', '_elements')
+
+    # The optional cache used by from_date_string; see enable_parse_cache.
+    _parse_cache: Optional[LRUCache] = None
+
+    # The optional cache of GCN and CSN date strings used by the notation methods; see enable_notation_memo.
+    _notation_cache: Optional[LRUCache] = None
+
     def __init__(self, new_adr: int):
-        self.adr = new_adr
+        """
+        Create a CalmarendianDate object from its absolute day reference (adr).
+        :param new_adr: The sanitized_adr method will raise an error on any value that cannot be
+        converted to an integer and for any value outside the valid date range.
+        """
+        self._absolute_day_reference = self.sanitized_adr(new_adr, DayRefDescriptor.ADR)
+        self._elements = None
 
     @property
     def adr(self) -> int:
@@ -38,15 +70,36 @@ class CalmarendianDate(object):
         """
         return self._absolute_day_reference
 
-    @adr.setter
-    def adr(self, new_value: int):
+    def date_elements(self) -> Tuple[GrandCycle, CycleInGrandCycle, Season, Week, Day]:
         """
-        Set a new value for the date objects absolute_day_reference (adr).
-        :param new_value: The sanitized_integer method will raise an error on any value that cannot be
-        converted to an integer and for any value outside the valid date range.
+        Return the date's five grand cycle notation elements as date element objects.
+        The elements are decoded from the absolute day reference the first time any of them is needed
+        and cached thereafter, so dates which are only ever compared or sorted never pay for the decoding.
         """
-        self._absolute_day_reference = self.sanitized_adr(new_value, DayRefDescriptor.ADR)
-        self.grand_cycle, self.cycle, self.season, self.week, self.day = self.elements_from_adr()
+        elements = self._elements
+        if elements is None:
+            elements = self._elements = self.elements_from_adr()
+        return elements
+
+    @property
+    def grand_cycle(self) -> GrandCycle:
+        return self.date_elements()[0]
+
+    @property
+    def cycle(self) -> CycleInGrandCycle:
+        return self.date_elements()[1]
+
+    @property
+    def season(self) -> Season:
+        return self.date_elements()[2]
+
+    @property
+    def week(self) -> Week:
+        return self.date_elements()[3]
+
+    @property
+    def day(self) -> Day:
+        return self.date_elements()[4]
 
     @property
     def apocalypse_reckoning(self) -> int:
@@ -55,14 +108,6 @@ class CalmarendianDate(object):
         """
         return self._absolute_day_reference - CDateConfig.APOCALYPSE_EPOCH_ADR
 
-    @apocalypse_reckoning.setter
-    def apocalypse_reckoning(self, new_value: int):
-        """
-        Set a new value for the absolute day reference based upon a day number in Apocalypse Reckoning.
-        :param new_value: An integer apocalypse reckoning day number which should map to a valid CalmarendianDate.
-        """
-        self.adr = self.sanitized_adr(new_value, DayRefDescriptor.ARR)
-
     @classmethod
     def from_objects(
             cls,
@@ -74,6 +119,8 @@ class CalmarendianDate(object):
     ):
         """
         Create a CalmarendianDate object from date element objects (GrandCycle, Cycle, etc.)
+        Each element object has been verified on its own account but, as they can be created independently of one
+        another, they are checked for consistency with each other before being adopted as the new date's elements.
         :param grand_cycle:
         :param cycle:
         :param season:
@@ -81,21 +128,46 @@ class CalmarendianDate(object):
         :param day:
         :return: A CalmarendianDate object.
         """
+        if week.season.number != season.number:
+            raise CalmarendianDateValueError(
+                f"WEEK: week {week.number} of season {week.season.number} is inconsistent with season {season.number}."
+            )
+        if day.festival != (week.number == 51) or day.number > (cycle.festival_days() if day.festival else 7):
+            raise CalmarendianDateValueError(
+                f"DAY: day {day.number} is inconsistent with week {week.number} of cycle {cycle.number}."
+            )
+        return cls._from_verified_objects(grand_cycle, cycle, season, week, day)
+
+    @classmethod
+    def _from_verified_objects(
+            cls,
+            grand_cycle: GrandCycle,
+            cycle: CycleInGrandCycle,
+            season: Season,
+            week: Week,
+            day: Day
+    ):
+        """
+        Create a CalmarendianDate object from date element objects which are known to be consistent with one another.
+        The elements are adopted as they are and the absolute day reference is calculated from them just once:
+        any valid set of elements maps to an in-range ADR, so neither sanitizing nor decoding is required.
+        """
         date = cls.__new__(cls)
-        date.adr = sum([
+        date._absolute_day_reference = sum([
             grand_cycle.days_prior(),
             cycle.days_prior(),
             season.days_prior(),
             week.days_prior(),
             day.number
         ])
+        date._elements = (grand_cycle, cycle, season, week, day)
         return date
 
     @classmethod
     def from_numbers(cls, gc: int, c: int, s: int, w: int, d: int):
         """
         Create a CalmarendianDate object from numerical inputs representing the date elements grand_cycle, cycle, etc.
-        by converting the numbers into date element objects which are then passed to the from_objects factory method.
+        by converting the numbers into (shared) date element objects from which the date is assembled directly.
         :param gc: Numeric representation of the grand_cycle number.
         :param c: Numeric representation of the cycle_in_grand_cycle number.
         :param s: Numeric representation of the season number.
@@ -103,23 +175,168 @@ class CalmarendianDate(object):
         :param d: Numeric representation of the day number.
         :return: A CalmarendianDate object.
         """
-        grand_cycle = GrandCycle(gc)
-        cycle = CycleInGrandCycle(c)
-        season = Season(s)
-        week = Week(w, season)
-        day = Day(d, week, cycle)
-        return cls.from_objects(grand_cycle, cycle, season, week, day)
+        grand_cycle = GrandCycle.interned(gc)
+        cycle = CycleInGrandCycle.interned(c)
+        season = Season.interned(s)
+        week = Week.interned(w, season)
+        day = Day.interned(d, week, cycle)
+        return cls._from_verified_objects(grand_cycle, cycle, season, week, day)
 
     @classmethod
     def from_date_string(cls, date_string: str):
         """
         For a given date string in Grand Cycle Notation or Common Symbolic Notation, return the corresponding
         CalmarendianDate object.
+        If the parse cache has been enabled, previously parsed date strings are not parsed again. Dates are
+        immutable so the cached date objects can be shared; any warning issued when the date string was first
+        parsed is issued again each time it is returned from the cache.
         :param date_string: A date string in either Grand Cycle Notation or Common Symbolic Notation format.
         :return: A CalmarendianDate object
         """
-        s = DateString(date_string)
-        return cls.from_numbers(*s.elements())
+        cache = CalmarendianDate._parse_cache
+        if cache is None or not isinstance(date_string, str):
+            s = DateString(date_string)
+            return cls.from_numbers(*s.elements())
+
+        key = (cls, date_string)
+        entry = cache.get(key)
+        if entry is None:
+            s = DateString(date_string)
+            entry = cls.from_numbers(*s.elements()), s.warning
+            cache.put(key, entry)
+        elif entry[1]:
+            warnings.warn(entry[1], category=UserWarning)
+        return entry[0]
+
+    @staticmethod
+    def parse_many(date_strings: Iterable[str], *, as_numpy: bool = False):
+        """
+        Return the absolute day references of the dates represented by the given date strings, in a compact integer
+        array, without creating a CalmarendianDate object for each of them. See bulk.parse_many.
+        :param date_strings: An iterable of date strings in either Grand Cycle Notation or Common Symbolic Notation.
+        :param as_numpy: If True, return a NumPy array (which requires NumPy to be installed).
+        :return: An array('l') of ADRs or, if requested, a NumPy array.
+        """
+        return bulk.parse_many(date_strings, as_numpy=as_numpy)
+
+    @classmethod
+    def range(
+            cls,
+            start: Union['CalmarendianDate', int],
+            stop: Union['CalmarendianDate', int],
+            step: int = 1
+    ) -> Iterator['CalmarendianDate']:
+        """
+        Return an iterator over the dates from start up to, but not including, stop, step days apart, in the manner
+        of Python's range: a negative step counts backwards and an empty range yields nothing.
+        Only the first date is decoded from its absolute day reference. Each later date is reached by advancing the
+        number of days elapsed in the cycle, carrying into the cycle and the grand cycle at the end of each cycle
+        (whose length depends on its festival days), and takes its season, week and day from the shared elements of
+        that day of the cycle.
+        :param start: The first date, as a CalmarendianDate object or an absolute day reference.
+        :param stop: The date at which to stop, as a CalmarendianDate object or an absolute day reference,
+        which need not itself be in range.
+        :param step: A non-zero number of days.
+        :return: An iterator of CalmarendianDate objects.
+        """
+        start = start.adr if isinstance(start, CalmarendianDate) else cls.sanitized_adr(start, DayRefDescriptor.ADR)
+        stop = stop.adr if isinstance(stop, CalmarendianDate) else cls._int_day_reference(stop, DayRefDescriptor.ADR)
+        if not isinstance(step, int) or step == 0:
+            raise CalmarendianDateDomainError(f"STEP: {step} is an invalid step. Must be a non-zero integer.")
+        adrs = range(start, stop, step)
+        if adrs and not CDateConfig.MIN_ADR <= adrs[-1] <= CDateConfig.MAX_ADR:
+            raise CalmarendianDateDomainError(f"ADR: {adrs[-1]} is out of range.")
+        return cls._ranged(adrs)
+
+    @classmethod
+    def _ranged(cls, adrs: range) -> Iterator['CalmarendianDate']:
+        """
+        Yield the dates of a range of in-range absolute day references.
+        """
+        if not adrs:
+            return
+        step = adrs.step
+        gc, c, s, w, d = cls.numbers_from_adr(adrs.start)
+        grand_cycle = GrandCycle.interned(gc)
+        cycle = CycleInGrandCycle.interned(c)
+        cycle_days = CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1]
+        elapsed = adrs.start - 1 - (gc - 1) * CDateConfig.DAYS_per_GRAND_CYCLE - CYCLE_DAYS_PRIOR[c - 1]
+        new = cls.__new__
+        for adr in adrs:
+            if not 0 <= elapsed < cycle_days:
+                # Carry into the following (or preceding) cycles and, beyond Cycle 700 (or before Cycle 1),
+                # into the following (or preceding) grand cycle.
+                while elapsed >= cycle_days:
+                    elapsed -= cycle_days
+                    c += 1
+                    if c > 700:
+                        c, gc = 1, gc + 1
+                    cycle_days = CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1]
+                while elapsed < 0:
+                    c -= 1
+                    if c < 1:
+                        c, gc = 700, gc - 1
+                    cycle_days = CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1]
+                    elapsed += cycle_days
+                grand_cycle = GrandCycle.interned(gc)
+                cycle = CycleInGrandCycle.interned(c)
+            date = new(cls)
+            date._absolute_day_reference = adr
+            date._elements = (grand_cycle, cycle) + CYCLE_DAY_ELEMENTS[elapsed]
+            yield date
+            elapsed += step
+
+    @staticmethod
+    def enable_parse_cache(maxsize: int = 4096) -> LRUCache:
+        """
+        Start caching the dates returned by from_date_string, discarding any existing cache.
+        The cache is shared by CalmarendianDate and all its subclasses.
+        :param maxsize: The number of date strings to remember; once full, the least recently used is forgotten.
+        :return: The new (empty) cache.
+        """
+        CalmarendianDate._parse_cache = LRUCache(maxsize)
+        return CalmarendianDate._parse_cache
+
+    @staticmethod
+    def disable_parse_cache() -> None:
+        """
+        Stop caching the dates returned by from_date_string and discard the cache.
+        """
+        CalmarendianDate._parse_cache = None
+
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """
+        Empty the parse cache, if it is enabled, and reset its statistics.
+        """
+        if CalmarendianDate._parse_cache is not None:
+            CalmarendianDate._parse_cache.clear()
+
+    @staticmethod
+    def parse_cache_info() -> Optional[CacheInfo]:
+        """
+        Return the parse cache's hit, miss and eviction counts and its sizes, or None if it is not enabled.
+        """
+        if CalmarendianDate._parse_cache is None:
+            return None
+        return CalmarendianDate._parse_cache.cache_info()
+
+    @staticmethod
+    def enable_decode_table(path: Optional[str] = None) -> None:
+        """
+        Decode absolute day references by looking them up in a precomputed table of one grand cycle's days rather
+        than by searching the cycle boundaries. See decode_table.enable_decode_table.
+        :param path: If None, the table is built in memory when it is first needed. Otherwise, the path of a table
+        file to memory-map, which is written first if it does not exist.
+        """
+        decode_table.enable_decode_table(path)
+
+    @staticmethod
+    def disable_decode_table() -> None:
+        """
+        Stop using (and discard) the decode table.
+        """
+        decode_table.disable_decode_table()
 
     @classmethod
     def from_apocalypse_reckoning(cls, apocalypse_day: int):
@@ -158,13 +375,7 @@ class CalmarendianDate(object):
         :param value: A day reference.
         :param desc: Indicate if the input is an absolute day reference (ADR) or apocalypse reckoning reference (ARR).
         """
-        try:
-            value = int(value)
-        except ValueError:
-            raise CalmarendianDateError(f"{desc}: Cannot convert [{value}] to an integer value.")
-        except TypeError:
-            raise CalmarendianDateError(f"{desc}: {value.__class__} cannot be converted to an integer value.")
-
+        value = CalmarendianDate._int_day_reference(value, desc)
         if desc == DayRefDescriptor.ARR:
             value += CDateConfig.APOCALYPSE_EPOCH_ADR
         if CDateConfig.MIN_ADR <= value <= CDateConfig.MAX_ADR:
@@ -172,54 +383,79 @@ class CalmarendianDate(object):
 
         raise CalmarendianDateDomainError(f"{desc.name}: {value} is out of range.")
 
+    @staticmethod
+    def _int_day_reference(value, desc: DayRefDescriptor) -> int:
+        """
+        Return a day reference converted to an integer, without checking its range;
+        raise an error if it cannot be converted.
+        """
+        try:
+            return int(value)
+        except ValueError:
+            raise CalmarendianDateError(f"{desc}: Cannot convert [{value}] to an integer value.")
+        except TypeError:
+            raise CalmarendianDateError(f"{desc}: {value.__class__} cannot be converted to an integer value.")
+
     @staticmethod
     def cycle_decode(days: int) -> int:
         """
         For the given number of days, return the number of the cycle (within the current grand cycle) within which
         the numbered day falls.
+
+        The cycle is found by bisecting the precomputed table of cycle boundaries.
         :param days: A residual number of days, after accounting for the grand-cycle count.
         :return: The cycle number in which the given day falls.
         """
-        cycle = floor(days / CDateConfig.DAYS_per_CYCLE)
-        while cycle < 700 and CycleInGrandCycle(cycle + 1).days_prior() < days:
-            cycle += 1
-        return cycle
+        return bisect_left(CYCLE_DAYS_PRIOR, days)
 
-    def elements_from_adr(self) -> Tuple[GrandCycle, CycleInGrandCycle, Season, Week, Day]:
+    @staticmethod
+    def numbers_from_adr(adr: int) -> DateString.NumericGCNSequence:
         """
-        Return a CalmarendianDate object's five grand cycle notation elements, as date element objects,
-        calculated from the date's absolute day reference (ADR) property.
+        Return the five grand cycle notation elements of the given absolute day reference as plain integers.
+        :param adr: An absolute day reference, which is assumed to have been sanitized already.
         """
-        residue = self.adr
-
-        # Calculate GRAND_CYCLE
-        grand_cycle = GrandCycle(floor((residue - 1) / CDateConfig.DAYS_per_GRAND_CYCLE) + 1)
-
-        # Re-calculate residual days
-        residue -= (grand_cycle.number - 1) * CDateConfig.DAYS_per_GRAND_CYCLE
+        if decode_table.enabled:
+            return decode_table.numbers_from_adr(adr)
 
-        # Calculate CYCLE
-        cycle = CycleInGrandCycle(self.cycle_decode(residue))
+        # Calculate GRAND_CYCLE and the (zero-based) residual days within it
+        grand_cycle, residue = divmod(adr - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
 
-        # Re-calculate residual days
-        residue -= (cycle.days_prior())
+        # Calculate CYCLE: the first cycle starting after the residual day is the next cycle
+        cycle = bisect_right(CYCLE_DAYS_PRIOR, residue)
+        residue -= CYCLE_DAYS_PRIOR[cycle - 1]
 
-        # Calculate SEASON
-        season = Season(min(floor((residue - 1) / 350) + 1, 7))
+        # Calculate SEASON, with the festival days at the end of the cycle belonging to season 7
+        season, residue = divmod(residue, 350)
+        if season > 6:
+            season, residue = 6, residue + 350
 
-        # Re-calculate residual days
-        residue -= season.days_prior()
+        # Calculate WEEK and DAY, with any days beyond week 50 belonging to week 51 (Festival)
+        week = min(residue // 7, 50)
+        return grand_cycle + 1, cycle, season + 1, week + 1, residue - week * 7 + 1
 
-        # Calculate WEEK
-        week = Week(min(floor((residue - 1) / 7) + 1, 51), season)
-
-        # Re-calculate residual days
-        residue -= week.days_prior()
-
-        # Calculate DAY
-        day = Day(residue, week, cycle)
+    @staticmethod
+    def numbers_from_adrs(adrs) -> Tuple:
+        """
+        Return the five grand cycle notation elements of each of the given absolute day references as five parallel
+        arrays - grand cycles, cycles, seasons, weeks and days - without creating a CalmarendianDate object for each.
+        NumPy arrays are decoded with vectorized operations. See bulk.numbers_from_adrs.
+        :param adrs: A NumPy array, array('l') or other iterable of in-range absolute day references.
+        """
+        return bulk.numbers_from_adrs(adrs)
 
-        return grand_cycle, cycle, season, week, day
+    def elements_from_adr(self) -> Tuple[GrandCycle, CycleInGrandCycle, Season, Week, Day]:
+        """
+        Return a CalmarendianDate object's five grand cycle notation elements, as date element objects,
+        calculated from the date's absolute day reference (ADR) property.
+        """
+        if decode_table.enabled:
+            gc, c, elapsed = decode_table.cycle_days(self.adr)
+            return (GrandCycle.interned(gc), CycleInGrandCycle.interned(c)) + CYCLE_DAY_ELEMENTS[elapsed]
+        gc, c, s, w, d = self.numbers_from_adr(self.adr)
+        cycle = CycleInGrandCycle.interned(c)
+        season = Season.interned(s)
+        week = Week.interned(w, season)
+        return GrandCycle.interned(gc), cycle, season, week, Day.interned(d, week, cycle)
 
     def absolute_cycle_ref(self) -> Tuple[int, EraMarker]:
         """
@@ -251,13 +487,7 @@ class CalmarendianDate(object):
         """
         Return the date as a Grand Cycle Notation date string.
         """
-        return "{:>02}-{:>03}-{}-{:>02}-{}".format(
-            self.grand_cycle.number,
-            self.cycle.number,
-            self.season.number,
-            self.week.number,
-            self.day.number
-        )
+        return self._memoized(CalmarendianDate._rendered_grand_cycle_notation, "GCN")
 
     def common_symbolic_notation(self, era_marker: Optional[str] = None) -> str:
         """
@@ -267,14 +497,8 @@ class CalmarendianDate(object):
         If 'CE' is specified, append an era marker to all dates.
         :return: CSN date string.
         """
-        acr, em = self.absolute_cycle_ref()
-        if isinstance(era_marker, str):
-            era_marker = era_marker.upper()
-        if era_marker == "CE" or (era_marker == "BH" and em == EraMarker.BH) or em == EraMarker.BZ:
-            era_marker = f" {em.name}"
-        else:
-            era_marker = ""
-        return f"{acr:>03}-{self.season.number}-{self.week.number:>02}-{self.day.number}{era_marker}"
+        era_marker = era_marker.upper() if isinstance(era_marker, str) else None
+        return self._memoized(CalmarendianDate._rendered_common_symbolic_notation, "CSN", era_marker)
 
     def colloquial_date(self, *,
                         era_marker: Optional[str] = None,
@@ -289,19 +513,100 @@ class CalmarendianDate(object):
         rather than a two letter abbreviation.
         :return: A colloquial date string.
         """
-        first_separator = " of" if verbose else ","
-        acr, em = self.absolute_cycle_ref()
-        if isinstance(era_marker, str):
-            era_marker = era_marker.upper()
-        if era_marker == "CE" or (era_marker == "BH" and em == EraMarker.BH) or em == EraMarker.BZ:
-            era_marker = f" {em.value}" if verbose else f" {em.name}"
-        else:
-            era_marker = ""
-        if self.day.festival:
-            if verbose:
-                return f"{self.day.name()} of {acr}{era_marker}"
-            return f"Festival {self.day.number} of {acr}{era_marker}"
-        return f"{self.day.name()}{first_separator} Week {self.week.number} of {self.season.name()} {acr}{era_marker}"
+        cycle, era_suffix = self._cycle_and_era_suffix(era_marker, verbose)
+        days = bulk.VERBOSE_COLLOQUIAL_DAYS if verbose else bulk.TERSE_COLLOQUIAL_DAYS
+        return f"{days[self._days_elapsed_in_cycle()]} {cycle}{era_suffix}"
+
+    def _rendered_grand_cycle_notation(self) -> str:
+        grand_cycle, cycle = self.date_elements()[:2]
+        return "".join([
+            bulk.GCN_GRAND_CYCLE_FIELDS[grand_cycle.number],
+            bulk.GCN_CYCLE_FIELDS[cycle.number],
+            bulk.SWD_FIELDS[self._days_elapsed_in_cycle()]
+        ])
+
+    def _rendered_common_symbolic_notation(self, era_marker: Optional[str]) -> str:
+        cycle, era_suffix = self._cycle_and_era_suffix(era_marker)
+        return f"{cycle:>03}-{bulk.SWD_FIELDS[self._days_elapsed_in_cycle()]}{era_suffix}"
+
+    def _days_elapsed_in_cycle(self) -> int:
+        """
+        Return the number of days of the date's cycle before the date: 0 for the first day of a cycle.
+        """
+        _, _, season, week, day = self.date_elements()
+        return (season.number - 1) * 350 + (week.number - 1) * 7 + day.number - 1
+
+    def _cycle_and_era_suffix(self, era_marker: Optional[str], verbose: bool = False) -> Tuple[int, str]:
+        """
+        Return the cycle number and era suffix of the date's CSN or colloquial date string given the era_marker
+        option of common_symbolic_notation or colloquial_date. See bulk.cycle_and_era_suffix.
+        """
+        grand_cycle, cycle = self.date_elements()[:2]
+        return bulk.cycle_and_era_suffix(grand_cycle.number, cycle.number, bulk.era_markers(era_marker, verbose))
+
+    # -- memoized notations -- #
+
+    def _memoized(self, render, notation: str, *args) -> str:
+        """
+        Return render(self, *args), the date in the given notation, taking it from (or adding it to) the notation
+        cache if notation memoization is enabled.
+        """
+        cache = CalmarendianDate._notation_cache
+        if cache is None:
+            return render(self, *args)
+        key = (self._absolute_day_reference, notation, *args)
+        text = cache.get(key)
+        if text is None:
+            text = render(self, *args)
+            cache.put(key, text)
+        return text
+
+    @staticmethod
+    def enable_notation_memo(maxsize: int = 4096) -> LRUCache:
+        """
+        Start memoizing the GCN and CSN date strings of dates, discarding any existing memo, so that a date rendered
+        repeatedly (in several templates, say) is only rendered once in each notation. The strings are held in a
+        bounded cache keyed by absolute day reference, rather than on the dates themselves, so they are shared by
+        every date object for the same day and dates are no larger for the memo's existence.
+        :param maxsize: The number of date strings to remember; once full, the least recently used is forgotten.
+        :return: The new (empty) cache.
+        """
+        CalmarendianDate._notation_cache = LRUCache(maxsize)
+        return CalmarendianDate._notation_cache
+
+    @staticmethod
+    def disable_notation_memo() -> None:
+        """
+        Stop memoizing the notations of dates and discard the memo.
+        """
+        CalmarendianDate._notation_cache = None
+
+    @staticmethod
+    def notation_memo_info() -> Optional[CacheInfo]:
+        """
+        Return the notation memo's hit, miss and eviction counts and its sizes, or None if it is not enabled.
+        """
+        if CalmarendianDate._notation_cache is None:
+            return None
+        return CalmarendianDate._notation_cache.cache_info()
+
+    def strftime(self, format_string: str) -> str:
+        """
+        Return the date formatted according to the given format string, in the manner of date.strftime.
+        Each format string is compiled once and the compiled form cached, so applying the same format to many dates
+        is cheap. The directives are listed in date_format; directives for hours, minutes and seconds yield 00 and
+        any unknown directive raises a CalmarendianDateFormatError.
+        :param format_string: A format string, such as "%A, Week %W of %B %Y".
+        :return: The formatted date.
+        """
+        return date_format.formatted(self, format_string)
+
+    def __format__(self, format_spec: str) -> str:
+        """
+        Format the date with strftime, as f-strings and str.format do for f"{d:%d %B %Y}";
+        an empty format spec yields str(date).
+        """
+        return self.strftime(format_spec) if format_spec else str(self)
 
     def gcn(self) -> str:
         return self.grand_cycle_notation()
@@ -314,12 +619,217 @@ class CalmarendianDate(object):
     def __eq__(self, other) -> bool:
         if not isinstance(other, CalmarendianDate):
             return NotImplemented
-        return self.adr == other.adr
+        return self._absolute_day_reference == other._absolute_day_reference
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference != other._absolute_day_reference
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, CalmarendianDate):
             return NotImplemented
-        return self.adr < other.adr
+        return self._absolute_day_reference < other._absolute_day_reference
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference <= other._absolute_day_reference
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference > other._absolute_day_reference
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference >= other._absolute_day_reference
+
+    def __hash__(self) -> int:
+        return hash(self._absolute_day_reference)
+
+    # -- date arithmetic -- #
+
+    def shifted(self, days: int) -> 'CalmarendianDate':
+        """
+        Return the date the given number of days after (or, if negative, before) this one.
+        If this date's elements have been decoded and the new date falls within the same cycle, the new date's
+        elements are found without decoding: the grand cycle and cycle are shared and the season, week and day are
+        those of its day of the cycle. Otherwise they are left to be decoded if and when they are needed.
+        :param days: An integer number of days.
+        :return: A CalmarendianDate object.
+        """
+        return self._shifted(self._integer_count(days, "DAYS"))
+
+    def _shifted(self, days: int) -> 'CalmarendianDate':
+        """
+        Return the date the given (int) number of days after this one. See shifted.
+        """
+        adr = self._absolute_day_reference + days
+        if not CDateConfig.MIN_ADR <= adr <= CDateConfig.MAX_ADR:
+            raise CalmarendianDateRangeError(f"ADR: {adr} is out of range.")
+        date = self.__class__.__new__(self.__class__)
+        date._absolute_day_reference = adr
+        date._elements = None
+        elements = self._elements
+        if elements is not None:
+            # Inlined from _days_elapsed_in_cycle: this is on the path of every date + delta.
+            _, cycle, season, week, day = elements
+            elapsed = season.number * 350 + week.number * 7 + day.number - 358 + days
+            # Only in the festival at the end of the cycle does the cycle's length need to be looked up.
+            if 0 <= elapsed < 2450 or 0 <= elapsed - 2450 < cycle.festival_days():
+                date._elements = elements[:2] + CYCLE_DAY_ELEMENTS[elapsed]
+        return date
+
+    @staticmethod
+    def _integer_count(value, name: str) -> int:
+        """
+        Return a number of days (or of other calendar units) as an int; raise an error if it is not an integer.
+        """
+        try:
+            return operator.index(value)
+        except TypeError:
+            raise CalmarendianDateError(f"{name}: {value!r} is not an integer.")
+
+    def add_weeks(self, weeks: int, overflow: OverflowPolicy = OverflowPolicy.CLAMP) -> 'CalmarendianDate':
+        """
+        Return the same day of the week the given number of weeks later (or, if negative, earlier).
+        The festival days are not part of any week and are skipped over: a week after Week 50 of Season 7 is Week 1
+        of Season 1 of the next cycle. A festival day has no day of the week to keep, so it is either clamped to the
+        last day of Week 50 before being moved or, under the RAISE policy, rejected.
+        :param weeks: An integer number of weeks.
+        :param overflow: The policy for festival days: an OverflowPolicy or its value.
+        :return: A CalmarendianDate object.
+        """
+        weeks = self._integer_count(weeks, "WEEKS")
+        overflow = self._overflow_policy(overflow)
+        _, _, season, week, day = self.date_elements()
+        w, d = week.number, day.number
+        if w == 51:
+            w, d = self._overflowed(overflow, f"DAY: festival day {d} is not in any week.")
+        weeks += (self.absolute_cycle_count() * 7 + season.number - 1) * 50 + w - 1
+        cycles, weeks = divmod(weeks, 350)
+        s, w = divmod(weeks, 50)
+        return self._from_cycle_count(cycles, s + 1, w + 1, d, overflow)
+
+    def add_seasons(self, seasons: int, overflow: OverflowPolicy = OverflowPolicy.CLAMP) -> 'CalmarendianDate':
+        """
+        Return the same day of the same week of the season the given number of seasons later (or, if negative,
+        earlier). A festival day moved to a season other than Season 7, or to a cycle whose festival is too short to
+        include it, is clamped to the last day of the target season or, under the RAISE policy, rejected.
+        :param seasons: An integer number of seasons.
+        :param overflow: The policy for festival days that do not exist in the target season: an OverflowPolicy or
+        its value.
+        :return: A CalmarendianDate object.
+        """
+        seasons = self._integer_count(seasons, "SEASONS")
+        overflow = self._overflow_policy(overflow)
+        cycles, s = divmod(self.absolute_season_ref() - 1 + seasons, 7)
+        return self._from_cycle_count(cycles, s + 1, self.week.number, self.day.number, overflow)
+
+    def add_cycles(self, cycles: int, overflow: OverflowPolicy = OverflowPolicy.CLAMP) -> 'CalmarendianDate':
+        """
+        Return the same day of the same week and season the given number of cycles later (or, if negative,
+        earlier). A festival day which does not exist in the target cycle (Festival 8, for example, exists only in
+        Cycle 700 of each grand cycle) is clamped to the last festival day of that cycle or, under the RAISE policy,
+        rejected.
+        :param cycles: An integer number of cycles.
+        :param overflow: The policy for festival days that do not exist in the target cycle: an OverflowPolicy or
+        its value.
+        :return: A CalmarendianDate object.
+        """
+        cycles = self._integer_count(cycles, "CYCLES")
+        overflow = self._overflow_policy(overflow)
+        _, _, season, week, day = self.date_elements()
+        return self._from_cycle_count(self.absolute_cycle_count() + cycles, season.number, week.number, day.number,
+                                      overflow)
+
+    def add_grand_cycles(self, grand_cycles: int) -> 'CalmarendianDate':
+        """
+        Return the same date the given number of grand cycles later (or, if negative, earlier). The calendar repeats
+        every grand cycle, so the same date always exists.
+        :param grand_cycles: An integer number of grand cycles.
+        :return: A CalmarendianDate object.
+        """
+        return self.add_cycles(700 * self._integer_count(grand_cycles, "GRAND CYCLES"))
+
+    def absolute_cycle_count(self) -> int:
+        """
+        Return the number of cycles between the start of Cycle 1 of Grand Cycle 1 and the start of the date's
+        cycle: zero for Cycle 1 and negative Before Time Zero.
+        """
+        return (self.grand_cycle.number - 1) * 700 + self.cycle.number - 1
+
+    @staticmethod
+    def _overflow_policy(overflow) -> OverflowPolicy:
+        """
+        Return the given OverflowPolicy or the policy with the given value; raise an error if there is none.
+        """
+        try:
+            return OverflowPolicy(overflow)
+        except ValueError:
+            raise CalmarendianDateDomainError(
+                f"OVERFLOW: {overflow!r} is an invalid overflow policy. Must be 'clamp' or 'raise'."
+            )
+
+    @staticmethod
+    def _overflowed(overflow: OverflowPolicy, message: str) -> Tuple[int, int]:
+        """
+        Return the week and day numbers of the last day of Week 50, to which a date which does not exist in the
+        target of a calendar-unit calculation is clamped or, under the RAISE policy, raise an exception.
+        """
+        if overflow is OverflowPolicy.RAISE:
+            raise CalmarendianDateValueError(message)
+        return 50, 7
+
+    def _from_cycle_count(self, cycles: int, s: int, w: int, d: int, overflow: OverflowPolicy) -> 'CalmarendianDate':
+        """
+        Create a date of the same class as this one from the absolute cycle count of its cycle (see
+        absolute_cycle_count) and its season, week and day numbers, applying the overflow policy to festival days
+        which do not exist in the target season or cycle.
+        """
+        gc, c = divmod(cycles, 700)
+        if not 0 <= gc + 1 <= 99:
+            raise CalmarendianDateRangeError(f"GRAND CYCLE: {gc + 1} is out of range.")
+        if w == 51:
+            festival_days = CycleInGrandCycle.interned(c + 1).festival_days()
+            if s != 7:
+                w, d = self._overflowed(overflow, f"WEEK: week 51 does not exist in season {s}.")
+            elif d > festival_days:
+                if overflow is OverflowPolicy.RAISE:
+                    raise CalmarendianDateValueError(f"DAY: festival day {d} does not exist in cycle {c + 1}.")
+                d = festival_days
+        return self.from_numbers(gc + 1, c + 1, s, w, d)
+
+    def __add__(self, other):
+        """
+        Return the date shifted by a CalmarendianTimeDelta. As for the Gregorian date class, only the delta's
+        whole days count: its seconds and microseconds are ignored.
+        """
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._shifted(other._microseconds // MICROSECONDS_per_DAY)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Return the date shifted back by a CalmarendianTimeDelta (whose seconds and microseconds are ignored) or,
+        given another date, the CalmarendianTimeDelta between the two.
+        """
+        if isinstance(other, CalmarendianTimeDelta):
+            return self._shifted(-(other._microseconds // MICROSECONDS_per_DAY))
+        if isinstance(other, CalmarendianDate):
+            return CalmarendianTimeDelta._from_microseconds(
+                (self._absolute_day_reference - other._absolute_day_reference) * MICROSECONDS_per_DAY
+            )
+        return NotImplemented
+
+    # -- pickling and copying -- #
+
+    def __reduce__(self):
+        return self.__class__, (self._absolute_day_reference,)
 
     # -- str and repr -- #
 
@@ -0,0 +1,213 @@
+"""
+Date Column Files
+
+A compact binary file format for columns of dates, which can be memory-mapped and so shared between processes
+without being read, let alone parsed, by each of them.
+
+A column file consists of a 16-byte header followed by the column's values, packed without padding.
+The header, in little-endian byte order, holds:
+    magic         4 bytes   b"CDCF"
+    version       uint16    COLUMN_FILE_VERSION
+    element type  uint16    a ColumnElementType value, which determines the type of the values
+    count         uint64    the number of values
+Absolute day references are stored as little-endian int32 values: every ADR between CDateConfig.MIN_ADR and
+CDateConfig.MAX_ADR fits comfortably. The grand cycle decode table (see decode_table) is stored as little-endian
+uint32 values.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from enum import IntEnum
+from itertools import islice
+from typing import Iterable, Optional
+
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateFormatError
+
+COLUMN_FILE_MAGIC = b"CDCF"
+COLUMN_FILE_VERSION = 1
+COLUMN_FILE_HEADER = struct.Struct("<4sHHQ")
+
+
+class ColumnElementType(IntEnum):
+    ADR_INT32 = 1
+    DECODE_UINT32 = 2
+
+
+# The array typecode, the size in bytes and the (little-endian) NumPy dtype of the values of each element type.
+ELEMENT_FORMATS = {
+    ColumnElementType.ADR_INT32: ('i', 4, "<i4"),
+    ColumnElementType.DECODE_UINT32: ('I', 4, "<u4"),
+}
+
+# The number of values written at a time.
+WRITE_CHUNK_SIZE = 1 << 16
+
+
+def verified_chunk(adrs, lowest: int, highest: int) -> None:
+    """
+    Raise an exception, identifying the first out-of-range ADR, unless the lowest and highest of the given
+    absolute day references are in range.
+    """
+    if lowest < CDateConfig.MIN_ADR or highest > CDateConfig.MAX_ADR:
+        bad = next(adr for adr in adrs if not CDateConfig.MIN_ADR <= adr <= CDateConfig.MAX_ADR)
+        raise CalmarendianDateDomainError(f"ADR: {bad} is out of range.")
+
+
+def write_column_file(
+        path: str,
+        values: Iterable[int],
+        element_type: ColumnElementType = ColumnElementType.ADR_INT32
+) -> int:
+    """
+    Write the given values to a column file, streaming them in chunks so that an iterable of any length can be
+    written without first being held in memory. The file is written under a temporary name and then renamed,
+    so other processes never see it partly written and an existing file is left untouched if writing fails.
+    :param path: The path of the file, which is replaced if it already exists.
+    :param values: An iterable of values, which may be a NumPy array: in-range absolute day references unless
+    another element type is given.
+    :param element_type: The type of the values.
+    :return: The number of values written.
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as f:
+            count = _written_values(f, values, element_type)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    return count
+
+
+def _written_values(f, values: Iterable[int], element_type: ColumnElementType) -> int:
+    """
+    Write the header and values of a column file to the given binary file object; return the number of values.
+    ADRs are range-checked in their original type, before being narrowed to that of the file.
+    """
+    typecode, _, dtype = ELEMENT_FORMATS[element_type]
+    verify = element_type == ColumnElementType.ADR_INT32
+    count = 0
+    f.write(COLUMN_FILE_HEADER.pack(COLUMN_FILE_MAGIC, COLUMN_FILE_VERSION, element_type, 0))
+    if bulk.numpy is not None and isinstance(values, bulk.numpy.ndarray):
+        values = values.ravel()
+        for i in range(0, len(values), WRITE_CHUNK_SIZE):
+            chunk = values[i:i + WRITE_CHUNK_SIZE]
+            if verify:
+                verified_chunk(chunk, chunk.min(), chunk.max())
+            f.write(chunk.astype(dtype).tobytes())
+            count += len(chunk)
+    else:
+        values = iter(values)
+        for chunk in iter(lambda: list(islice(values, WRITE_CHUNK_SIZE)), []):
+            if verify:
+                verified_chunk(chunk, min(chunk), max(chunk))
+            packed = array(typecode, chunk)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            f.write(packed.tobytes())
+            count += len(chunk)
+    f.seek(0)
+    f.write(COLUMN_FILE_HEADER.pack(COLUMN_FILE_MAGIC, COLUMN_FILE_VERSION, element_type, count))
+    return count
+
+
+class ColumnFile(object):
+    """
+    A read-only, memory-mapped column file.
+
+    The values are exposed, without being copied, by the values memoryview. On big-endian machines, where the
+    little-endian values cannot be used in place, values is a view of a byte-swapped copy instead.
+    The file should be closed (or used as a context manager) once finished with; closing it fails with a BufferError
+    while any view derived from values (a slice or NumPy array, for example) is still in use.
+    """
+
+    def __init__(self, path: str, element_type: Optional[ColumnElementType] = ColumnElementType.ADR_INT32):
+        """
+        Open and memory-map a column file, checking its header.
+        :param path: The path of the file.
+        :param element_type: The expected element type, or None to accept any known type.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < COLUMN_FILE_HEADER.size:
+                raise CalmarendianDateFormatError(f"COLUMN FILE: '{path}' is too short to be a column file.")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = values = None
+        try:
+            self.element_type, self.count = self.verified_header(self._mmap, path, element_type)
+            typecode = ELEMENT_FORMATS[self.element_type][0]
+            data = memoryview(self._mmap)[COLUMN_FILE_HEADER.size:]
+            if sys.byteorder == "big":
+                swapped = array(typecode, data)
+                data.release()
+                swapped.byteswap()
+                data = memoryview(swapped)
+            values = data.cast(typecode)
+            data.release()
+        except BaseException:
+            # The views must be released before the map can be closed; otherwise close raises a BufferError
+            # which masks the original exception.
+            for view in (values, data):
+                if view is not None:
+                    view.release()
+            self._mmap.close()
+            raise
+        self.values: memoryview = values
+
+    @staticmethod
+    def verified_header(buffer, path: str, element_type: Optional[ColumnElementType]):
+        """
+        Return the element type and count given by the header of a column file; raise an exception if the file
+        is not a valid column file of the expected element type.
+        """
+        magic, version, file_element_type, count = COLUMN_FILE_HEADER.unpack_from(buffer)
+        if magic != COLUMN_FILE_MAGIC:
+            raise CalmarendianDateFormatError(f"COLUMN FILE: '{path}' is not a column file.")
+        if version != COLUMN_FILE_VERSION:
+            raise CalmarendianDateFormatError(f"COLUMN FILE: '{path}' is of unsupported version {version}.")
+        if file_element_type not in ELEMENT_FORMATS.keys():
+            raise CalmarendianDateFormatError(
+                f"COLUMN FILE: '{path}' has unsupported element type {file_element_type}."
+            )
+        file_element_type = ColumnElementType(file_element_type)
+        if element_type is not None and file_element_type != element_type:
+            raise CalmarendianDateFormatError(
+                f"COLUMN FILE: '{path}' holds {file_element_type.name} values, not {element_type.name}."
+            )
+        if len(buffer) != COLUMN_FILE_HEADER.size + count * ELEMENT_FORMATS[file_element_type][1]:
+            raise CalmarendianDateFormatError(f"COLUMN FILE: '{path}' does not hold the {count} values it should.")
+        return file_element_type, count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def to_numpy(self):
+        """
+        Return a read-only NumPy array sharing the column file's memory (which requires NumPy to be installed).
+        """
+        bulk.require_numpy()
+        return bulk.numpy.frombuffer(self.values, dtype=bulk.numpy.dtype(self.values.format))
+
+    def close(self) -> None:
+        """
+        Release the values memoryview and unmap the file.
+        """
+        self.values.release()
+        self._mmap.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+
+    def __enter__(self) -> 'ColumnFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
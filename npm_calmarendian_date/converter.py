@@ -0,0 +1,282 @@
+"""
+Date Conversion
+
+Converts large numbers of dates from one notation to another: streams of lines, each holding a date string or
+day reference, with converted_chunks (as used by the command-line interface, python -m npm_calmarendian_date)
+and sequences of date strings, ADRs or GCN number tuples with convert_many.
+
+The dates are converted in chunks. Unless there is only one chunk, or only one worker is requested, the chunks are
+converted by a pool of worker processes: only integers and strings pass between the processes and no more than two
+chunks per worker are in flight at any time, so memory use does not grow with the size of the input.
+The results are returned in input order.
+"""
+
+import os
+import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from itertools import chain, islice
+from typing import Callable, Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.calmarendian_date import CalmarendianDate, DayRefDescriptor
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateValueError
+from npm_calmarendian_date.string_conversions import DateString
+
+
+class Notation(Enum):
+    ADR = "adr"
+    ARR = "arr"
+    GCN = "gcn"
+    CSN = "csn"
+    COLLOQUIAL = "colloquial"
+
+
+class ErrorPolicy(Enum):
+    STRICT = "strict"
+    SKIP = "skip"
+    ANNOTATE = "annotate"
+
+
+class Conversion(NamedTuple):
+    """
+    The specification of a conversion.
+
+    target: The notation to convert to.
+    source: The notation to convert from: ADR, ARR or (either GCN or CSN) a date string. If None, lines which are
+    integers are taken to be ADRs and all others to be date strings.
+    era_marker: The era_marker option for CSN and colloquial output; see CalmarendianDate.common_symbolic_notation.
+    verbose: The verbose option for colloquial output; see CalmarendianDate.colloquial_date.
+    errors: What to do with lines which cannot be converted: raise the exception (STRICT), leave them out of the
+    output (SKIP) or output them unconverted followed by a tab and the error message (ANNOTATE).
+    """
+    target: Notation
+    source: Optional[Notation] = None
+    era_marker: Optional[str] = None
+    verbose: bool = False
+    errors: ErrorPolicy = ErrorPolicy.STRICT
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# An input to convert_many: a GCN or CSN date string, an ADR or the five numbers of a GCN date.
+DateInput = Union[str, int, Tuple[int, int, int, int, int]]
+
+
+def _target_notation(target) -> Notation:
+    """
+    Return the given Notation or the notation with the given value; raise an error if there is none.
+    """
+    try:
+        return Notation(target)
+    except ValueError:
+        raise CalmarendianDateDomainError(
+            f"NOTATION: {target!r} is an invalid notation. Must be one of {', '.join(n.value for n in Notation)}."
+        )
+
+
+def adr_from_text(text: str, source: Optional[Notation]) -> int:
+    """
+    Return the absolute day reference of a date given in the source notation;
+    raise a CalmarendianDateError if it is invalid.
+    :param text: A date string or day reference, without surrounding whitespace.
+    :param source: ADR, ARR, GCN or CSN, or None to accept either ADRs or date strings.
+    """
+    if source is Notation.ADR or (source is None and text.lstrip("+-").isdigit()):
+        return CalmarendianDate.sanitized_adr(text, DayRefDescriptor.ADR)
+    if source is Notation.ARR:
+        return CalmarendianDate.sanitized_adr(text, DayRefDescriptor.ARR)
+    if source is Notation.COLLOQUIAL:
+        raise CalmarendianDateDomainError("NOTATION: Colloquial dates cannot be converted from.")
+    return adr_from_date_string(text)
+
+
+def adr_from_date_string(date_string: str) -> int:
+    """
+    Return the absolute day reference of a GCN or CSN date string, issuing the same warnings as
+    CalmarendianDate.from_date_string; raise a CalmarendianDateError if it is invalid.
+    """
+    numbers, warning = DateString.parsed(date_string)
+    if warning:
+        warnings.warn(warning, category=UserWarning, stacklevel=2)
+    return bulk.adr_from_numbers(*numbers)
+
+
+def adr_from_input(date: DateInput) -> int:
+    """
+    Return the absolute day reference of a date given as a date string (as CalmarendianDate.from_date_string),
+    as the five numbers of its GCN elements (as CalmarendianDate.from_numbers) or as an ADR;
+    raise a CalmarendianDateError if it is invalid.
+    """
+    if isinstance(date, str):
+        return adr_from_date_string(date)
+    if isinstance(date, (tuple, list)):
+        if len(date) != 5:
+            raise CalmarendianDateValueError(
+                f"GCN NUMBERS: {date} is an invalid input. Must be the five numbers (gc, c, s, w, d) of a GCN date."
+            )
+        return bulk.adr_from_numbers(*date)
+    return CalmarendianDate.sanitized_adr(date, DayRefDescriptor.ADR)
+
+
+def formatted_adrs(adrs: List[int], conversion: Conversion) -> List[Union[int, str]]:
+    """
+    Return the given absolute day references in the target notation of the conversion:
+    as integers for ADR and ARR targets, as strings otherwise.
+    """
+    target = conversion.target
+    if target is Notation.ADR:
+        return adrs
+    if target is Notation.ARR:
+        return [adr - CDateConfig.APOCALYPSE_EPOCH_ADR for adr in adrs]
+    if target is Notation.GCN:
+        return bulk.grand_cycle_notations(adrs)
+    if target is Notation.CSN:
+        return bulk.common_symbolic_notations(adrs, conversion.era_marker)
+    if target is Notation.COLLOQUIAL:
+        return bulk.colloquial_dates(adrs, era_marker=conversion.era_marker, verbose=conversion.verbose)
+    raise CalmarendianDateDomainError(f"NOTATION: {target!r} is an invalid target notation.")
+
+
+def converted_lines(lines: List[str], conversion: Conversion, first_line_number: int = 1) -> List[str]:
+    """
+    Return the converted lines, without line endings, applying the conversion's error policy to any line which
+    raises a CalmarendianDateError. Under the STRICT policy the exception raised identifies the offending line.
+    :param lines: The lines to be converted, each holding a single date.
+    :param conversion: The conversion to apply.
+    :param first_line_number: The line number of the first line, for error messages.
+    """
+    adrs, failures = [], {}
+    for i, line in enumerate(lines):
+        text = line.strip()
+        try:
+            adrs.append(adr_from_text(text, conversion.source))
+        except CalmarendianDateError as e:
+            if conversion.errors is ErrorPolicy.STRICT:
+                raise e.__class__(f"LINE {first_line_number + i}: {e}") from e
+            failures[i] = f"{text}\tERROR: {e}"
+    converted = formatted_adrs(adrs, conversion)
+    if conversion.target in (Notation.ADR, Notation.ARR):
+        converted = [str(value) for value in converted]
+    if not failures or conversion.errors is ErrorPolicy.SKIP:
+        return converted
+    converted.reverse()
+    return [failures[i] if i in failures else converted.pop() for i in range(len(lines))]
+
+
+def chunked(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Yield successive lists of (at most) chunk_size lines.
+    """
+    if chunk_size < 1:
+        raise CalmarendianDateDomainError(f"CHUNK SIZE: {chunk_size} is out of range; must be at least 1.")
+    lines = iter(lines)
+    chunk = list(islice(lines, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(lines, chunk_size))
+
+
+def converted_chunks(
+        lines: Iterable[str],
+        conversion: Conversion,
+        *,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[str]]:
+    """
+    Convert the given lines in chunks, yielding the converted chunks in input order.
+    :param lines: An iterable of lines, each holding a single date.
+    :param conversion: The conversion to apply.
+    :param workers: The number of worker processes; the number of CPUs if None.
+    :param chunk_size: The number of lines in each chunk.
+    """
+    chunks = chunked(lines, chunk_size)
+    return _ordered_results(converted_lines, chunks, conversion, first_number=1, workers=workers)
+
+
+def converted_inputs(dates: List[DateInput], conversion: Conversion, first_index: int = 0) -> List[Union[int, str]]:
+    """
+    Return the given dates in the target notation of the conversion, raising a CalmarendianDateError,
+    which identifies the offending input by its index, if any of them is invalid.
+    :param dates: Date strings, ADRs and/or five-tuples of GCN numbers.
+    :param conversion: The conversion to apply (its source and errors fields are not used).
+    :param first_index: The index of the first date, for error messages.
+    """
+    adrs = []
+    for i, date in enumerate(dates):
+        try:
+            adrs.append(adr_from_input(date))
+        except CalmarendianDateError as e:
+            raise e.__class__(f"INPUT {first_index + i}: {e}") from e
+    return formatted_adrs(adrs, conversion)
+
+
+def convert_many(
+        dates: Iterable[DateInput],
+        target: Union[Notation, str],
+        *,
+        era_marker: Optional[str] = None,
+        verbose: bool = False,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[Union[int, str]]:
+    """
+    Return the given dates converted to the target notation, in input order.
+
+    The dates are parsed and converted by the same rules as CalmarendianDate.from_date_string,
+    CalmarendianDate.from_numbers and the notation methods, but without creating CalmarendianDate objects.
+    :param dates: An iterable of GCN or CSN date strings, ADRs and/or (gc, c, s, w, d) tuples.
+    :param target: The notation to convert to, as a Notation or its value. ADR and ARR values are returned as
+    integers; the others as strings.
+    :param era_marker: The era_marker option for CSN and colloquial output.
+    :param verbose: The verbose option for colloquial output.
+    :param workers: The number of worker processes; the number of CPUs if None.
+    :param chunk_size: The number of dates given to a worker at a time.
+    :return: A list of the converted dates.
+    """
+    conversion = Conversion(_target_notation(target), era_marker=era_marker, verbose=verbose)
+    chunks = chunked(dates, chunk_size)
+    results = []
+    for converted in _ordered_results(converted_inputs, chunks, conversion, first_number=0, workers=workers):
+        results.extend(converted)
+    return results
+
+
+def _ordered_results(
+        convert: Callable[[List, Conversion, int], List],
+        chunks: Iterator[List],
+        conversion: Conversion,
+        *,
+        first_number: int,
+        workers: Optional[int]
+) -> Iterator[List]:
+    """
+    Yield convert(chunk, conversion, number of the chunk's first item) for each chunk, in order.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise CalmarendianDateDomainError(f"WORKERS: {workers} is out of range; must be at least 1.")
+    head = list(islice(chunks, 2 if workers > 1 else 1))
+    chunks = chain(head, chunks)
+    number = first_number
+
+    if len(head) < 2:
+        # Not worth starting a pool of workers.
+        for chunk in chunks:
+            yield convert(chunk, conversion, number)
+            number += len(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: Deque[Future] = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(convert, chunk, conversion, number))
+            number += len(chunk)
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
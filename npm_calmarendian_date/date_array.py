@@ -0,0 +1,332 @@
+"""
+The CalmarendianDateArray Class
+
+A column of dates held as the absolute day references (ADRs) of the dates, packed into a single contiguous
+array('l') buffer, rather than as a list of CalmarendianDate objects: about 8 bytes per date instead of the
+hundred or more bytes of each date object and its elements.
+CalmarendianDate objects are created only when individual dates are retrieved.
+"""
+
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.bulk import ADR_TYPECODE, numpy
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.column_file import ColumnFile, write_column_file
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateValueError
+
+DateOrADR = Union[CalmarendianDate, int]
+
+
+class ComparisonResult(array):
+    """
+    The array('b') of ones and zeros returned by an element-wise comparison of a CalmarendianDateArray.
+    As with NumPy, its truth value is ambiguous, so using it as a condition raises an exception: use all() or any(),
+    or compare arrays as a whole with CalmarendianDateArray.equals.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, values: Iterable[int]):
+        return super().__new__(cls, 'b', values)
+
+    def __bool__(self):
+        raise CalmarendianDateValueError(
+            "DATE ARRAY: The truth value of an element-wise comparison is ambiguous. Use all(), any() or equals()."
+        )
+
+
+class CalmarendianDateArray(object):
+    """
+    A sequence of dates backed by a contiguous array of their absolute day references.
+
+    Indexing returns CalmarendianDate objects, created on demand; slicing returns a new CalmarendianDateArray.
+    The grand_cycle, cycle, season, week and day properties return the numbers of those elements of every date
+    in the array as read-only views of array('l') objects.
+
+    As with NumPy arrays, the comparison operators compare the dates element by element: comparing an array with a
+    date (or an ADR) or with another array of the same length returns a ComparisonResult: an array('b') of ones and
+    zeros whose truth value is ambiguous. Use the equals method to compare two arrays as a whole.
+    Arrays are not hashable.
+    """
+
+    __slots__ = ('_adrs', '_numbers')
+
+    def __init__(self, dates: Iterable[DateOrADR] = ()):
+        """
+        Create a CalmarendianDateArray from CalmarendianDate objects and/or absolute day references.
+        :param dates: An iterable of CalmarendianDate objects or in-range integer absolute day references.
+        """
+        self._adrs = self._packed_adrs([self.adr_of(d) for d in dates])
+        self._numbers: Optional[Tuple[array, array, array, array, array]] = None
+
+    @classmethod
+    def from_adrs(cls, adrs: Iterable[int]) -> 'CalmarendianDateArray':
+        """
+        Create a CalmarendianDateArray from absolute day references. A NumPy integer array is range-checked and
+        then copied in a single block.
+        :param adrs: An iterable of in-range integer absolute day references.
+        """
+        if numpy is not None and isinstance(adrs, numpy.ndarray):
+            adrs = bulk._numpy_verified_adrs(adrs)
+            buffer = numpy.ascontiguousarray(adrs, dtype=f"i{array(ADR_TYPECODE).itemsize}").tobytes()
+            return cls._from_verified_adrs(array(ADR_TYPECODE, buffer))
+        return cls._from_verified_adrs(cls._packed_adrs(adrs))
+
+    @classmethod
+    def from_date_strings(cls, date_strings: Iterable[str]) -> 'CalmarendianDateArray':
+        """
+        Create a CalmarendianDateArray from GCN or CSN date strings, without creating a CalmarendianDate object
+        for each of them. See CalmarendianDate.parse_many.
+        :param date_strings: An iterable of date strings in either Grand Cycle Notation or Common Symbolic Notation.
+        """
+        return cls._from_verified_adrs(bulk.parse_many(date_strings))
+
+    @classmethod
+    def from_column_file(cls, path: str) -> 'CalmarendianDateArray':
+        """
+        Create a CalmarendianDateArray from the absolute day references held in a column file.
+        See column_file.write_column_file.
+        :param path: The path of a column file of ADRs.
+        """
+        with ColumnFile(path) as column:
+            return cls.from_adrs(column.values)
+
+    def to_column_file(self, path: str) -> None:
+        """
+        Write the array's absolute day references to a column file. See column_file.ColumnFile.
+        :param path: The path of the file, which is replaced if it already exists.
+        """
+        write_column_file(path, self._adrs)
+
+    @classmethod
+    def _from_verified_adrs(cls, adrs: array) -> 'CalmarendianDateArray':
+        """
+        Create a CalmarendianDateArray which adopts the given array('l') of in-range ADRs as its buffer.
+        """
+        date_array = cls.__new__(cls)
+        date_array._adrs = adrs
+        date_array._numbers = None
+        return date_array
+
+    @staticmethod
+    def adr_of(date: DateOrADR) -> int:
+        """
+        Return the absolute day reference of a CalmarendianDate object or, given an integer, the integer itself.
+        """
+        return date.adr if isinstance(date, CalmarendianDate) else date
+
+    @classmethod
+    def _packed_adrs(cls, adrs: Iterable[int]) -> array:
+        """
+        Return the given absolute day references packed into an array('l'), raising an exception if any is out of
+        range. They are range-checked before they are packed, so that a value too large for a C long is reported
+        as out of range rather than raising an OverflowError.
+        """
+        if not isinstance(adrs, (list, tuple, range, array, memoryview)):
+            adrs = list(adrs)
+        return array(ADR_TYPECODE, cls.verified_adrs(adrs))
+
+    @staticmethod
+    def verified_adrs(adrs: Sequence[int]) -> Sequence[int]:
+        """
+        Return the given sequence of absolute day references unaltered if they are all in range; raise an exception
+        otherwise.
+        """
+        if adrs:
+            for extreme in (min(adrs), max(adrs)):
+                if not CDateConfig.MIN_ADR <= extreme <= CDateConfig.MAX_ADR:
+                    raise CalmarendianDateDomainError(f"ADR: {extreme} is out of range.")
+        return adrs
+
+    @property
+    def adrs(self) -> memoryview:
+        """
+        Return a read-only view of the array's absolute day references.
+        """
+        return memoryview(self._adrs).toreadonly()
+
+    def to_numpy(self):
+        """
+        Return the array's absolute day references as a NumPy array (which requires NumPy to be installed).
+        The NumPy array is a copy: later changes to either are not reflected in the other.
+        """
+        bulk.require_numpy()
+        return numpy.array(self._adrs)
+
+    # -- sequence protocol -- #
+
+    def __len__(self) -> int:
+        return len(self._adrs)
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Return the date at the given index as a CalmarendianDate object or, given a slice,
+        the dates in the slice as a new CalmarendianDateArray.
+        """
+        if isinstance(index, slice):
+            return self._from_verified_adrs(self._adrs[index])
+        return CalmarendianDate(self._adrs[index])
+
+    def __iter__(self) -> Iterator[CalmarendianDate]:
+        return map(CalmarendianDate, self._adrs)
+
+    def __contains__(self, date: DateOrADR) -> bool:
+        return self.adr_of(date) in self._adrs
+
+    def __repr__(self) -> str:
+        return f"CalmarendianDateArray.from_adrs({self._adrs.tolist()})"
+
+    def __reduce__(self):
+        return self.__class__.from_adrs, (self._adrs,)
+
+    # -- ordering and searching -- #
+
+    def sort(self, *, reverse: bool = False) -> None:
+        """
+        Sort the dates in place into chronological (or, if reverse is True, reverse chronological) order.
+        """
+        self._adrs = array(ADR_TYPECODE, sorted(self._adrs, reverse=reverse))
+        self._numbers = None
+
+    def argsort(self, *, reverse: bool = False) -> array:
+        """
+        Return the indices which would sort the array, as an array('l'). The sort is stable.
+        """
+        return array(ADR_TYPECODE, sorted(range(len(self._adrs)), key=self._adrs.__getitem__, reverse=reverse))
+
+    def searchsorted(self, date: DateOrADR, side: str = 'left') -> int:
+        """
+        Return the index at which the given date would have to be inserted to keep the array, which must already
+        be in chronological order, in order.
+        :param date: A CalmarendianDate object or absolute day reference.
+        :param side: If 'left', return the index of the first suitable location; if 'right', the last.
+        """
+        if side == 'left':
+            return bisect_left(self._adrs, self.adr_of(date))
+        if side == 'right':
+            return bisect_right(self._adrs, self.adr_of(date))
+        raise CalmarendianDateDomainError(f"SIDE: '{side}' is an invalid input. Must be 'left' or 'right'.")
+
+    def min(self) -> CalmarendianDate:
+        """
+        Return the earliest date in the array.
+        """
+        if not self._adrs:
+            raise CalmarendianDateValueError("DATE ARRAY: An empty array has no earliest date.")
+        return CalmarendianDate(min(self._adrs))
+
+    def max(self) -> CalmarendianDate:
+        """
+        Return the latest date in the array.
+        """
+        if not self._adrs:
+            raise CalmarendianDateValueError("DATE ARRAY: An empty array has no latest date.")
+        return CalmarendianDate(max(self._adrs))
+
+    def equals(self, other: 'CalmarendianDateArray') -> bool:
+        """
+        Return True if the other array holds the same dates in the same order; False otherwise.
+        """
+        return isinstance(other, CalmarendianDateArray) and self._adrs == other._adrs
+
+    # -- element-wise comparison -- #
+
+    def _compared(self, other, compare) -> ComparisonResult:
+        """
+        Return a ComparisonResult of the results of comparing each date's ADR with the given date's ADR or with the ADR
+        of the corresponding date in the given array.
+        """
+        if isinstance(other, CalmarendianDateArray):
+            if len(other) != len(self):
+                raise CalmarendianDateValueError(
+                    f"DATE ARRAY: Cannot compare arrays of {len(self)} and {len(other)} dates element-wise."
+                )
+            return ComparisonResult(map(compare, self._adrs, other._adrs))
+        if isinstance(other, CalmarendianDate):
+            other = other.adr
+        elif not isinstance(other, int):
+            return NotImplemented
+        return ComparisonResult(map(compare, self._adrs, repeat(other)))
+
+    def __eq__(self, other):
+        return self._compared(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compared(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compared(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compared(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compared(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compared(other, operator.ge)
+
+    __hash__ = None
+
+    # -- date elements -- #
+
+    def numbers(self) -> Tuple[memoryview, memoryview, memoryview, memoryview, memoryview]:
+        """
+        Return the grand cycle, cycle, season, week and day numbers of every date in the array as five read-only
+        views of array('l') columns. They are decoded (with NumPy, where it is installed) the first time any of them
+        is needed and cached until the array is sorted; the views keep the cached columns from being altered.
+        """
+        if self._numbers is None:
+            if numpy is None:
+                self._numbers = bulk.numbers_from_adrs(self._adrs)
+            else:
+                columns = bulk.numbers_from_adrs(numpy.asarray(self._adrs))
+                dtype = f"i{self._adrs.itemsize}"
+                self._numbers = tuple(array(ADR_TYPECODE, column.astype(dtype).tobytes()) for column in columns)
+        return tuple(memoryview(column).toreadonly() for column in self._numbers)
+
+    @property
+    def grand_cycle(self) -> memoryview:
+        return self.numbers()[0]
+
+    @property
+    def cycle(self) -> memoryview:
+        return self.numbers()[1]
+
+    @property
+    def season(self) -> memoryview:
+        return self.numbers()[2]
+
+    @property
+    def week(self) -> memoryview:
+        return self.numbers()[3]
+
+    @property
+    def day(self) -> memoryview:
+        return self.numbers()[4]
+
+    # -- formatting -- #
+
+    def grand_cycle_notations(self) -> List[str]:
+        """
+        Return the dates as Grand Cycle Notation date strings.
+        """
+        return bulk.grand_cycle_notations(self._adrs)
+
+    def common_symbolic_notations(self, era_marker: Optional[str] = None) -> List[str]:
+        """
+        Return the dates as Common Symbolic Notation date strings. See CalmarendianDate.common_symbolic_notation.
+        """
+        return bulk.common_symbolic_notations(self._adrs, era_marker)
+
+    def colloquial_dates(self, *, era_marker: Optional[str] = None, verbose: bool = False) -> List[str]:
+        """
+        Return the dates as colloquial date strings. See CalmarendianDate.colloquial_date.
+        """
+        return bulk.colloquial_dates(self._adrs, era_marker=era_marker, verbose=verbose)
@@ -7,16 +7,36 @@ Written down, GCN is simply a list of integers but each element has its own veri
 derivable properties and, in some instances, name attributes.
 There are, therefore, separate classes for each of these elements, and it is instances of these classes that
 CalmarendianDate uses, rather than the raw integer values.
+
+There are only a few hundred distinct, valid date elements so, rather than building and verifying new objects for
+every date, CalmarendianDate uses the shared instances handed out by each class's interned() factory method.
+Date element objects are immutable so that such sharing is safe.
 """
 
-from math import floor
-from typing import List, NamedTuple
+from typing import Dict, List, NamedTuple, Tuple
 
 from npm_calmarendian_date.c_date_config import CDateConfig
 from npm_calmarendian_date.exceptions import CalmarendianDateError
 
 
-class GrandCycle(object):
+class DateElement(object):
+    """
+    The DateElement Class
+
+    Base class for the date element classes which makes their instances immutable.
+    Attributes can only be set, during initialization, by way of object.__setattr__.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+
+class GrandCycle(DateElement):
     """
     The GrandCycle Class
 
@@ -26,8 +46,23 @@ class GrandCycle(object):
     Grand Cycle 1, by definition, began on Monday, Week 1 of Winter 1 BH.
     """
 
+    __slots__ = ('number',)
+
+    _interned: Dict[int, 'GrandCycle'] = {}
+
     def __init__(self, grand_cycle: int):
-        self.number = self.verified_grand_cycle_number(grand_cycle)
+        object.__setattr__(self, 'number', self.verified_grand_cycle_number(grand_cycle))
+
+    def __reduce__(self):
+        return self.interned, (self.number,)
+
+    @classmethod
+    def interned(cls, grand_cycle: int) -> 'GrandCycle':
+        """
+        Return the shared GrandCycle instance for the given grand cycle number; raise an exception if it is invalid.
+        """
+        instance = cls._interned.get(grand_cycle)
+        return cls(grand_cycle) if instance is None else instance
 
     @staticmethod
     def verified_grand_cycle_number(grand_cycle: int) -> int:
@@ -67,10 +102,10 @@ class GrandCycle(object):
         :return: a count of the seasons in all the Grand Cycles prior to the current one, relative to Time Zero.
         This will yield a negative number for Grand Cycle 0 and zero for Grand Cycle 1.
         """
-        return (self.number - 1) * 4900
+        return (self.number - 1) * CYCLE_SEASONS_PRIOR[700]
 
 
-class CycleInGrandCycle(object):
+class CycleInGrandCycle(DateElement):
     """
     The CycleInGrandCycle Class
 
@@ -82,8 +117,24 @@ class CycleInGrandCycle(object):
     Calendar of Lorelei.
     """
 
+    __slots__ = ('number', '_festival_days')
+
+    _interned: Dict[int, 'CycleInGrandCycle'] = {}
+
     def __init__(self, cycle: int):
-        self.number = self.verified_cycle_in_grand_cycle_number(cycle)
+        object.__setattr__(self, 'number', self.verified_cycle_in_grand_cycle_number(cycle))
+        object.__setattr__(self, '_festival_days', self.festival_days_in_cycle(self.number))
+
+    def __reduce__(self):
+        return self.interned, (self.number,)
+
+    @classmethod
+    def interned(cls, cycle: int) -> 'CycleInGrandCycle':
+        """
+        Return the shared CycleInGrandCycle instance for the given cycle number; raise an exception if it is invalid.
+        """
+        instance = cls._interned.get(cycle)
+        return cls(cycle) if instance is None else instance
 
     @staticmethod
     def verified_cycle_in_grand_cycle_number(cycle: int) -> int:
@@ -108,9 +159,17 @@ class CycleInGrandCycle(object):
         :return: 4 if the cycle number is not divisible by seven;
         8 if the cycle number is divisible by 700, otherwise 7
         """
-        if self.number % 7 != 0:
+        return self._festival_days
+
+    @staticmethod
+    def festival_days_in_cycle(cycle: int) -> int:
+        """
+        Return the number of festival days in the given cycle: 4 if the cycle number is not divisible by seven;
+        8 if the cycle number is divisible by 700, otherwise 7
+        """
+        if cycle % 7 != 0:
             return 4
-        if self.number % 700 == 0:
+        if cycle % 700 == 0:
             return 8
         # Reach here if c is congruent to zero mod 7 but not zero mod 700.
         return 7
@@ -124,8 +183,7 @@ class CycleInGrandCycle(object):
         plus four festival days; every seventh cycle has an extra three festival days.
         The eighth festival day every seven-hundredth cycle is accounted for in CDateConfig.DAYS_per_GRAND_CYCLE
         """
-        cycles_prior = self.number - 1
-        return cycles_prior * 2454 + floor(cycles_prior / 7) * 3
+        return CYCLE_DAYS_PRIOR[self.number - 1]
 
     def seasons_prior(self) -> int:
         """
@@ -133,10 +191,10 @@ class CycleInGrandCycle(object):
 
         :return: a count of the seasons in the current Grand Cycle, prior to the start of the current cycle.
         """
-        return (self.number - 1) * 7
+        return CYCLE_SEASONS_PRIOR[self.number - 1]
 
 
-class Season(object):
+class Season(DateElement):
     """
     The Season Class
 
@@ -144,12 +202,27 @@ class Season(object):
     Each season is named, and it is by these names that seasons are colloquially referred to.
     """
 
+    __slots__ = ('number',)
+
     SEASON_NAMES: List[str] = [
         "Midwinter", "Thaw", "Spring", "Perihelion", "High Summer", "Autumn", "Onset"
     ]
 
+    _interned: Dict[int, 'Season'] = {}
+
     def __init__(self, season: int):
-        self.number = self.verified_season(season)
+        object.__setattr__(self, 'number', self.verified_season(season))
+
+    def __reduce__(self):
+        return self.interned, (self.number,)
+
+    @classmethod
+    def interned(cls, season: int) -> 'Season':
+        """
+        Return the shared Season instance for the given season number; raise an exception if it is invalid.
+        """
+        instance = cls._interned.get(season)
+        return cls(season) if instance is None else instance
 
     @staticmethod
     def verified_season(season: int) -> int:
@@ -195,7 +268,7 @@ class Season(object):
         return self.SEASON_NAMES[self.number - 1]
 
 
-class Week(object):
+class Week(DateElement):
     """
     The Week Class
 
@@ -203,6 +276,9 @@ class Week(object):
     Each week is named, although these names see very little day-to-day use.
 
     """
+
+    __slots__ = ('number', 'season', 'weekend')
+
     Weekend = NamedTuple('Weekend', [('descriptor', str), ('duration', float)])
 
     WEEK_NAMES: List[str] = [
@@ -259,10 +335,25 @@ class Week(object):
         'Festival'
     ]
 
+    _interned: Dict[Tuple[int, int], 'Week'] = {}
+
     def __init__(self, week: int, season: Season):
-        self.number = self.verified_week(week, season)
-        self.season = season
-        self.weekend = self.weekend_data()
+        object.__setattr__(self, 'number', self.verified_week(week, season))
+        object.__setattr__(self, 'season', season)
+        object.__setattr__(self, 'weekend', self.weekend_for(self.number, season.number))
+
+    def __reduce__(self):
+        return self.interned, (self.number, self.season)
+
+    @classmethod
+    def interned(cls, week: int, season: Season) -> 'Week':
+        """
+        Return the shared Week instance for the given week number in the given season;
+        raise an exception if the week number is invalid.
+        Note that the returned instance refers to the shared instance of the season.
+        """
+        instance = cls._interned.get((week, season.number))
+        return cls(week, season) if instance is None else instance
 
     @staticmethod
     def verified_week(week: int, season: Season) -> int:
@@ -289,17 +380,24 @@ class Week(object):
         Return information about the week's weekend:
         its type descriptor and duration.
         """
-        if self.number == 51:
-            return self.Weekend("", 0.0)
-        if self.number == 50 and self.season.number == 7:
-            return self.Weekend("Festival", 3.5)
-        if self.number == 50:
-            return self.Weekend("Heliotrope", 3.5)
-        if self.number == 25:
-            return self.Weekend("Mid-Season", 3.5)
-        if self.number % 5 == 0:
-            return self.Weekend("Long", 3.0)
-        return self.Weekend("Short", 2.0)
+        return self.weekend
+
+    @classmethod
+    def weekend_for(cls, week: int, season: int) -> Weekend:
+        """
+        Return the type descriptor and duration of the weekend of the given week number in the given season number.
+        """
+        if week == 51:
+            return cls.Weekend("", 0.0)
+        if week == 50 and season == 7:
+            return cls.Weekend("Festival", 3.5)
+        if week == 50:
+            return cls.Weekend("Heliotrope", 3.5)
+        if week == 25:
+            return cls.Weekend("Mid-Season", 3.5)
+        if week % 5 == 0:
+            return cls.Weekend("Long", 3.0)
+        return cls.Weekend("Short", 2.0)
 
     def days_prior(self) -> int:
         """
@@ -316,13 +414,39 @@ class Week(object):
         return self.WEEK_NAMES[self.number - 1]
 
 
-class Day(object):
+class Day(DateElement):
+    __slots__ = ('number', 'festival')
+
+    _interned: Dict[Tuple[int, bool], 'Day'] = {}
+
     DAY_NAMES: List[str] = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     LONG_NUMBERS: List[str] = ["One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight"]
 
     def __init__(self, day: int, week: Week, cycle: CycleInGrandCycle):
-        self.number = self.verified_day_number(day, week, cycle)
-        self.festival = (week.number == 51)
+        object.__setattr__(self, 'number', self.verified_day_number(day, week, cycle))
+        object.__setattr__(self, 'festival', week.number == 51)
+
+    def __reduce__(self):
+        return self.interned_by_key, (self.number, self.festival)
+
+    @classmethod
+    def interned(cls, day: int, week: Week, cycle: CycleInGrandCycle) -> 'Day':
+        """
+        Return the shared Day instance for the given day number in the given week and cycle;
+        raise an exception if the day number is invalid.
+        """
+        festival = week.number == 51
+        instance = cls._interned.get((day, festival))
+        if instance is None or day > (cycle.festival_days() if festival else 7):
+            return cls(day, week, cycle)
+        return instance
+
+    @classmethod
+    def interned_by_key(cls, day: int, festival: bool) -> 'Day':
+        """
+        Return the shared Day instance for the given, already verified, day number and festival flag.
+        """
+        return cls._interned[(day, festival)]
 
     @staticmethod
     def verified_day_number(day: int, week: Week, cycle: CycleInGrandCycle) -> int:
@@ -343,13 +467,16 @@ class Day(object):
         error_message = f"DAY must be in [1 .. {max_days}] for specified week; not {day}"
         raise CalmarendianDateError(error_message)
 
+    # The long names and the (one, two and three character) short names of the days, keyed by (number, festival).
+    # See _day_name_tables.
+    NAMES: Dict[Tuple[int, bool], str] = {}
+    SHORT_NAMES: Dict[Tuple[int, bool], Tuple[str, str, str]] = {}
+
     def name(self) -> str:
         """
         Return the long name of the day.
         """
-        if self.festival:
-            return f"Festival {self.LONG_NUMBERS[self.number - 1]}"
-        return self.DAY_NAMES[self.number - 1]
+        return self.NAMES[(self.number, self.festival)]
 
     def short_name(self, *, chars: int = 3) -> str:
         """
@@ -365,10 +492,85 @@ class Day(object):
 
         :return: Abbreviates day name.
         """
-        chars = max(1, min(3, chars))
-        if self.festival:
-            w = ['\u03A9', '\u03A9', '\u03A9.'][chars - 1]
-            return f"{w}{self.number}"
-        if chars == 1 and self.number in [4, 7]:
-            chars = 2
-        return self.name()[:chars]
+        return self.SHORT_NAMES[(self.number, self.festival)][max(1, min(3, chars)) - 1]
+
+
+def _day_name_tables() -> None:
+    """
+    Build the long and short names of every day, ordinary and festival, so that naming a day is a single lookup.
+    """
+    for festival, days in ((False, 7), (True, 8)):
+        for number in range(1, days + 1):
+            if festival:
+                name = f"Festival {Day.LONG_NUMBERS[number - 1]}"
+                short_names = tuple(f"{omega}{number}" for omega in ('\u03A9', '\u03A9', '\u03A9.'))
+            else:
+                name = Day.DAY_NAMES[number - 1]
+                short_names = (name[:2 if number in [4, 7] else 1], name[:2], name[:3])
+            Day.NAMES[(number, festival)] = name
+            Day.SHORT_NAMES[(number, festival)] = short_names
+
+
+_day_name_tables()
+
+
+def _cycle_boundaries() -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Return the cumulative day and season offsets of the start of every cycle in a grand cycle,
+    each followed by the corresponding total for the whole grand cycle.
+    """
+    days_prior, seasons_prior = [0], [0]
+    for cycle in range(1, 701):
+        days_prior.append(days_prior[-1] + 7 * 350 + CycleInGrandCycle.festival_days_in_cycle(cycle))
+        seasons_prior.append(seasons_prior[-1] + 7)
+    return tuple(days_prior), tuple(seasons_prior)
+
+
+# Cumulative offsets for the cycles of a grand cycle, built once from the festival rules and shared by every
+# decoding path (which bisects CYCLE_DAYS_PRIOR) and every encoding path.
+# CYCLE_DAYS_PRIOR[c - 1] and CYCLE_SEASONS_PRIOR[c - 1] count the days and the seasons in the grand cycle before
+# cycle c begins; CYCLE_DAYS_PRIOR[700] and CYCLE_SEASONS_PRIOR[700] are the totals for the whole grand cycle.
+CYCLE_DAYS_PRIOR, CYCLE_SEASONS_PRIOR = _cycle_boundaries()
+
+
+def _intern_date_elements() -> None:
+    """
+    Build the shared, pre-verified instances of every valid date element.
+    """
+    GrandCycle._interned.update((gc, GrandCycle(gc)) for gc in range(100))
+    CycleInGrandCycle._interned.update((c, CycleInGrandCycle(c)) for c in range(1, 701))
+    Season._interned.update((s, Season(s)) for s in range(1, 8))
+    for season in Season._interned.values():
+        Week._interned.update(
+            ((w, season.number), Week(w, season)) for w in range(1, season.max_weeks() + 1)
+        )
+    festival_cycle = CycleInGrandCycle._interned[700]
+    for week in (Week._interned[(1, 1)], Week._interned[(51, 7)]):
+        Day._interned.update(
+            ((d, week.number == 51), Day(d, week, festival_cycle))
+            for d in range(1, (festival_cycle.festival_days() if week.number == 51 else 7) + 1)
+        )
+
+
+_intern_date_elements()
+
+
+def _cycle_day_elements() -> Tuple[Tuple[Season, Week, Day], ...]:
+    """
+    Return the shared season, week and day objects of every day of the longest cycle, in order, found by advancing
+    a day at a time from the first day of the cycle and carrying into the week and the season.
+    """
+    festival_cycle = CycleInGrandCycle._interned[700]
+    elements = []
+    for season in (Season._interned[s] for s in range(1, 8)):
+        for week in (Week._interned[(w, season.number)] for w in range(1, season.max_weeks() + 1)):
+            elements.extend(
+                (season, week, Day._interned[(d, week.number == 51)])
+                for d in range(1, (festival_cycle.festival_days() if week.number == 51 else 7) + 1)
+            )
+    return tuple(elements)
+
+
+# The season, week and day elements of each day of a cycle, indexed by the number of days elapsed in the cycle.
+# Shorter cycles simply end sooner: their festivals have fewer days.
+CYCLE_DAY_ELEMENTS = _cycle_day_elements()
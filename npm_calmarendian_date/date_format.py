@@ -0,0 +1,115 @@
+"""
+Date Formatting
+
+The engine behind CalmarendianDate.strftime. A format string is compiled, once, into a str.format template and
+a tuple of the functions which extract each directive's value from a date; formatting a date is then a single
+call of the template's format method. Compiled formats are kept in a bounded LRU cache so that a program applying
+the same few formats to many dates compiles each of them only once.
+
+Directives:
+    %G  Grand cycle number, zero-padded to two digits (as in GCN).
+    %c  Cycle number within the grand cycle, zero-padded to three digits (as in GCN).
+    %Y  Absolute cycle number, zero-padded to three digits (as in CSN).
+    %E  Era marker of the absolute cycle: BZ, BH or CE.
+    %m  Season number.
+    %B  Season name.
+    %W  Week number, zero-padded to two digits.
+    %U  Week name.
+    %d  Day number.
+    %A  Day name (Festival One etc. for festival days).
+    %a  Short day name (see Day.short_name).
+    %j  Absolute day reference.
+    %R  Apocalypse Reckoning day number.
+    %H, %M, %S  Hours, minutes and seconds, always 00 for a date.
+    %%  A literal '%'.
+"""
+
+from typing import Callable, Dict, List, Tuple
+
+from npm_calmarendian_date.exceptions import CalmarendianDateFormatError
+from npm_calmarendian_date.lru_cache import LRUCache
+
+# A compiled format: a str.format template and the functions which return the values of its fields for a date.
+CompiledFormat = Tuple[str, Tuple[Callable, ...]]
+
+# The str.format spec and value function of each directive which depends on the date.
+# The value functions are given both the date and its elements, which are looked up once per date.
+DIRECTIVES: Dict[str, Tuple[str, Callable]] = {
+    'G': ("02", lambda date, elements: elements[0].number),
+    'c': ("03", lambda date, elements: elements[1].number),
+    'Y': ("03", lambda date, elements: date.absolute_cycle_ref()[0]),
+    'E': ("", lambda date, elements: date.absolute_cycle_ref()[1].name),
+    'm': ("", lambda date, elements: elements[2].number),
+    'B': ("", lambda date, elements: elements[2].name()),
+    'W': ("02", lambda date, elements: elements[3].number),
+    'U': ("", lambda date, elements: elements[3].name()),
+    'd': ("", lambda date, elements: elements[4].number),
+    'A': ("", lambda date, elements: elements[4].name()),
+    'a': ("", lambda date, elements: elements[4].short_name()),
+    'j': ("", lambda date, elements: date.adr),
+    'R': ("", lambda date, elements: date.apocalypse_reckoning),
+}
+
+# The text of each directive which does not depend on the date.
+CONSTANT_DIRECTIVES: Dict[str, str] = {'H': "00", 'M': "00", 'S': "00", '%': "%"}
+
+FORMAT_CACHE_SIZE = 256
+
+_format_cache = LRUCache(FORMAT_CACHE_SIZE)
+
+
+def compiled_format(format_string: str) -> CompiledFormat:
+    """
+    Compile a format string into a str.format template and the value functions of its fields;
+    raise a CalmarendianDateFormatError if it contains an unknown directive.
+    """
+    if not isinstance(format_string, str):
+        raise CalmarendianDateFormatError(f"FORMAT: {format_string.__class__} is not a format string.")
+    pieces: List[str] = []
+    functions: List[Callable] = []
+    literal_start = 0
+    i = format_string.find("%")
+    while i >= 0:
+        directive = format_string[i + 1:i + 2]
+        pieces.append(format_string[literal_start:i].replace("{", "{{").replace("}", "}}"))
+        if directive in DIRECTIVES:
+            spec, function = DIRECTIVES[directive]
+            pieces.append(f"{{{len(functions)}:{spec}}}" if spec else f"{{{len(functions)}}}")
+            functions.append(function)
+        elif directive in CONSTANT_DIRECTIVES:
+            pieces.append(CONSTANT_DIRECTIVES[directive])
+        else:
+            raise CalmarendianDateFormatError(
+                f"FORMAT: '%{directive}' is an unknown directive in '{format_string}'."
+            )
+        literal_start = i + 2
+        i = format_string.find("%", literal_start)
+    pieces.append(format_string[literal_start:].replace("{", "{{").replace("}", "}}"))
+    return "".join(pieces), tuple(functions)
+
+
+def cached_format(format_string: str) -> CompiledFormat:
+    """
+    Return the compiled form of a format string, compiling it only if it is not already in the cache.
+    """
+    compiled = _format_cache.get(format_string) if isinstance(format_string, str) else None
+    if compiled is None:
+        compiled = compiled_format(format_string)
+        _format_cache.put(format_string, compiled)
+    return compiled
+
+
+def formatted(date, format_string: str) -> str:
+    """
+    Return the given CalmarendianDate formatted according to the format string. See CalmarendianDate.strftime.
+    """
+    template, functions = cached_format(format_string)
+    elements = date.date_elements()
+    return template.format(*[function(date, elements) for function in functions])
+
+
+def format_cache() -> LRUCache:
+    """
+    Return the cache of compiled formats, for inspection or clearing.
+    """
+    return _format_cache
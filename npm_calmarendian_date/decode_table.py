@@ -0,0 +1,160 @@
+"""
+Grand Cycle Decode Table
+
+An optional table of the cycle, season, week and day numbers of every day of a grand cycle, each packed into a
+single uint32, with which any absolute day reference can be decoded with one divmod and one array index rather than
+a search of the cycle boundaries. Every grand cycle has the same days, so one grand cycle's worth of entries
+(CDateConfig.DAYS_per_GRAND_CYCLE, about 6.9 MB) covers the whole calendar.
+
+The table is used by CalmarendianDate.numbers_from_adr (and so elements_from_adr) and by bulk.numbers_from_adrs
+once it has been enabled with enable_decode_table. Nothing is built at import time: by default the table is built
+in memory the first time it is needed; given a path, it is memory-mapped from a column file (see column_file),
+which is written first if it does not yet exist, so that its pages are shared between processes and read from disk
+only as they are touched.
+
+Each value packs, from the least significant bit: the day number (4 bits), the week number (6 bits), the season
+number (3 bits) and the cycle number (10 bits).
+"""
+
+import os
+from array import array
+from typing import Optional, Tuple, Union
+
+from npm_calmarendian_date import column_file
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.date_elements import CYCLE_DAYS_PRIOR, CYCLE_DAY_ELEMENTS
+from npm_calmarendian_date.exceptions import CalmarendianDateFormatError
+
+WEEK_SHIFT = 4
+SEASON_SHIFT = 10
+CYCLE_SHIFT = 13
+DAY_MASK = (1 << WEEK_SHIFT) - 1
+WEEK_MASK = (1 << (SEASON_SHIFT - WEEK_SHIFT)) - 1
+SEASON_MASK = (1 << (CYCLE_SHIFT - SEASON_SHIFT)) - 1
+
+TABLE_TYPECODE = 'I'
+
+# Whether the decode table has been enabled; see enable_decode_table.
+enabled = False
+
+# The table, once built or loaded; the column file it is mapped from, if any.
+_table: Optional[Union[array, memoryview]] = None
+_column_file: Optional[column_file.ColumnFile] = None
+
+
+def packed(c: int, s: int, w: int, d: int) -> int:
+    """
+    Return the cycle, season, week and day numbers of a date packed into a single decode table value.
+    """
+    return (c << CYCLE_SHIFT) | (s << SEASON_SHIFT) | (w << WEEK_SHIFT) | d
+
+
+def unpacked(value: int) -> Tuple[int, int, int, int]:
+    """
+    Return the cycle, season, week and day numbers packed into a decode table value.
+    """
+    return (
+        value >> CYCLE_SHIFT, (value >> SEASON_SHIFT) & SEASON_MASK, (value >> WEEK_SHIFT) & WEEK_MASK, value & DAY_MASK
+    )
+
+
+def built_table() -> array:
+    """
+    Build and return the decode table as an array('I'): the packed cycle, season, week and day numbers of each day
+    of a grand cycle, indexed by the (zero-based) number of days elapsed in the grand cycle before it.
+    """
+    # The season, week and day numbers of each day of the longest cycle; shorter cycles use a prefix of them.
+    cycle_day_values = [packed(0, s.number, w.number, d.number) for s, w, d in CYCLE_DAY_ELEMENTS]
+    table = array(TABLE_TYPECODE)
+    for c in range(1, 701):
+        cycle_bits = c << CYCLE_SHIFT
+        table.extend([cycle_bits | value for value in cycle_day_values[:CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1]]])
+    return table
+
+
+def write_decode_table(path: str) -> int:
+    """
+    Build the decode table and write it to a column file. Other processes never see the file partly written;
+    see column_file.write_column_file.
+    :param path: The path of the file, which is replaced if it already exists.
+    :return: The number of values written.
+    """
+    return column_file.write_column_file(path, built_table(), column_file.ColumnElementType.DECODE_UINT32)
+
+
+def loaded_table(path: str) -> column_file.ColumnFile:
+    """
+    Memory-map a decode table column file, checking that it holds a whole grand cycle of correctly packed days.
+    """
+    table_file = column_file.ColumnFile(path, column_file.ColumnElementType.DECODE_UINT32)
+    values = table_file.values
+    if (
+            table_file.count != CDateConfig.DAYS_per_GRAND_CYCLE
+            or values[0] != packed(1, 1, 1, 1) or values[-1] != packed(700, 7, 51, 8)
+    ):
+        table_file.close()
+        raise CalmarendianDateFormatError(f"DECODE TABLE: '{path}' does not hold a grand cycle decode table.")
+    return table_file
+
+
+def enable_decode_table(path: Optional[str] = None) -> None:
+    """
+    Decode absolute day references with the decode table from now on.
+    :param path: If None, the table is built in memory when it is first needed. Otherwise, the path of a decode
+    table column file to memory-map, which is written first if it does not exist.
+    """
+    global enabled, _column_file, _table
+    disable_decode_table()
+    if path is not None:
+        if not os.path.exists(path):
+            write_decode_table(path)
+        _column_file = loaded_table(path)
+        _table = _column_file.values
+    enabled = True
+
+
+def disable_decode_table() -> None:
+    """
+    Stop using the decode table, discarding it (and unmapping its file, if it was loaded from one).
+    """
+    global enabled, _column_file, _table
+    enabled = False
+    _table = None
+    if _column_file is not None:
+        _column_file.close()
+        _column_file = None
+
+
+def table() -> Union[array, memoryview]:
+    """
+    Return the decode table, building it first if it has not been built (or loaded) yet.
+    """
+    global _table
+    if _table is None:
+        _table = built_table()
+    return _table
+
+
+def numbers_from_adr(adr: int) -> Tuple[int, int, int, int, int]:
+    """
+    Return the five grand cycle notation elements of the given absolute day reference, as
+    CalmarendianDate.numbers_from_adr, using the decode table.
+    :param adr: An absolute day reference, which is assumed to have been sanitized already.
+    """
+    grand_cycle, residue = divmod(adr - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
+    value = (table() if _table is None else _table)[residue]
+    return (
+        grand_cycle + 1, value >> CYCLE_SHIFT, (value >> SEASON_SHIFT) & SEASON_MASK,
+        (value >> WEEK_SHIFT) & WEEK_MASK, value & DAY_MASK
+    )
+
+
+def cycle_days(adr: int) -> Tuple[int, int, int]:
+    """
+    Return the grand cycle and cycle numbers of the given absolute day reference and the (zero-based) number of
+    days elapsed in the cycle before it, using the decode table.
+    :param adr: An absolute day reference, which is assumed to have been sanitized already.
+    """
+    grand_cycle, residue = divmod(adr - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
+    cycle = (table() if _table is None else _table)[residue] >> CYCLE_SHIFT
+    return grand_cycle + 1, cycle, residue - CYCLE_DAYS_PRIOR[cycle - 1]
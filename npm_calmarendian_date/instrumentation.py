@@ -0,0 +1,223 @@
+"""
+Hot-Path Instrumentation
+
+Opt-in counters (and, optionally, timers) for the operations which dominate most workloads, so that it can be seen
+which paths a program actually exercises:
+
+    sanitized_adr                 day references sanitized (CalmarendianDate.sanitized_adr)
+    decode.elements_from_adr      dates whose elements were decoded from their ADR
+    decode.numbers_from_adrs      ADRs decoded in bulk
+    parse.gcn, parse.csn          date strings parsed successfully, by notation
+    parse.failed                  date strings which could not be parsed
+    render.gcn, render.csn        GCN and CSN date strings rendered (memoized notations are not rendered again)
+    render.colloquial             colloquial date strings rendered
+    render.strftime               dates formatted with strftime or format()
+    render.bulk_gcn, render.bulk_csn, render.bulk_colloquial
+                                  date strings rendered in bulk
+    error.<class name>            exceptions raised, by CalmarendianDateError subclass
+
+Cycle searches are not counted separately: the decoders find each date's cycle with a single bisection of the cycle
+boundaries (or a lookup in the decode table) made inline, so decode.elements_from_adr and decode.numbers_from_adrs
+count them too.
+
+Instrumentation costs nothing while it is disabled: enabling it replaces the instrumented functions and methods
+with counting wrappers, and disabling it puts the originals back. With timing enabled the wrappers also accumulate
+the time spent in each operation; the times of nested operations (parse.gcn within from_date_string, for example)
+are included in those of the operations which call them. Exceptions are counted as they are created. Only the
+current process is instrumented: the worker processes of converter.convert_many, for example, are not.
+
+Use enable and disable with snapshot and reset, or the instrumented context manager:
+
+    with instrumentation.instrumented(timing=True) as recording:
+        run_workload()
+    print(recording.counts, recording.seconds)
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from functools import update_wrapper
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from npm_calmarendian_date import bulk, date_format
+from npm_calmarendian_date.calmarendian_date import CalmarendianDate
+from npm_calmarendian_date.exceptions import CalmarendianDateError
+from npm_calmarendian_date.string_conversions import DateString
+
+# The counts and (if timing is enabled) the accumulated seconds of each operation.
+_counts: Counter = Counter()
+_seconds: Counter = Counter()
+
+# The owner, attribute name and original value of each attribute replaced by a wrapper.
+_originals: List[Tuple[object, str, object]] = []
+
+_timing = False
+
+
+class Snapshot(NamedTuple):
+    """
+    The counts and accumulated seconds of each instrumented operation at a moment in time.
+    """
+    counts: Dict[str, int]
+    seconds: Dict[str, float]
+
+
+class Recording(object):
+    """
+    The counts and accumulated seconds recorded within an instrumented block, available once the block has exited.
+    """
+    __slots__ = ('counts', 'seconds')
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+
+
+def _counted(function: Callable, name: str, rows: Optional[Callable[[object], int]] = None) -> Callable:
+    """
+    Return a wrapper of function which counts (and, if timing is enabled, times) its calls under the given name.
+    Calls which raise an exception are counted too.
+    :param rows: If given, a function of the result returning the number of rows to count instead of one call.
+    """
+    if _timing:
+        def wrapper(*args, **kwargs):
+            if rows is None:
+                _counts[name] += 1
+            start = perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                _seconds[name] += perf_counter() - start
+            if rows is not None:
+                _counts[name] += rows(result)
+            return result
+    elif rows is None:
+        def wrapper(*args, **kwargs):
+            _counts[name] += 1
+            return function(*args, **kwargs)
+    else:
+        def wrapper(*args, **kwargs):
+            result = function(*args, **kwargs)
+            _counts[name] += rows(result)
+            return result
+    return update_wrapper(wrapper, function)
+
+
+def _counted_parse(function: Callable) -> Callable:
+    """
+    Return a wrapper of DateString.parsed which counts (and, if timing is enabled, times) successful parses by
+    notation (a GCN date string has four dashes; a CSN date string three) and failures.
+    """
+    def wrapper(cls, date_string):
+        name = "parse.failed"
+        start = perf_counter() if _timing else 0.0
+        try:
+            result = function(cls, date_string)
+            name = "parse.gcn" if date_string.count("-") == 4 else "parse.csn"
+        finally:
+            _counts[name] += 1
+            if _timing:
+                _seconds[name] += perf_counter() - start
+        return result
+    return update_wrapper(wrapper, function)
+
+
+def _counted_exception_init(self, *args) -> None:
+    _counts[f"error.{self.__class__.__name__}"] += 1
+    Exception.__init__(self, *args)
+
+
+def _replace(owner: object, attribute: str, wrap: Callable[[Callable], Callable]) -> None:
+    """
+    Replace owner.attribute with a wrapper of it, keeping the original (which, for a class, may be a staticmethod
+    or classmethod) so that disable can restore it exactly.
+    """
+    original = owner.__dict__[attribute]
+    if isinstance(original, (staticmethod, classmethod)):
+        replacement = original.__class__(wrap(original.__func__))
+    else:
+        replacement = wrap(original)
+    _originals.append((owner, attribute, original))
+    setattr(owner, attribute, replacement)
+
+
+def _rows(result) -> int:
+    return len(result)
+
+
+def _column_rows(result) -> int:
+    return len(result[0])
+
+
+def enable(timing: bool = False) -> None:
+    """
+    Start counting (and, if timing is True, timing) the instrumented operations. The counts are not reset;
+    see reset.
+    """
+    global _timing
+    disable()
+    _timing = timing
+    for owner, attribute, name, rows in [
+        (CalmarendianDate, "sanitized_adr", "sanitized_adr", None),
+        (CalmarendianDate, "elements_from_adr", "decode.elements_from_adr", None),
+        (bulk, "numbers_from_adrs", "decode.numbers_from_adrs", _column_rows),
+        (CalmarendianDate, "_rendered_grand_cycle_notation", "render.gcn", None),
+        (CalmarendianDate, "_rendered_common_symbolic_notation", "render.csn", None),
+        (CalmarendianDate, "colloquial_date", "render.colloquial", None),
+        (date_format, "formatted", "render.strftime", None),
+        (bulk, "grand_cycle_notations", "render.bulk_gcn", _rows),
+        (bulk, "common_symbolic_notations", "render.bulk_csn", _rows),
+        (bulk, "colloquial_dates", "render.bulk_colloquial", _rows),
+    ]:
+        _replace(owner, attribute, lambda function: _counted(function, name, rows))
+    _replace(DateString, "parsed", _counted_parse)
+    _originals.append((CalmarendianDateError, "__init__", None))
+    CalmarendianDateError.__init__ = _counted_exception_init
+
+
+def disable() -> None:
+    """
+    Stop counting, restoring the original, uninstrumented functions and methods. The counts are kept.
+    """
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        if original is None:
+            delattr(owner, attribute)
+        else:
+            setattr(owner, attribute, original)
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def reset() -> None:
+    """
+    Set all the counts and accumulated times to zero.
+    """
+    _counts.clear()
+    _seconds.clear()
+
+
+def snapshot() -> Snapshot:
+    """
+    Return a copy of the current counts and accumulated seconds of each operation which has been counted.
+    """
+    return Snapshot(dict(_counts), dict(_seconds))
+
+
+@contextmanager
+def instrumented(timing: bool = False) -> Iterator[Recording]:
+    """
+    Count (and, if timing is True, time) the instrumented operations within a with block, yielding a Recording
+    which holds what was counted once the block exits. The counts are reset when the block is entered and
+    instrumentation is disabled again when it exits.
+    """
+    recording = Recording()
+    reset()
+    enable(timing)
+    try:
+        yield recording
+    finally:
+        disable()
+        recording.counts, recording.seconds = snapshot()
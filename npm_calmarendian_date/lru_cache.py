@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(object):
+    """
+    The LRUCache Class
+
+    A bounded mapping which, once full, evicts its least recently used entry to make room for each new one.
+    It counts hits, misses and evictions in the manner of functools.lru_cache, but, unlike functools.lru_cache,
+    it is an object in its own right so it can be switched on and off, resized or inspected at run time.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        :param maxsize: The maximum number of entries the cache will hold; must be at least one.
+        """
+        if maxsize < 1:
+            raise CalmarendianDateDomainError(f"CACHE SIZE: {maxsize} is out of range; must be at least 1.")
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the entry for the given key, marking it as the most recently used, or None if there is no such entry.
+        """
+        try:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add (or replace) the entry for the given key, evicting the least recently used entry if the cache is full.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Discard every entry and reset the statistics.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the cache's statistics: hits, misses, evictions, maximum size and current size.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
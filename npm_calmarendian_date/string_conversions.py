@@ -2,8 +2,15 @@ import warnings
 
 from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateFormatError
 from npm_calmarendian_date.c_date_config import CDateConfig
-from typing import Tuple, Match
-from math import ceil
+from typing import Dict, List, Optional, Tuple
+
+# Lookup tables mapping each permitted (ASCII) field of a date string onto its value:
+# a single dictionary lookup both checks the field and converts it.
+_GRAND_CYCLE_FIELDS: Dict[str, int] = {f"{n:02}": n for n in range(100)}  # \d{2}
+_CYCLE_FIELDS: Dict[str, int] = {f"{n:03}": n for n in range(800)}  # [0-7]\d{2}
+_SEASON_FIELDS: Dict[str, int] = {f"{n}": n for n in range(1, 8)}  # [1-7]
+_WEEK_FIELDS: Dict[str, int] = {f"{n:02}": n for n in range(60)}  # [0-5]\d
+_DAY_FIELDS: Dict[str, int] = {f"{n}": n for n in range(1, 9)}  # [1-8]
 
 
 class DateString(object):
@@ -12,33 +19,34 @@ class DateString(object):
 
     A class that will take a date string in Grand Cycle Notation or Common Symbolic Notation format and parse it into
     a five-tuple suitable for instantiating a CalmarendianDate object via its from_numbers method.
+
+    The formats are defined by the RegExs CDateConfig.GCN_DATE_STRING_RE and CDateConfig.CSN_DATE_STRING_RE but
+    ASCII date strings are parsed by a single-pass scanner instead: a GCN date string has four dashes and a CSN date
+    string three, so splitting on the dashes tells one from the other, and each field is then checked and converted
+    with a single table lookup. Only non-ASCII strings (which could be valid by virtue of the RegExs accepting any
+    Unicode decimal digit as a \\d) are matched against the RegExs.
     """
     NumericGCNSequence = Tuple[int, int, int, int, int]
+    RawCSNSequence = Tuple[int, int, int, int, Optional[str]]
+
+    ERA_MARKERS = frozenset(["BZ", "BH", "CE"])
 
     def __init__(self, date_string: str):
         """
         Constructor
 
-        Attempts to match the given date string against the RegEx for a GCN or CSN date string.
-        Raises an exception if the given date string does not match either format
-        otherwise the Match object is passed to the relevant parser to extract the date's numeric GCN
-        elements. NOTE: beyond RegEx matching, this method performs no other error checking.
+        Attempts to scan the given date string as a GCN or CSN date string and extract the date's numeric GCN
+        elements. Raises an exception if the given date string does not conform to either format.
+        NOTE: beyond checking the format, this method performs no other error checking.
+
+        If the era marker of a CSN date string is incompatible with its cycle number, a UserWarning is issued
+        and its message kept as the instance's warning attribute (which is None otherwise).
 
         :param date_string: A date string which should conform to either GCN or CSN format rules.
         """
-        try:
-            pattern_match = CDateConfig.GCN_DATE_STRING_RE.match(date_string)
-        except TypeError:
-            raise CalmarendianDateError(f"DATE STRING: {date_string.__class__} cannot be parsed as a date string.")
-
-        if pattern_match:
-            self.gc, self.c, self.s, self.w, self.d = self.parsed_gcn_date(pattern_match)
-        else:
-            pattern_match = CDateConfig.CSN_DATE_STRING_RE.match(date_string)
-            if pattern_match:
-                self.gc, self.c, self.s, self.w, self.d = self.parsed_csn_date(pattern_match)
-            else:
-                raise CalmarendianDateFormatError(f"DATE STRING: '{date_string}' is an invalid date string.")
+        (self.gc, self.c, self.s, self.w, self.d), self.warning = self.parsed(date_string)
+        if self.warning:
+            warnings.warn(self.warning, category=UserWarning, stacklevel=2)
 
     def elements(self) -> NumericGCNSequence:
         """
@@ -46,41 +54,126 @@ class DateString(object):
         """
         return self.gc, self.c, self.s, self.w, self.d
 
-    @staticmethod
-    def parsed_gcn_date(m: Match) -> NumericGCNSequence:
+    @classmethod
+    def parsed(cls, date_string: str) -> Tuple[NumericGCNSequence, Optional[str]]:
+        """
+        Return the numeric GCN elements of the given date string together with the message of the warning that
+        should be issued about its era marker (or None), raising an exception if the date string does not conform
+        to either format. No warning is actually issued: that is left to the caller.
+
+        :param date_string: A date string which should conform to either GCN or CSN format rules.
+        """
+        if not isinstance(date_string, str):
+            raise CalmarendianDateError(f"DATE STRING: {date_string.__class__} cannot be parsed as a date string.")
+
+        if date_string.isascii():
+            # As with the RegEx '$' anchor, a single trailing newline is permitted.
+            fields = (date_string[:-1] if date_string[-1:] == "\n" else date_string).split("-")
+            if len(fields) == 5:
+                gc = _GRAND_CYCLE_FIELDS.get(fields[0])
+                c = _CYCLE_FIELDS.get(fields[1])
+                s = _SEASON_FIELDS.get(fields[2])
+                w = _WEEK_FIELDS.get(fields[3])
+                d = _DAY_FIELDS.get(fields[4])
+                if not (gc is None or c is None or s is None or w is None or d is None):
+                    return (gc, c, s, w, d), None
+                raw_csn = None
+            elif len(fields) == 4:
+                raw_csn = cls.scanned_csn_date(fields)
+            else:
+                raw_csn = None
+        else:
+            gcn = cls.matched_gcn_date(date_string)
+            if gcn is not None:
+                return gcn, None
+            raw_csn = cls.matched_csn_date(date_string)
+
+        if raw_csn is None:
+            raise CalmarendianDateFormatError(f"DATE STRING: '{date_string}' is an invalid date string.")
+        c, s, w, d, era = raw_csn
+        if era is None:
+            gc = -(-c // 700)
+            return (gc, c + 700 * (1 - gc), s, w, d), None
+        gc, cycle = cls.gcn_cycle(c, era)
+        return (gc, cycle, s, w, d), cls.era_marker_warning(c, era)
+
+    @classmethod
+    def scanned_csn_date(cls, fields: List[str]) -> Optional[RawCSNSequence]:
         """
-        Extract the numeric date elements from the given Match object.
+        Return the raw elements of an ASCII CSN date string (cccc-s-ww-d EM) - the unsigned cycle number,
+        the season, week and day numbers and the upper-cased era marker (if any) - or None if it is not one.
 
-        :param m: A Match object which should already have matched against
-        the RegEx for a GCN date string.
-        :return: A five-tuple of GCN date elements.
+        :param fields: The four dash-separated fields of the date string.
+        :return: A five-tuple of cycle, season, week, day and era marker.
+        """
+        c, last = fields[0], fields[3]
+        s = _SEASON_FIELDS.get(fields[1])
+        w = _WEEK_FIELDS.get(fields[2])
+        d = _DAY_FIELDS.get(last[:1])
+        if (
+                s is None or w is None or d is None
+                or not c.isdigit() or not (len(c) == 3 or (len(c) == 4 and c[0] != "0"))
+        ):
+            return None
+        if len(last) == 1:
+            return int(c), s, w, d, None
+        era = last[1:].lstrip(" ").upper()
+        if era and era not in cls.ERA_MARKERS:
+            return None
+        return int(c), s, w, d, era or None
+
+    @staticmethod
+    def matched_gcn_date(date_string: str) -> Optional[NumericGCNSequence]:
         """
+        Return the numeric date elements of a GCN date string matched by RegEx, or None if it does not match.
+        """
+        m = CDateConfig.GCN_DATE_STRING_RE.match(date_string)
+        if m is None:
+            return None
         return int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)), int(m.group(5))
 
     @staticmethod
-    def parsed_csn_date(m: Match) -> NumericGCNSequence:
+    def matched_csn_date(date_string: str) -> Optional[RawCSNSequence]:
+        """
+        Return the raw elements of a CSN date string matched by RegEx, or None if it does not match.
         """
-        Return the numeric date elements from the given Match object.
+        m = CDateConfig.CSN_DATE_STRING_RE.match(date_string)
+        if m is None:
+            return None
+        era = m.group(5).upper() if m.group(5) else None
+        return int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)), era
+
+    @staticmethod
+    def gcn_cycle(c: int, era: Optional[str]) -> Tuple[int, int]:
+        """
+        Return the grand cycle and cycle-in-grand-cycle numbers for the cycle of a CSN date string.
 
         Note that the process uses the date's era marker, if set to BZ, to negate the cycle value but
-        otherwise the era marker has no effect on the parsing process. A warning is raised, however, if
-        the era marker is incompatible with the given cycle number.
-        
-        :param m: A Match object which should already have matched against
-        the RegEx for a CSN date string.
-        :return: A five-tuple of GCN date elements.
-        """
-        c = int(m.group(1))
-        if m.group(5):
-            era = m.group(5).upper()
-            if era == "BZ":
-                c = -c
-            elif era == "CE" and c < 501:
-                warnings.warn(f"DATE STRING: Cycle {c} is not in Current Era", category=UserWarning, stacklevel=3)
-            elif era == "BH" and c > 500:
-                warnings.warn(f"DATE STRING: Cycle {c} is not Before History", category=UserWarning, stacklevel=3)
-            elif era == "BH" and c == 0:
-                warnings.warn(f"DATE STRING: Cycle 0 Era is BZ, not BH", category=UserWarning, stacklevel=3)
-        gc = ceil(c / 700)
-        c += 700 * (1 - gc)
-        return gc, c, int(m.group(2)), int(m.group(3)), int(m.group(4))
+        otherwise the era marker has no effect on the parsing process.
+
+        :param c: The (unsigned) cycle number of the CSN date string.
+        :param era: The upper-cased era marker of the CSN date string, if there is one.
+        """
+        if era == "BZ":
+            c = -c
+        gc = -(-c // 700)
+        return gc, c + 700 * (1 - gc)
+
+    @staticmethod
+    def era_marker_warning(c: int, era: Optional[str]) -> Optional[str]:
+        """
+        Return a warning message if the era marker of a CSN date string is incompatible with its cycle number;
+        return None otherwise.
+
+        :param c: The (unsigned) cycle number of the CSN date string.
+        :param era: The era marker of the CSN date string, if there is one.
+        """
+        if era:
+            era = era.upper()
+            if era == "CE" and c < 501:
+                return f"DATE STRING: Cycle {c} is not in Current Era"
+            if era == "BH" and c > 500:
+                return f"DATE STRING: Cycle {c} is not Before History"
+            if era == "BH" and c == 0:
+                return "DATE STRING: Cycle 0 Era is BZ, not BH"
+        return None
@@ -1,4 +1,41 @@
-from typing import Union
+from math import isfinite
+from typing import Tuple, Union
+
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateRangeError
+
+MICROSECONDS_per_SECOND = CDateConfig.MICROSECONDS_per_SECOND
+MICROSECONDS_per_DAY = CDateConfig.SECONDS_per_DAY * MICROSECONDS_per_SECOND
+
+# The (inclusive) bounds of the total number of microseconds in a time delta.
+MIN_MICROSECONDS = -CDateConfig.MAX_DELTA_DAYS * MICROSECONDS_per_DAY
+MAX_MICROSECONDS = CDateConfig.MAX_DELTA_DAYS * MICROSECONDS_per_DAY - 1
+
+# The number of microseconds in one unit of each of the constructor's components:
+# days, hours, minutes, seconds, milliseconds and microseconds.
+COMPONENT_MICROSECONDS = (
+    MICROSECONDS_per_DAY,
+    CDateConfig.SECONDS_per_HOUR * MICROSECONDS_per_SECOND,
+    CDateConfig.SECONDS_per_MINUTE * MICROSECONDS_per_SECOND,
+    MICROSECONDS_per_SECOND,
+    1000,
+    1
+)
+
+
+def rounded_quotient(numerator: int, denominator: int) -> int:
+    """
+    Return numerator / denominator rounded to the nearest integer, with halves rounded to even,
+    using integer arithmetic alone.
+    """
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    remainder *= 2
+    if remainder > denominator or (remainder == denominator and quotient & 1):
+        quotient += 1
+    return quotient
 
 
 class CalmarendianTimeDelta(object):
@@ -6,9 +43,15 @@ class CalmarendianTimeDelta(object):
     A CalmarendianTimeDelta object is a measure of time duration which is the difference between
     two date, date-time or time objects to a resolution of one microsecond - one one-millionth of a second.
     Its primary purpose is to add and subtract such durations from a given date/time object.
+
+    The duration is held as a single exact integer number of microseconds, from which the normalized days, seconds
+    and microseconds components are derived on demand. Arithmetic is therefore exact integer arithmetic: float
+    operands are converted exactly and only the final result is rounded (half to even) to the nearest microsecond.
     """
     RealNumber = Union[int, float]
 
+    __slots__ = ('_microseconds',)
+
     def __init__(
             self,
             *,
@@ -44,4 +87,219 @@ class CalmarendianTimeDelta(object):
         represented as (days = -1, seconds = 65535, microseconds = 999999) which could be thought of as one day back,
         65,535.999999 seconds forward.
         """
+        components = (days, hours, minutes, seconds, milliseconds, microseconds)
+        if all(type(component) is int for component in components):
+            total = ((
+                days * CDateConfig.SECONDS_per_DAY
+                + hours * CDateConfig.SECONDS_per_HOUR
+                + minutes * CDateConfig.SECONDS_per_MINUTE
+                + seconds
+            ) * 1000 + milliseconds) * 1000 + microseconds
+        else:
+            # Sum the exact values of the components: every float is an integer over a power of two, so the
+            # common denominator is simply the largest of them.
+            numerator, denominator = 0, 1
+            for component, factor in zip(components, COMPONENT_MICROSECONDS):
+                n, d = self.exact_ratio(component)
+                if d > denominator:
+                    numerator, denominator = numerator * (d // denominator), d
+                numerator += n * factor * (denominator // d)
+            total = rounded_quotient(numerator, denominator)
+        self._microseconds = self.verified_microseconds(total)
+
+    @classmethod
+    def _from_microseconds(cls, microseconds: int) -> 'CalmarendianTimeDelta':
+        """
+        Create a CalmarendianTimeDelta object directly from an integer number of microseconds,
+        raising an exception if it is out of range.
+        """
+        if not MIN_MICROSECONDS <= microseconds <= MAX_MICROSECONDS:
+            cls.verified_microseconds(microseconds)
+        delta = object.__new__(cls)
+        delta._microseconds = microseconds
+        return delta
+
+    @staticmethod
+    def verified_microseconds(microseconds: int) -> int:
+        """
+        Return the total number of microseconds unaltered if the days component of the duration is within bounds;
+        raise an exception otherwise.
+        """
+        if MIN_MICROSECONDS <= microseconds <= MAX_MICROSECONDS:
+            return microseconds
+        raise CalmarendianDateRangeError(
+            f"TIME DELTA: {microseconds // MICROSECONDS_per_DAY} days is out of range. "
+            f"Must be at least {-CDateConfig.MAX_DELTA_DAYS} and less than {CDateConfig.MAX_DELTA_DAYS}."
+        )
+
+    @staticmethod
+    def exact_ratio(value: RealNumber) -> Tuple[int, int]:
+        """
+        Return the exact value of an integer or float as a (numerator, denominator) pair;
+        raise an exception for anything else, including infinities and NaNs.
+        """
+        if isinstance(value, int):
+            return value, 1
+        if not isinstance(value, float):
+            raise CalmarendianDateError(f"TIME DELTA: {value.__class__} cannot be used as a number.")
+        if not isfinite(value):
+            raise CalmarendianDateDomainError(f"TIME DELTA: {value} is not a finite number.")
+        return value.as_integer_ratio()
+
+    # -- normalized components -- #
+
+    @property
+    def days(self) -> int:
+        return self._microseconds // MICROSECONDS_per_DAY
+
+    @property
+    def seconds(self) -> int:
+        return self._microseconds % MICROSECONDS_per_DAY // MICROSECONDS_per_SECOND
+
+    @property
+    def microseconds(self) -> int:
+        return self._microseconds % MICROSECONDS_per_SECOND
+
+    def components(self) -> Tuple[int, int, int]:
+        """
+        Return the normalized days, seconds and microseconds components of the duration as a three-tuple.
+        """
+        days, microseconds = divmod(self._microseconds, MICROSECONDS_per_DAY)
+        return (days,) + divmod(microseconds, MICROSECONDS_per_SECOND)
+
+    def total_seconds(self) -> float:
+        """
+        Return the total number of seconds in the duration, as the float nearest to the exact value.
+        """
+        return self._microseconds / MICROSECONDS_per_SECOND
+
+    # -- arithmetic -- #
+
+    def __add__(self, other):
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._from_microseconds(self._microseconds + other._microseconds)
+
+    def __sub__(self, other):
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._from_microseconds(self._microseconds - other._microseconds)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return self._from_microseconds(self._microseconds * other)
+        if isinstance(other, float):
+            numerator, denominator = self.exact_ratio(other)
+            return self._from_microseconds(rounded_quotient(self._microseconds * numerator, denominator))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if isinstance(other, CalmarendianTimeDelta):
+            return self._microseconds // other._microseconds
+        if isinstance(other, int):
+            return self._from_microseconds(self._microseconds // other)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, CalmarendianTimeDelta):
+            return self._microseconds / other._microseconds
+        if isinstance(other, int):
+            return self._from_microseconds(rounded_quotient(self._microseconds, other))
+        if isinstance(other, float):
+            numerator, denominator = self.exact_ratio(other)
+            return self._from_microseconds(rounded_quotient(self._microseconds * denominator, numerator))
+        return NotImplemented
+
+    def __mod__(self, other):
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._from_microseconds(self._microseconds % other._microseconds)
+
+    def __divmod__(self, other):
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        quotient, remainder = divmod(self._microseconds, other._microseconds)
+        return quotient, self._from_microseconds(remainder)
+
+    def __neg__(self) -> 'CalmarendianTimeDelta':
+        return self._from_microseconds(-self._microseconds)
+
+    def __pos__(self) -> 'CalmarendianTimeDelta':
+        return self
+
+    def __abs__(self) -> 'CalmarendianTimeDelta':
+        return self if self._microseconds >= 0 else -self
+
+    def __bool__(self) -> bool:
+        return self._microseconds != 0
+
+    # -- comparison and hashing -- #
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds == other._microseconds
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds != other._microseconds
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds < other._microseconds
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds <= other._microseconds
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds > other._microseconds
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, CalmarendianTimeDelta):
+            return NotImplemented
+        return self._microseconds >= other._microseconds
+
+    def __hash__(self) -> int:
+        return hash(self._microseconds)
+
+    # -- pickling and copying -- #
+
+    def __reduce__(self):
+        return self._from_microseconds, (self._microseconds,)
+
+    # -- str and repr -- #
+
+    def __str__(self) -> str:
+        """
+        Return the duration as [D day[s], ]H:MM:SS[.UUUUUU], as for the Gregorian timedelta class.
+        Note that a Calmarendian day lasts 18:12:16.
+        """
+        days, seconds, microseconds = self.components()
+        hours, seconds = divmod(seconds, CDateConfig.SECONDS_per_HOUR)
+        minutes, seconds = divmod(seconds, CDateConfig.SECONDS_per_MINUTE)
+        text = f"{hours}:{minutes:02}:{seconds:02}"
+        if microseconds:
+            text += f".{microseconds:06}"
+        if days:
+            text = f"{days} day{'' if abs(days) == 1 else 's'}, {text}"
+        return text
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(
+            f"{name}={value}" for name, value in zip(("days", "seconds", "microseconds"), self.components()) if value
+        )
+        return f"CalmarendianTimeDelta({arguments})"
+
 
+# The most negative and most positive durations, and the smallest difference between unequal durations.
+CalmarendianTimeDelta.min = CalmarendianTimeDelta._from_microseconds(MIN_MICROSECONDS)
+CalmarendianTimeDelta.max = CalmarendianTimeDelta._from_microseconds(MAX_MICROSECONDS)
+CalmarendianTimeDelta.resolution = CalmarendianTimeDelta._from_microseconds(1)
@@ -45,21 +45,12 @@ class ARTest(unittest.TestCase):
                 d = CalmarendianDate(item['adr'])
                 self.assertEqual(item['apocalypse_reckoning'], d.apocalypse_reckoning)
 
-    def test_ar_setter(self):
-        for item in self.data:
-            with self.subTest(i=item['apocalypse_reckoning']):
-                d = CalmarendianDate.from_date_string('777-7-07-7')
-                d.apocalypse_reckoning = item['apocalypse_reckoning']
-                self.assertEqual(item['apocalypse_reckoning'], d.apocalypse_reckoning)
-                self.assertEqual(item['adr'], d.adr)
-
-    def test_ar_setter_with_duff_data(self):
-        with self.assertRaises(CalmarendianDateError):
-            d = CalmarendianDate.from_date_string('777-7-07-7')
-            d.apocalypse_reckoning = -3_624_850
-        with self.assertRaises(CalmarendianDateError):
-            d = CalmarendianDate.from_date_string('777-7-07-7')
-            d.apocalypse_reckoning = 168_185_251
+    def test_ar_is_read_only(self):
+        d = CalmarendianDate.from_date_string('777-7-07-7')
+        with self.assertRaises(AttributeError):
+            d.apocalypse_reckoning = 1
+        self.assertEqual(35, d.apocalypse_reckoning)
+        self.assertEqual('777-7-07-7', d.csn())
 
     def test_today(self):
         d: CalmarendianDate = CalmarendianDate.today()
@@ -0,0 +1,184 @@
+import random
+import re
+import unittest
+from unittest import mock
+from array import array
+
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateFormatError
+
+
+class ADRFromNumbersTests(unittest.TestCase):
+    def test_agrees_with_from_numbers(self):
+        rng = random.Random(777)
+        adrs = [CDateConfig.MIN_ADR, 0, 1, 1_906_749, CDateConfig.MAX_ADR]
+        adrs += [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(5000)]
+        for adr in adrs:
+            with self.subTest(adr=adr):
+                self.assertEqual(adr, bulk.adr_from_numbers(*CalmarendianDate.numbers_from_adr(adr)))
+
+    def test_invalid_numbers(self):
+        data = [
+            (100, 1, 1, 1, 1),
+            (2, 701, 1, 1, 1),
+            (2, 77, 0, 1, 1),
+            (2, 77, 6, 51, 1),
+            (2, 77, 7, 51, 8),
+            (2, 78, 7, 51, 5),
+            (2, 78, 7, 50, 8),
+        ]
+        for numbers in data:
+            with self.subTest(numbers=numbers):
+                with self.assertRaises(CalmarendianDateError) as expected:
+                    CalmarendianDate.from_numbers(*numbers)
+                with self.assertRaisesRegex(CalmarendianDateError, re.escape(str(expected.exception))):
+                    bulk.adr_from_numbers(*numbers)
+
+
+class ParseManyTests(unittest.TestCase):
+    def test_agrees_with_from_date_string(self):
+        date_strings = [
+            '00-001-1-01-1', '02-077-7-07-7', '99-700-7-51-8', '699-1-01-1 BZ', '000-7-51-8 bz', '001-1-01-1 BH',
+            '777-7-03-1', '777-7-51-7 CE', '9999-7-51-4', '1400-7-51-8\n',
+        ]
+        adrs = CalmarendianDate.parse_many(date_strings)
+        self.assertIsInstance(adrs, array)
+        self.assertEqual(bulk.ADR_TYPECODE, adrs.typecode)
+        self.assertListEqual([CalmarendianDate.from_date_string(s).adr for s in date_strings], adrs.tolist())
+
+    def test_accepts_any_iterable(self):
+        adrs = CalmarendianDate.parse_many(s.strip() for s in ['777-7-03-1\n', '777-7-03-2\n'])
+        self.assertListEqual([1_906_750, 1_906_751], adrs.tolist())
+        self.assertEqual(0, len(CalmarendianDate.parse_many([])))
+
+    def test_invalid_date_strings(self):
+        with self.assertRaises(CalmarendianDateFormatError):
+            CalmarendianDate.parse_many(['777-7-03-1', '777-7-03'])
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianDate.parse_many(['02-778-7-51-5'])
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianDate.parse_many([777])
+
+    def test_dubious_era_markers(self):
+        with self.assertWarnsRegex(UserWarning, "Current Era"):
+            adrs = CalmarendianDate.parse_many(['400-1-23-4 CE'])
+        self.assertEqual(CalmarendianDate.from_numbers(1, 400, 1, 23, 4).adr, adrs[0])
+
+    def test_no_date_objects(self):
+        with mock.patch.object(CalmarendianDate, '_from_verified_objects') as factory:
+            CalmarendianDate.parse_many(['777-7-03-1', '02-077-7-03-1'])
+        factory.assert_not_called()
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_as_numpy(self):
+        adrs = CalmarendianDate.parse_many(['777-7-03-1', '000-7-51-8 BZ'], as_numpy=True)
+        self.assertIsInstance(adrs, bulk.numpy.ndarray)
+        self.assertListEqual([1_906_750, 0], adrs.tolist())
+
+    @unittest.skipIf(bulk.numpy is not None, "NumPy is installed")
+    def test_as_numpy_without_numpy(self):
+        with self.assertRaisesRegex(ImportError, "NumPy"):
+            CalmarendianDate.parse_many(['777-7-03-1'], as_numpy=True)
+
+
+class NumbersFromADRsTests(unittest.TestCase):
+    @staticmethod
+    def sample_adrs():
+        rng = random.Random(700)
+        adrs = list(range(-2460, 2460)) + list(range(CDateConfig.MIN_ADR, CDateConfig.MIN_ADR + 20))
+        adrs += list(range(CDateConfig.MAX_ADR - 2470, CDateConfig.MAX_ADR + 1))
+        adrs += [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(5000)]
+        return adrs
+
+    def assertColumnsMatch(self, adrs, columns):
+        self.assertEqual(5, len(columns))
+        rows = list(zip(*(column.tolist() for column in columns)))
+        self.assertListEqual([CalmarendianDate.numbers_from_adr(adr) for adr in adrs], rows)
+
+    def test_pure_python(self):
+        adrs = self.sample_adrs()
+        columns = CalmarendianDate.numbers_from_adrs(array(bulk.ADR_TYPECODE, adrs))
+        self.assertTrue(all(isinstance(column, array) for column in columns))
+        self.assertColumnsMatch(adrs, columns)
+        self.assertColumnsMatch(adrs, CalmarendianDate.numbers_from_adrs(iter(adrs)))
+
+    def test_empty(self):
+        self.assertTrue(all(len(column) == 0 for column in CalmarendianDate.numbers_from_adrs([])))
+
+    def test_out_of_range(self):
+        for adr in [CDateConfig.MIN_ADR - 1, CDateConfig.MAX_ADR + 1]:
+            with self.subTest(adr=adr):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {adr} is out of range"):
+                    CalmarendianDate.numbers_from_adrs([1, adr])
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        adrs = self.sample_adrs()
+        columns = CalmarendianDate.numbers_from_adrs(bulk.numpy.array(adrs))
+        self.assertTrue(all(isinstance(column, bulk.numpy.ndarray) for column in columns))
+        self.assertColumnsMatch(adrs, columns)
+        self.assertTrue(all(len(column) == 0 for column in CalmarendianDate.numbers_from_adrs(bulk.numpy.array([]))))
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy_out_of_range(self):
+        for adr in [CDateConfig.MIN_ADR - 1, CDateConfig.MAX_ADR + 1]:
+            with self.subTest(adr=adr):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {adr} is out of range"):
+                    CalmarendianDate.numbers_from_adrs(bulk.numpy.array([1, adr]))
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy_agrees_with_pure_python(self):
+        adrs = bulk.numpy.arange(CDateConfig.MIN_ADR, CDateConfig.DAYS_per_GRAND_CYCLE, 7)
+        for vectorized, pure in zip(bulk.numbers_from_adrs(adrs), bulk.numbers_from_adrs(adrs.tolist())):
+            self.assertListEqual(pure.tolist(), vectorized.tolist())
+
+
+class BulkFormattingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(777)
+        cls.adrs = list(range(-2460, 2460)) + list(range(CDateConfig.MIN_ADR, CDateConfig.MIN_ADR + 20))
+        cls.adrs += list(range(CDateConfig.MAX_ADR - 2470, CDateConfig.MAX_ADR + 1))
+        cls.adrs += [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(5000)]
+        cls.dates = [CalmarendianDate(adr) for adr in cls.adrs]
+
+    def test_grand_cycle_notations(self):
+        self.assertListEqual([d.grand_cycle_notation() for d in self.dates], bulk.grand_cycle_notations(self.adrs))
+
+    def test_common_symbolic_notations(self):
+        for era_marker in [None, 'bh', 'BH', 'ce', 'CE', 'AD']:
+            with self.subTest(era_marker=era_marker):
+                self.assertListEqual(
+                    [d.common_symbolic_notation(era_marker) for d in self.dates],
+                    bulk.common_symbolic_notations(self.adrs, era_marker)
+                )
+
+    def test_colloquial_dates(self):
+        for era_marker in [None, 'BH', 'ce']:
+            for verbose in [False, True]:
+                with self.subTest(era_marker=era_marker, verbose=verbose):
+                    self.assertListEqual(
+                        [d.colloquial_date(era_marker=era_marker, verbose=verbose) for d in self.dates],
+                        bulk.colloquial_dates(self.adrs, era_marker=era_marker, verbose=verbose)
+                    )
+
+    def test_out_of_range(self):
+        with self.assertRaises(CalmarendianDateDomainError):
+            bulk.grand_cycle_notations([CDateConfig.MAX_ADR + 1])
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        adrs = bulk.numpy.array(self.adrs)
+        self.assertListEqual(bulk.grand_cycle_notations(self.adrs), bulk.grand_cycle_notations(adrs))
+        self.assertListEqual(bulk.common_symbolic_notations(self.adrs), bulk.common_symbolic_notations(adrs))
+        self.assertListEqual(
+            bulk.colloquial_dates(self.adrs, era_marker='CE', verbose=True),
+            bulk.colloquial_dates(adrs, era_marker='CE', verbose=True)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,16 @@
 import unittest
+import warnings
 from collections import namedtuple
+from math import floor
 
-from npm_calmarendian_date.calmarendian_date import CalmarendianDate, EraMarker
-from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day
-from npm_calmarendian_date.exceptions import CalmarendianDateError
+from npm_calmarendian_date.calmarendian_date import CalmarendianDate, EraMarker, OverflowPolicy
+from npm_calmarendian_date.time_delta import CalmarendianTimeDelta
+from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day, CYCLE_DAYS_PRIOR
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateValueError
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateRangeError
 from npm_calmarendian_date.c_date_config import CDateConfig
 from typing import Any
+from unittest import mock
 
 
 class BasicADRTests(unittest.TestCase):
@@ -31,9 +36,10 @@ class BasicADRTests(unittest.TestCase):
         d = CalmarendianDate(1_234_567)
         self.assertEqual(1_234_567, d.adr)
         self.assertEqual('Wednesday, Week 50 of Onset 503', d.colloquial_date())
-        d.adr = 1_234_568
-        self.assertEqual(1_234_568, d.adr)
-        self.assertEqual('Thursday, Week 50 of Onset 503', d.colloquial_date())
+        with self.assertRaises(AttributeError):
+            d.adr = 1_234_568
+        self.assertEqual(1_234_567, d.adr)
+        self.assertEqual('Wednesday, Week 50 of Onset 503', d.colloquial_date())
 
     def test_cycle_decode(self):
         items = [
@@ -49,6 +55,37 @@ class BasicADRTests(unittest.TestCase):
         for item in items:
             self.assertEqual(item["cycle"], CalmarendianDate.cycle_decode(item["days"]))
 
+    def test_cycle_decode_against_linear_probe(self):
+        # The original decoder: guess a cycle from the average cycle length then probe forward.
+        def linear_probe(days: int) -> int:
+            cycle = floor(days / CDateConfig.DAYS_per_CYCLE)
+            while cycle < 700 and CycleInGrandCycle(cycle + 1).days_prior() < days:
+                cycle += 1
+            return cycle
+
+        # Both decoders are step functions of the residual day count, so it is sufficient to compare them either
+        # side of every cycle boundary in the grand cycle.
+        boundaries = [CycleInGrandCycle(c).days_prior() for c in range(1, 701)] + [CDateConfig.DAYS_per_GRAND_CYCLE]
+        for boundary in boundaries:
+            for days in range(max(boundary - 2, 1), min(boundary + 3, CDateConfig.DAYS_per_GRAND_CYCLE + 1)):
+                with self.subTest(days=days):
+                    self.assertEqual(linear_probe(days), CalmarendianDate.cycle_decode(days))
+
+    def test_numbers_from_adr_at_cycle_boundaries(self):
+        for gc in (0, 2, 99):
+            for c in range(1, 701):
+                first = (gc - 1) * CDateConfig.DAYS_per_GRAND_CYCLE + (c - 1) * 2454 + (c - 1) // 7 * 3 + 1
+                festival_days = CycleInGrandCycle(c).festival_days()
+                last = first + 2449 + festival_days
+                decode = CalmarendianDate.numbers_from_adr
+                with self.subTest(gc=gc, c=c):
+                    self.assertTupleEqual((gc, c, 1, 1, 1), decode(first))
+                    self.assertTupleEqual((gc, c, 1, 50, 7), decode(first + 349))
+                    self.assertTupleEqual((gc, c, 2, 1, 1), decode(first + 350))
+                    self.assertTupleEqual((gc, c, 7, 50, 7), decode(last - festival_days))
+                    self.assertTupleEqual((gc, c, 7, 51, 1), decode(last - festival_days + 1))
+                    self.assertTupleEqual((gc, c, 7, 51, festival_days), decode(last))
+
     def test_basic_setting(self):
         data = [
             -5000,
@@ -188,6 +225,32 @@ class BasicADRTests(unittest.TestCase):
         self.assertEqual("777-3-04-5 CE", d.common_symbolic_notation(era_marker="ce"))
 
 
+class LazyDecompositionTests(unittest.TestCase):
+    def test_no_decoding_on_construction(self):
+        with mock.patch.object(CalmarendianDate, 'elements_from_adr', autospec=True) as decoder:
+            dates = sorted(CalmarendianDate(adr) for adr in (1_906_905, -5000, 1_906_903))
+            self.assertEqual([-5000, 1_906_903, 1_906_905], [d.adr for d in dates])
+            self.assertTrue(dates[0] < dates[1])
+            decoder.assert_not_called()
+
+    def test_elements_decoded_once(self):
+        d = CalmarendianDate(1_905_361)
+        with mock.patch.object(
+                CalmarendianDate, 'elements_from_adr', autospec=True, side_effect=CalmarendianDate.elements_from_adr
+        ) as decoder:
+            self.assertEqual("02-077-3-04-5", d.gcn())
+            self.assertEqual("777-3-04-5", d.csn())
+            self.assertEqual(3, d.season.number)
+            self.assertEqual(1, decoder.call_count)
+
+    def test_elements_cached_per_date(self):
+        d = CalmarendianDate(1_905_361)
+        e = CalmarendianDate(1_905_362)
+        self.assertEqual(5, d.day.number)
+        self.assertEqual(6, e.day.number)
+        self.assertIs(d.date_elements(), d.date_elements())
+
+
 class CreateFromFactoriesTests(unittest.TestCase):
     def test_create_from_objects(self):
         data = [
@@ -210,6 +273,33 @@ class CreateFromFactoriesTests(unittest.TestCase):
             self.assertEqual(item["result"]["gcn"], d.gcn())
             self.assertEqual(item["result"]["adr"], d.adr)
 
+    def test_create_from_inconsistent_objects(self):
+        gc, c, s1, s2, s7 = GrandCycle(1), CycleInGrandCycle(423), Season(1), Season(2), Season(7)
+        w23, w51 = Week(23, s1), Week(51, s7)
+        data = [
+            ("WEEK: week 23 of season 1 is inconsistent with season 2",
+             (gc, c, s2, w23, Day(4, w23, c))),
+            ("DAY: day 4 is inconsistent with week 51 of cycle 423",
+             (gc, c, s7, w51, Day(4, w23, c))),
+            ("DAY: day 8 is inconsistent with week 51 of cycle 423",
+             (gc, c, s7, w51, Day(8, w51, CycleInGrandCycle(700)))),
+        ]
+        for message, elements in data:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(CalmarendianDateValueError, message):
+                    CalmarendianDate.from_objects(*elements)
+
+    def test_create_from_numbers_without_decoding(self):
+        with mock.patch.object(CalmarendianDate, 'elements_from_adr', autospec=True) as decoder:
+            d = CalmarendianDate.from_numbers(2, 77, 7, 51, 7)
+            self.assertEqual(1_907_092, d.adr)
+            self.assertEqual("02-077-7-51-7", d.gcn())
+            self.assertIs(Week.interned(51, Season.interned(7)), d.week)
+            d = CalmarendianDate.from_date_string("777-7-03-1")
+            self.assertEqual(1, d.apocalypse_reckoning)
+            self.assertEqual("Monday, Week 3 of Onset 777", d.colloquial_date())
+            decoder.assert_not_called()
+
     def test_create_from_numbers(self):
         data = [
             {"input": (1, 423, 1, 23, 4),
@@ -264,6 +354,363 @@ class CreateFromFactoriesTests(unittest.TestCase):
             self.assertEqual(item["result"], d.adr)
 
 
+class DateRangeTests(unittest.TestCase):
+    def assert_range_matches_decoding(self, start: int, stop: int, step: int = 1):
+        dates = list(CalmarendianDate.range(start, stop, step))
+        self.assertEqual(list(range(start, stop, step)), [d.adr for d in dates])
+        for d in dates:
+            with self.subTest(adr=d.adr):
+                self.assertEqual(CalmarendianDate(d.adr).elements_from_adr(), d.date_elements())
+
+    def test_across_festivals_and_cycles(self):
+        # Cycles 6 and 7 (seven festival days) and Cycle 8 (four), stepping forwards and backwards.
+        start = CYCLE_DAYS_PRIOR[5] - 10
+        stop = CYCLE_DAYS_PRIOR[8] + 10
+        self.assert_range_matches_decoding(start, stop)
+        self.assert_range_matches_decoding(stop, start, -1)
+
+    def test_across_grand_cycles(self):
+        # Cycle 700 (eight festival days) and the turn of Grand Cycles 1 and 2.
+        boundary = CDateConfig.DAYS_per_GRAND_CYCLE
+        self.assert_range_matches_decoding(boundary - 20, boundary + 20)
+        self.assert_range_matches_decoding(boundary + 20, boundary - 20, -1)
+        self.assert_range_matches_decoding(-20, 20)
+
+    def test_large_steps(self):
+        self.assert_range_matches_decoding(CDateConfig.MIN_ADR, 3 * CDateConfig.DAYS_per_GRAND_CYCLE, 9_973)
+        self.assert_range_matches_decoding(CDateConfig.MAX_ADR, 0, -2_000_003)
+
+    def test_limits(self):
+        self.assert_range_matches_decoding(CDateConfig.MIN_ADR, CDateConfig.MIN_ADR + 10)
+        self.assert_range_matches_decoding(CDateConfig.MAX_ADR - 10, CDateConfig.MAX_ADR + 1)
+        self.assert_range_matches_decoding(CDateConfig.MAX_ADR, CDateConfig.MAX_ADR - 10, -1)
+        self.assertEqual([], list(CalmarendianDate.range(CDateConfig.MAX_ADR, CDateConfig.MAX_ADR + 100, -1)))
+
+    def test_date_arguments(self):
+        start = CalmarendianDate.from_date_string("777-7-50-1")
+        stop = CalmarendianDate.from_date_string("778-1-01-1")
+        dates = list(CalmarendianDate.range(start, stop))
+        self.assertEqual(start, dates[0])
+        self.assertEqual("777-7-51-7", dates[-1].csn())
+        self.assertEqual(14, len(dates))
+
+    def test_shared_elements(self):
+        first, second = CalmarendianDate.range(1, 3)
+        self.assertTrue(all(a is b for a, b in zip(first.date_elements()[:4], second.date_elements()[:4])))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDate.range(1, 10, 0)
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDate.range(CDateConfig.MIN_ADR - 1, 10)
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDate.range(CDateConfig.MAX_ADR - 1, CDateConfig.MAX_ADR + 3)
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDate.range(CDateConfig.MIN_ADR + 1, CDateConfig.MIN_ADR - 2, -1)
+        for stop in ["tomorrow", None, [10]]:
+            with self.subTest(stop=stop):
+                with self.assertRaisesRegex(CalmarendianDateError, "ADR: .* to an integer value"):
+                    CalmarendianDate.range(1, stop)
+        self.assertEqual(2, len(list(CalmarendianDate.range(1, "3"))))
+
+
+class DateArithmeticTests(unittest.TestCase):
+    def test_add_and_subtract_deltas(self):
+        d = CalmarendianDate.from_date_string("777-7-03-1")
+        data = [
+            (CalmarendianTimeDelta(days=1), "777-7-03-2"),
+            (CalmarendianTimeDelta(days=7), "777-7-04-1"),
+            (CalmarendianTimeDelta(days=-8), "777-7-01-7"),
+            (CalmarendianTimeDelta(days=357), "778-1-03-1"),
+            (CalmarendianTimeDelta(days=1, hours=18), "777-7-03-2"),
+            (CalmarendianTimeDelta(microseconds=-1), "777-7-02-7"),
+        ]
+        for delta, result in data:
+            with self.subTest(delta=repr(delta)):
+                self.assertEqual(result, (d + delta).csn())
+                self.assertEqual(result, (delta + d).csn())
+        self.assertEqual("777-7-01-7", (d - CalmarendianTimeDelta(days=8)).csn())
+        self.assertEqual("777-7-03-1", (d - CalmarendianTimeDelta(hours=18)).csn())
+
+    def test_subtract_dates(self):
+        d1 = CalmarendianDate.from_date_string("777-7-03-1")
+        d2 = CalmarendianDate.from_date_string("776-7-51-4")
+        self.assertEqual(CalmarendianTimeDelta(days=d1.adr - d2.adr), d1 - d2)
+        self.assertEqual(CalmarendianTimeDelta(days=d2.adr - d1.adr), d2 - d1)
+        self.assertEqual(d1, d2 + (d1 - d2))
+        self.assertEqual(CalmarendianTimeDelta(days=CDateConfig.MAX_ADR - CDateConfig.MIN_ADR),
+                         CalmarendianDate(CDateConfig.MAX_ADR) - CalmarendianDate(CDateConfig.MIN_ADR))
+
+    def test_shifted_elements(self):
+        # Shifts from decoded dates, within and across weeks, seasons, festivals, cycles and grand cycles.
+        starts = [1, 2_447, CYCLE_DAYS_PRIOR[6] + 2_452, CDateConfig.DAYS_per_GRAND_CYCLE - 3, CDateConfig.MIN_ADR]
+        for start in starts:
+            d = CalmarendianDate(start)
+            d.date_elements()
+            for days in (0, 1, 6, 7, 8, 349, 350, 2_455, 2_460, -1, -7, -350, -2_460):
+                if not CDateConfig.MIN_ADR <= start + days <= CDateConfig.MAX_ADR:
+                    continue
+                with self.subTest(adr=start, days=days):
+                    shifted = d.shifted(days)
+                    self.assertEqual(start + days, shifted.adr)
+                    self.assertEqual(CalmarendianDate(start + days).elements_from_adr(), shifted.date_elements())
+
+    def test_shifted_days_must_be_integers(self):
+        class Days(object):
+            def __index__(self):
+                return 3
+
+        d = CalmarendianDate(1_000_000)
+        shifted = d.shifted(Days())
+        self.assertIs(int, type(shifted.adr))
+        self.assertEqual(1_000_003, shifted.adr)
+        for days in (1.5, 2.0, "1", None):
+            with self.subTest(days=days):
+                with self.assertRaisesRegex(CalmarendianDateError, "DAYS: .* is not an integer"):
+                    d.shifted(days)
+
+    def test_shift_reuses_elements(self):
+        d = CalmarendianDate.from_date_string("777-7-03-1")
+        with mock.patch.object(CalmarendianDate, 'elements_from_adr') as decode:
+            shifted = d + CalmarendianTimeDelta(days=3)
+            self.assertEqual("777-7-03-4", shifted.csn())
+            decode.assert_not_called()
+        self.assertIs(d.season, shifted.season)
+        self.assertIs(d.week, shifted.week)
+
+    def test_shift_undecoded_date_stays_undecoded(self):
+        d = CalmarendianDate(1_000_000)
+        self.assertIsNone((d + CalmarendianTimeDelta(days=1))._elements)
+
+    def test_out_of_range(self):
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(CDateConfig.MAX_ADR) + CalmarendianTimeDelta(days=1)
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(CDateConfig.MIN_ADR) - CalmarendianTimeDelta(days=1)
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(CDateConfig.MIN_ADR).shifted(-1)
+
+    def test_unsupported_operands(self):
+        d = CalmarendianDate(1_000_000)
+        for other in (1, 1.0, "1"):
+            with self.subTest(other=other):
+                with self.assertRaises(TypeError):
+                    d + other
+                with self.assertRaises(TypeError):
+                    d - other
+        with self.assertRaises(TypeError):
+            d + d
+
+
+class CalendarUnitArithmeticTests(unittest.TestCase):
+    def test_add_weeks(self):
+        data = [
+            ("777-3-10-2", 1, "777-3-11-2"),
+            ("777-3-10-2", 40, "777-3-50-2"),
+            ("777-3-10-2", 41, "777-4-01-2"),
+            ("777-7-50-3", 1, "778-1-01-3"),
+            ("778-1-01-3", -1, "777-7-50-3"),
+            ("777-3-10-2", 350, "778-3-10-2"),
+            ("001-1-01-1", -1, "000-7-50-1 BZ"),
+            ("777-7-51-5", 1, "778-1-01-7"),
+        ]
+        for date, weeks, result in data:
+            with self.subTest(date=date, weeks=weeks):
+                self.assertEqual(result, CalmarendianDate.from_date_string(date).add_weeks(weeks).csn())
+
+    def test_add_weeks_skips_festivals(self):
+        d = CalmarendianDate.from_date_string("699-1-01-4")
+        for weeks in range(0, 2_000, 37):
+            with self.subTest(weeks=weeks):
+                later = d.add_weeks(weeks)
+                self.assertEqual(4, later.day.number)
+                self.assertNotEqual(51, later.week.number)
+                self.assertEqual(d, later.add_weeks(-weeks))
+
+    def test_add_seasons(self):
+        data = [
+            ("777-3-10-2", 1, "777-4-10-2"),
+            ("777-3-10-2", 5, "778-1-10-2"),
+            ("777-3-10-2", -3, "776-7-10-2"),
+            ("777-7-51-7", 7, "778-7-51-4"),
+            ("777-7-51-7", 49, "784-7-51-7"),
+            ("777-7-51-7", 1, "778-1-50-7"),
+            ("002-2-02-2", -7 * 2 - 1, "000-1-02-2 BZ"),
+        ]
+        for date, seasons, result in data:
+            with self.subTest(date=date, seasons=seasons):
+                self.assertEqual(result, CalmarendianDate.from_date_string(date).add_seasons(seasons).csn())
+
+    def test_add_seasons_matches_absolute_season_ref(self):
+        d = CalmarendianDate.from_date_string("777-3-10-2")
+        for seasons in (-10_000, -1, 0, 1, 6, 7, 8, 10_000):
+            with self.subTest(seasons=seasons):
+                later = d.add_seasons(seasons)
+                self.assertEqual(d.absolute_season_ref() + seasons, later.absolute_season_ref())
+                self.assertEqual((d.week.number, d.day.number), (later.week.number, later.day.number))
+
+    def test_add_cycles_and_grand_cycles(self):
+        d = CalmarendianDate.from_date_string("01-700-7-51-8")
+        self.assertEqual("02-700-7-51-8", d.add_cycles(700).gcn())
+        self.assertEqual("02-700-7-51-8", d.add_grand_cycles(1).gcn())
+        self.assertEqual("00-700-7-51-8", d.add_grand_cycles(-1).gcn())
+        self.assertEqual("02-001-7-51-4", d.add_cycles(1).gcn())
+        self.assertEqual("02-007-7-51-7", d.add_cycles(7).gcn())
+        self.assertEqual("01-001-1-01-1", CalmarendianDate(1).add_cycles(0).gcn())
+        self.assertEqual("002-4-20-6 BZ", CalmarendianDate.from_date_string("775-4-20-6").add_cycles(-777).csn())
+
+    def test_raise_policy(self):
+        festival = CalmarendianDate.from_date_string("01-700-7-51-8")
+        with self.assertRaises(CalmarendianDateValueError):
+            festival.add_cycles(1, OverflowPolicy.RAISE)
+        with self.assertRaises(CalmarendianDateValueError):
+            festival.add_seasons(1, OverflowPolicy.RAISE)
+        with self.assertRaises(CalmarendianDateValueError):
+            festival.add_weeks(1, OverflowPolicy.RAISE)
+        self.assertEqual("02-700-7-51-8", festival.add_cycles(700, OverflowPolicy.RAISE).gcn())
+        self.assertEqual("03-001-7-51-4", festival.add_cycles(701, OverflowPolicy.CLAMP).gcn())
+        with self.assertRaises(CalmarendianDateValueError):
+            festival.add_cycles(1, "raise")
+        self.assertEqual("02-001-7-51-4", festival.add_cycles(1, "clamp").gcn())
+
+    def test_invalid_arguments(self):
+        d = CalmarendianDate.from_date_string("777-3-10-2")
+        for bad in ("RAISE", None, True):
+            with self.subTest(overflow=bad):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, "is an invalid overflow policy"):
+                    d.add_cycles(1, bad)
+        for method in (d.add_weeks, d.add_seasons, d.add_cycles, d.add_grand_cycles):
+            for bad in (1.5, 1.0, "1"):
+                with self.subTest(method=method.__name__, count=bad):
+                    with self.assertRaisesRegex(CalmarendianDateError, "is not an integer"):
+                        method(bad)
+
+    def test_out_of_range(self):
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(CDateConfig.MAX_ADR).add_weeks(1)
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(CDateConfig.MIN_ADR).add_seasons(-1)
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianDate(1).add_grand_cycles(99)
+        self.assertEqual(CalmarendianDate(CDateConfig.MIN_ADR), CalmarendianDate(1).add_grand_cycles(-1))
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        CalmarendianDate.enable_parse_cache(maxsize=3)
+
+    def tearDown(self) -> None:
+        CalmarendianDate.disable_parse_cache()
+
+    def test_disabled_by_default(self):
+        CalmarendianDate.disable_parse_cache()
+        self.assertIsNone(CalmarendianDate.parse_cache_info())
+        d = CalmarendianDate.from_date_string('777-7-25-1')
+        self.assertIsNot(d, CalmarendianDate.from_date_string('777-7-25-1'))
+
+    def test_cached_dates(self):
+        d = CalmarendianDate.from_date_string('777-7-25-1')
+        self.assertIs(d, CalmarendianDate.from_date_string('777-7-25-1'))
+        self.assertEqual(1_906_904, d.adr)
+        info = CalmarendianDate.parse_cache_info()
+        self.assertEqual((1, 1, 0, 1), (info.hits, info.misses, info.evictions, info.currsize))
+
+    def test_eviction(self):
+        for date_string in ['777-7-25-1', '777-7-25-2', '777-7-25-3', '777-7-25-1', '777-7-25-4']:
+            CalmarendianDate.from_date_string(date_string)
+        info = CalmarendianDate.parse_cache_info()
+        self.assertEqual((1, 4, 1, 3, 3), (info.hits, info.misses, info.evictions, info.maxsize, info.currsize))
+        CalmarendianDate.from_date_string('777-7-25-2')
+        self.assertEqual(2, CalmarendianDate.parse_cache_info().evictions)
+
+    def test_clear(self):
+        CalmarendianDate.from_date_string('777-7-25-1')
+        CalmarendianDate.from_date_string('777-7-25-1')
+        CalmarendianDate.clear_parse_cache()
+        info = CalmarendianDate.parse_cache_info()
+        self.assertEqual((0, 0, 0, 0), (info.hits, info.misses, info.evictions, info.currsize))
+
+    def test_subclasses_are_cached_separately(self):
+        class SubDate(CalmarendianDate):
+            pass
+
+        d = CalmarendianDate.from_date_string('777-7-25-1')
+        sd = SubDate.from_date_string('777-7-25-1')
+        self.assertIsInstance(sd, SubDate)
+        self.assertIs(sd, SubDate.from_date_string('777-7-25-1'))
+        self.assertIs(d, CalmarendianDate.from_date_string('777-7-25-1'))
+
+    def test_errors_are_not_cached(self):
+        for date_string in ['778-7-51-5', '777-8-01-1', 777]:
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(CalmarendianDateError):
+                    CalmarendianDate.from_date_string(date_string)
+                with self.assertRaises(CalmarendianDateError):
+                    CalmarendianDate.from_date_string(date_string)
+        self.assertEqual(0, CalmarendianDate.parse_cache_info().currsize)
+
+    def test_warnings_repeated_on_hits(self):
+        for _ in range(3):
+            with self.assertWarnsRegex(UserWarning, "Cycle 400 is not in Current Era"):
+                d = CalmarendianDate.from_date_string('400-1-23-4 CE')
+            self.assertEqual('400-1-23-4', d.csn())
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CalmarendianDate.from_date_string('777-7-25-1 CE')
+            CalmarendianDate.from_date_string('777-7-25-1 CE')
+        self.assertEqual(3, CalmarendianDate.parse_cache_info().hits)
+
+
+class NotationMemoTests(unittest.TestCase):
+    def setUp(self) -> None:
+        CalmarendianDate.enable_notation_memo()
+
+    def tearDown(self) -> None:
+        CalmarendianDate.disable_notation_memo()
+
+    def test_notations_rendered_once(self):
+        d = CalmarendianDate.from_date_string("013-4-22-6 BZ")
+        with mock.patch.object(CalmarendianDate, '_days_elapsed_in_cycle', autospec=True,
+                               side_effect=CalmarendianDate._days_elapsed_in_cycle) as render:
+            for _ in range(3):
+                self.assertEqual("00-687-4-22-6", d.gcn())
+                self.assertEqual("013-4-22-6 BZ", d.csn())
+                self.assertEqual("013-4-22-6 BZ", d.common_symbolic_notation("ce"))
+                # The memo is keyed by ADR, so other objects for the same day share it.
+                self.assertEqual("00-687-4-22-6", CalmarendianDate(d.adr).gcn())
+            self.assertEqual(3, render.call_count)
+
+    def test_era_marker_variants_memoized_separately(self):
+        d = CalmarendianDate.from_date_string("777-7-03-1")
+        self.assertEqual("777-7-03-1", d.common_symbolic_notation())
+        self.assertEqual("777-7-03-1 CE", d.common_symbolic_notation("CE"))
+        self.assertEqual("777-7-03-1 CE", d.common_symbolic_notation("ce"))
+        self.assertEqual("777-7-03-1", d.common_symbolic_notation("BH"))
+        self.assertEqual(3, CalmarendianDate.notation_memo_info().currsize)
+
+    def test_memoized_notations_match(self):
+        adrs = (CDateConfig.MIN_ADR, -1, 0, 1, 857_500, 1_906_750, CDateConfig.MAX_ADR)
+        era_markers = (None, "BH", "CE")
+        memoized = [CalmarendianDate(adr).common_symbolic_notation(e) for adr in adrs for e in era_markers]
+        self.assertListEqual(
+            memoized, [CalmarendianDate(adr).common_symbolic_notation(e) for adr in adrs for e in era_markers]
+        )
+        info = CalmarendianDate.notation_memo_info()
+        self.assertEqual((len(memoized), len(memoized)), (info.hits, info.currsize))
+        CalmarendianDate.disable_notation_memo()
+        self.assertIsNone(CalmarendianDate.notation_memo_info())
+        self.assertListEqual(
+            memoized, [CalmarendianDate(adr).common_symbolic_notation(e) for adr in adrs for e in era_markers]
+        )
+
+    def test_memo_is_bounded(self):
+        CalmarendianDate.enable_notation_memo(maxsize=2)
+        for adr in range(1, 6):
+            CalmarendianDate(adr).gcn()
+        info = CalmarendianDate.notation_memo_info()
+        self.assertEqual((2, 3), (info.currsize, info.evictions))
+
+
 class ColloquialDateTests(unittest.TestCase):
     @staticmethod
     def c_day(offset: int) -> Day:
@@ -0,0 +1,116 @@
+import os
+import random
+import struct
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+from npm_calmarendian_date import CalmarendianDateArray
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.column_file import COLUMN_FILE_HEADER, ColumnElementType, ColumnFile, write_column_file
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateFormatError
+
+
+class ColumnFileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "dates.cdcf")
+        rng = random.Random(777)
+        self.adrs = [CDateConfig.MIN_ADR, 0, CDateConfig.MAX_ADR]
+        self.adrs += [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(100_000)]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_layout(self):
+        self.assertEqual(3, write_column_file(self.path, iter([1, -1, CDateConfig.MAX_ADR])))
+        with open(self.path, "rb") as f:
+            content = f.read()
+        self.assertEqual(16, COLUMN_FILE_HEADER.size)
+        self.assertEqual((b"CDCF", 1, ColumnElementType.ADR_INT32, 3), COLUMN_FILE_HEADER.unpack(content[:16]))
+        self.assertEqual((1, -1, CDateConfig.MAX_ADR), struct.unpack("<3i", content[16:]))
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.adrs), write_column_file(self.path, self.adrs))
+        with ColumnFile(self.path) as column:
+            self.assertEqual(len(self.adrs), len(column))
+            self.assertEqual(ColumnElementType.ADR_INT32, column.element_type)
+            self.assertIsInstance(column.values, memoryview)
+            self.assertTrue(column.values.readonly)
+            self.assertListEqual(self.adrs, column.values.tolist())
+            self.assertEqual(self.adrs[-1], column[-1])
+            self.assertListEqual(self.adrs[5:8], column[5:8].tolist())
+        self.assertTrue(column.closed)
+
+    def test_empty(self):
+        self.assertEqual(0, write_column_file(self.path, array('l')))
+        with ColumnFile(self.path) as column:
+            self.assertEqual(0, len(column))
+            self.assertListEqual([], column.values.tolist())
+
+    def test_out_of_range(self):
+        with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {CDateConfig.MAX_ADR + 1} is out of range"):
+            write_column_file(self.path, self.adrs + [CDateConfig.MAX_ADR + 1])
+        # ADRs beyond the range of the file's int32 values are checked before they are narrowed.
+        with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {10 ** 12} is out of range"):
+            write_column_file(self.path, iter([5, 6, 10 ** 12]))
+
+    def test_failed_write_keeps_existing_file(self):
+        write_column_file(self.path, [1, 2, 3])
+        bad_adrs = self.adrs + [CDateConfig.MIN_ADR - 1]
+        for values in [bad_adrs, iter(bad_adrs)]:
+            with self.assertRaises(CalmarendianDateDomainError):
+                write_column_file(self.path, values)
+            with ColumnFile(self.path) as column:
+                self.assertListEqual([1, 2, 3], column.values.tolist())
+        self.assertListEqual(["dates.cdcf"], os.listdir(self.directory.name))
+
+    def test_failed_open_raises_original_exception(self):
+        write_column_file(self.path, [1, 2, 3])
+        with mock.patch("sys.byteorder", "big"), mock.patch(
+                "npm_calmarendian_date.column_file.array", side_effect=MemoryError
+        ):
+            with self.assertRaises(MemoryError):
+                ColumnFile(self.path)
+
+    def test_invalid_files(self):
+        write_column_file(self.path, [1, 2, 3])
+        with open(self.path, "rb") as f:
+            content = f.read()
+        data = [
+            (b"", "too short"),
+            (b"CDCF", "too short"),
+            (b"XXXX" + content[4:], "not a column file"),
+            (content[:4] + struct.pack("<H", 2) + content[6:], "unsupported version 2"),
+            (content[:6] + struct.pack("<H", 99) + content[8:], "unsupported element type 99"),
+            (content[:-1], "does not hold the 3 values"),
+            (content + b"\0\0\0\0", "does not hold the 3 values"),
+        ]
+        for bad_content, message in data:
+            with self.subTest(message=message, size=len(bad_content)):
+                with open(self.path, "wb") as f:
+                    f.write(bad_content)
+                with self.assertRaisesRegex(CalmarendianDateFormatError, message):
+                    ColumnFile(self.path)
+
+    def test_date_array(self):
+        dates = CalmarendianDateArray.from_adrs(self.adrs)
+        dates.to_column_file(self.path)
+        self.assertTrue(dates.equals(CalmarendianDateArray.from_column_file(self.path)))
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        write_column_file(self.path, bulk.numpy.array(self.adrs, dtype=bulk.numpy.int64))
+        with ColumnFile(self.path) as column:
+            values = column.to_numpy()
+            self.assertListEqual(self.adrs, values.tolist())
+            self.assertFalse(values.flags.writeable)
+            del values
+        with self.assertRaises(CalmarendianDateDomainError):
+            write_column_file(self.path, bulk.numpy.array([CDateConfig.MIN_ADR - 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
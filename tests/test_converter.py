@@ -0,0 +1,221 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import warnings
+from contextlib import redirect_stdout
+from unittest import mock
+
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date import __main__ as cli
+from npm_calmarendian_date.converter import Conversion, ErrorPolicy, Notation, converted_chunks, converted_lines
+from npm_calmarendian_date.converter import adr_from_text, convert_many
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateValueError
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINES = ["777-7-03-1\n", "1\n", "02-778-7-51-5\n", "000-7-51-8 BZ\n", "-5\n", "xyz\n", "  02-077-7-03-2  \n"]
+
+
+class ADRFromTextTests(unittest.TestCase):
+    def test_auto(self):
+        self.assertEqual(1_906_750, adr_from_text("777-7-03-1", None))
+        self.assertEqual(1_906_750, adr_from_text("02-077-7-03-1", None))
+        self.assertEqual(-5, adr_from_text("-5", None))
+        self.assertEqual(5, adr_from_text("+5", None))
+
+    def test_explicit_sources(self):
+        self.assertEqual(1_906_750, adr_from_text("1906750", Notation.ADR))
+        self.assertEqual(1_906_750, adr_from_text("1", Notation.ARR))
+        self.assertEqual(1_906_750, adr_from_text("777-7-03-1", Notation.CSN))
+        with self.assertRaises(CalmarendianDateError):
+            adr_from_text("777-7-03-1", Notation.ADR)
+        with self.assertRaises(CalmarendianDateError):
+            adr_from_text("1", Notation.GCN)
+        with self.assertRaises(CalmarendianDateDomainError):
+            adr_from_text("Monday, Week 3 of Onset 777", Notation.COLLOQUIAL)
+
+    def test_era_marker_warning(self):
+        with self.assertWarns(UserWarning):
+            self.assertEqual(1_906_750, adr_from_text("777-7-03-1 BH", None))
+
+
+class ConvertedLinesTests(unittest.TestCase):
+    def test_targets(self):
+        d = CalmarendianDate.today()
+        data = [
+            (Conversion(Notation.ADR), str(d.adr)),
+            (Conversion(Notation.ARR), "1"),
+            (Conversion(Notation.GCN), d.gcn()),
+            (Conversion(Notation.CSN, era_marker="CE"), d.common_symbolic_notation("CE")),
+            (Conversion(Notation.COLLOQUIAL, verbose=True), d.colloquial_date(verbose=True)),
+        ]
+        for conversion, expected in data:
+            with self.subTest(target=conversion.target):
+                self.assertListEqual([expected], converted_lines(["777-7-03-1\n"], conversion))
+
+    def test_strict(self):
+        with self.assertRaisesRegex(CalmarendianDateError, "LINE 13: CYCLE in GRAND CYCLE: 778"):
+            converted_lines(LINES, Conversion(Notation.ADR), first_line_number=11)
+
+    def test_skip(self):
+        self.assertListEqual(
+            ["1906750", "1", "0", "-5", "1906751"],
+            converted_lines(LINES, Conversion(Notation.ADR, errors=ErrorPolicy.SKIP))
+        )
+
+    def test_annotate(self):
+        converted = converted_lines(LINES, Conversion(Notation.ADR, errors=ErrorPolicy.ANNOTATE))
+        self.assertEqual(len(LINES), len(converted))
+        self.assertListEqual(["1906750", "1"], converted[:2])
+        self.assertRegex(converted[2], r"^02-778-7-51-5\tERROR: CYCLE in GRAND CYCLE")
+        self.assertListEqual(["0", "-5"], converted[3:5])
+        self.assertRegex(converted[5], r"^xyz\tERROR: DATE STRING")
+        self.assertEqual("1906751", converted[6])
+
+
+class ConvertedChunksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lines = [f"{adr}\n" for adr in range(1_900_000, 1_900_050)] + LINES
+        self.conversion = Conversion(Notation.GCN, errors=ErrorPolicy.ANNOTATE)
+        self.expected = converted_lines(self.lines, self.conversion)
+
+    def test_single_process(self):
+        chunks = list(converted_chunks(iter(self.lines), self.conversion, workers=1, chunk_size=7))
+        self.assertEqual(9, len(chunks))
+        self.assertListEqual(self.expected, [line for chunk in chunks for line in chunk])
+
+    def test_process_pool(self):
+        chunks = converted_chunks(iter(self.lines), self.conversion, workers=2, chunk_size=7)
+        self.assertListEqual(self.expected, [line for chunk in chunks for line in chunk])
+
+    def test_process_pool_strict(self):
+        with self.assertRaisesRegex(CalmarendianDateError, "LINE 53:"):
+            list(converted_chunks(iter(self.lines), Conversion(Notation.GCN), workers=2, chunk_size=7))
+
+    def test_empty(self):
+        self.assertListEqual([], list(converted_chunks([], self.conversion)))
+
+    def test_bad_settings(self):
+        with self.assertRaises(CalmarendianDateDomainError):
+            list(converted_chunks(self.lines, self.conversion, workers=0))
+        with self.assertRaises(CalmarendianDateDomainError):
+            list(converted_chunks(self.lines, self.conversion, chunk_size=0))
+
+
+class ConvertManyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dates = ["777-7-03-1", 1, (2, 77, 7, 3, 2), "000-7-51-8 BZ", CalmarendianDate.today().adr, [0, 1, 1, 1, 1]]
+        self.dates *= 5
+        self.expected_dates = [
+            CalmarendianDate.from_date_string(d) if isinstance(d, str)
+            else CalmarendianDate(d) if isinstance(d, int)
+            else CalmarendianDate.from_numbers(*d)
+            for d in self.dates
+        ]
+
+    def test_targets(self):
+        data = [
+            (Notation.ADR, {}, [d.adr for d in self.expected_dates]),
+            (Notation.ARR, {}, [d.apocalypse_reckoning for d in self.expected_dates]),
+            (Notation.GCN, {}, [d.gcn() for d in self.expected_dates]),
+            (Notation.CSN, {"era_marker": "BH"}, [d.common_symbolic_notation("BH") for d in self.expected_dates]),
+            (Notation.COLLOQUIAL, {"verbose": True}, [d.colloquial_date(verbose=True) for d in self.expected_dates]),
+        ]
+        for target, options, expected in data:
+            with self.subTest(target=target):
+                self.assertListEqual(expected, convert_many(self.dates, target, workers=1, **options))
+
+    def test_target_values(self):
+        self.assertListEqual(["02-077-7-03-1"], convert_many([1_906_750], "gcn", workers=1))
+        self.assertListEqual([1], convert_many([1_906_750], "arr", workers=1))
+        for bad in ("bogus", "GCN", None):
+            with self.subTest(target=bad):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, "is an invalid notation"):
+                    convert_many([1_906_750], bad, workers=1)
+        with self.assertRaisesRegex(CalmarendianDateDomainError, "is an invalid target notation"):
+            converted_lines(["1"], Conversion("gcn"))
+
+    def test_process_pool(self):
+        expected = [d.csn() for d in self.expected_dates]
+        self.assertListEqual(expected, convert_many(iter(self.dates), Notation.CSN, workers=2, chunk_size=4))
+
+    def test_invalid_inputs(self):
+        for bad in ["02-778-7-51-5", (2, 77, 6, 51, 1), 10 ** 10, None]:
+            with self.subTest(bad=bad):
+                with self.assertRaisesRegex(CalmarendianDateError, "INPUT 7:"):
+                    convert_many(self.dates[:7] + [bad], Notation.ADR, workers=2, chunk_size=3)
+        for bad in [(2, 77, 7, 3), [2, 77, 7, 3, 2, 1], ()]:
+            with self.subTest(bad=bad):
+                with self.assertRaisesRegex(CalmarendianDateValueError, "INPUT 1: GCN NUMBERS"):
+                    convert_many([1, bad], Notation.ADR, workers=1)
+
+    def test_era_marker_warning(self):
+        with self.assertWarns(UserWarning):
+            self.assertListEqual([1_906_750], convert_many(["777-7-03-1 BH"], Notation.ADR, workers=1))
+
+
+class CommandLineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as f:
+            f.writelines(LINES)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def run_main(self, *args: str):
+        out = io.StringIO()
+        with redirect_stdout(out), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with mock.patch("sys.stderr", io.StringIO()) as err:
+                status = cli.main([*args, self.path])
+        return status, out.getvalue(), err.getvalue()
+
+    def test_annotate(self):
+        status, out, _ = self.run_main("--to", "csn", "--era-marker", "ce", "--errors", "annotate", "--workers", "1")
+        self.assertEqual(0, status)
+        lines = out.splitlines()
+        self.assertEqual(len(LINES), len(lines))
+        self.assertListEqual(["777-7-03-1 CE", "001-1-01-1 BH"], lines[:2])
+
+    def test_strict(self):
+        status, out, err = self.run_main("--to", "adr", "--chunk-size", "2", "--workers", "1")
+        self.assertEqual(1, status)
+        self.assertListEqual(["1906750", "1"], out.splitlines())
+        self.assertIn("LINE 3:", err)
+
+    def test_missing_file(self):
+        status, out, err = self.run_main("--to", "adr", "--workers", "1", f"{self.path}.missing")
+        self.assertEqual(1, status)
+        self.assertEqual("", out)
+        self.assertTrue(err.startswith("python -m npm_calmarendian_date: "))
+        self.assertIn("No such file or directory", err)
+
+    def test_era_marker_warning(self):
+        with open(self.path, "w") as f:
+            f.write("777-7-03-1 BH\n")
+        with self.assertWarns(UserWarning):
+            with redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(0, cli.main(["--to", "adr", "--workers", "1", self.path]))
+        self.assertEqual("1906750\n", out.getvalue())
+
+    def test_module_entry_point(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "npm_calmarendian_date", "--to", "colloquial", "--errors", "skip", "--workers", "2",
+             "--chunk-size", "3"],
+            input="".join(LINES), capture_output=True, text=True, cwd=PACKAGE_ROOT
+        )
+        self.assertEqual(0, result.returncode)
+        self.assertListEqual(
+            ["Monday, Week 3 of Onset 777", "Monday, Week 1 of Midwinter 1", "Festival 8 of 0 BZ",
+             "Festival 3 of 0 BZ", "Tuesday, Week 3 of Onset 777"],
+            result.stdout.splitlines()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import pickle
+import random
+import unittest
+from array import array
+
+from npm_calmarendian_date import CalmarendianDate, CalmarendianDateArray
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.bulk import ADR_TYPECODE
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateValueError
+
+
+class CreateDateArrayTests(unittest.TestCase):
+    def test_from_dates_and_adrs(self):
+        dates = CalmarendianDateArray([CalmarendianDate.today(), 1, CalmarendianDate(0)])
+        self.assertEqual(3, len(dates))
+        self.assertListEqual([1_906_750, 1, 0], dates.adrs.tolist())
+        self.assertTrue(CalmarendianDateArray().equals(CalmarendianDateArray.from_adrs([])))
+
+    def test_from_adrs(self):
+        adrs = array('l', [5, 4, 3])
+        dates = CalmarendianDateArray.from_adrs(adrs)
+        adrs[0] = 7
+        self.assertEqual(5, dates[0].adr)
+        self.assertTrue(dates.equals(CalmarendianDateArray.from_adrs(range(5, 2, -1))))
+
+    def test_from_date_strings(self):
+        dates = CalmarendianDateArray.from_date_strings(['777-7-03-1', '02-077-7-03-2', '000-7-51-8 BZ'])
+        self.assertListEqual([1_906_750, 1_906_751, 0], dates.adrs.tolist())
+
+    def test_out_of_range(self):
+        for adr in [CDateConfig.MIN_ADR - 1, CDateConfig.MAX_ADR + 1]:
+            with self.subTest(adr=adr):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {adr} is out of range"):
+                    CalmarendianDateArray([1, adr])
+                with self.assertRaises(CalmarendianDateDomainError):
+                    CalmarendianDateArray.from_adrs([adr, 1])
+        # Values too large for the array's C longs are range-checked before they are packed.
+        for adr in [10 ** 30, -10 ** 30]:
+            with self.subTest(adr=adr):
+                with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {adr} is out of range"):
+                    CalmarendianDateArray([1, adr])
+                with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {adr} is out of range"):
+                    CalmarendianDateArray.from_adrs(iter([adr, 1]))
+
+    def test_adrs_are_read_only(self):
+        dates = CalmarendianDateArray([1, 2])
+        with self.assertRaises(TypeError):
+            dates.adrs[0] = 7
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        dates = CalmarendianDateArray.from_adrs(bulk.numpy.array([3, 2, 1], dtype=bulk.numpy.int32))
+        self.assertListEqual([3, 2, 1], dates.adrs.tolist())
+        self.assertListEqual([3, 2, 1], dates.to_numpy().tolist())
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDateArray.from_adrs(bulk.numpy.array([CDateConfig.MAX_ADR + 1]))
+        # Out-of-range values are rejected before the array is narrowed to the type of the buffer.
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianDateArray.from_adrs(bulk.numpy.array([1, 2 ** 32 + 1], dtype=bulk.numpy.int64))
+
+
+class SequenceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.adrs = [1_906_750, 0, CDateConfig.MAX_ADR, CDateConfig.MIN_ADR, 1]
+        self.dates = CalmarendianDateArray(self.adrs)
+
+    def test_indexing(self):
+        self.assertIsInstance(self.dates[0], CalmarendianDate)
+        self.assertEqual(CalmarendianDate.today(), self.dates[0])
+        self.assertEqual(CalmarendianDate(1), self.dates[-1])
+        with self.assertRaises(IndexError):
+            _ = self.dates[5]
+
+    def test_slicing(self):
+        self.assertIsInstance(self.dates[1:3], CalmarendianDateArray)
+        self.assertListEqual(self.adrs[1:3], self.dates[1:3].adrs.tolist())
+        self.assertListEqual(self.adrs[::-2], self.dates[::-2].adrs.tolist())
+
+    def test_iteration(self):
+        self.assertListEqual([CalmarendianDate(adr) for adr in self.adrs], list(self.dates))
+        self.assertIn(CalmarendianDate(0), self.dates)
+        self.assertIn(1, self.dates)
+        self.assertNotIn(CalmarendianDate(2), self.dates)
+
+    def test_pickle(self):
+        self.assertTrue(self.dates.equals(pickle.loads(pickle.dumps(self.dates))))
+
+    def test_repr(self):
+        self.assertTrue(self.dates.equals(eval(repr(self.dates), {'CalmarendianDateArray': CalmarendianDateArray})))
+
+
+class OrderingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(777)
+        self.adrs = [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(1000)]
+        self.adrs += self.adrs[:10]
+        self.dates = CalmarendianDateArray(self.adrs)
+
+    def test_sort(self):
+        self.dates.sort()
+        self.assertListEqual(sorted(self.adrs), self.dates.adrs.tolist())
+        self.dates.sort(reverse=True)
+        self.assertListEqual(sorted(self.adrs, reverse=True), self.dates.adrs.tolist())
+
+    def test_argsort(self):
+        order = self.dates.argsort()
+        self.assertListEqual(sorted(self.adrs), [self.adrs[i] for i in order])
+        self.assertListEqual(sorted(range(len(self.adrs)), key=self.adrs.__getitem__), order.tolist())
+
+    def test_searchsorted(self):
+        self.dates.sort()
+        adrs = sorted(self.adrs)
+        for adr in self.adrs[:10] + [CDateConfig.MIN_ADR, CDateConfig.MAX_ADR]:
+            with self.subTest(adr=adr):
+                left = self.dates.searchsorted(CalmarendianDate(adr))
+                right = self.dates.searchsorted(adr, side='right')
+                self.assertEqual(adrs.count(adr), right - left)
+                self.assertTrue(all(a < adr for a in adrs[:left]))
+                self.assertTrue(all(a > adr for a in adrs[right:]))
+        with self.assertRaises(CalmarendianDateDomainError):
+            self.dates.searchsorted(1, side='middle')
+
+    def test_min_max(self):
+        self.assertEqual(CalmarendianDate(min(self.adrs)), self.dates.min())
+        self.assertEqual(CalmarendianDate(max(self.adrs)), self.dates.max())
+        with self.assertRaises(CalmarendianDateValueError):
+            CalmarendianDateArray().min()
+        with self.assertRaises(CalmarendianDateValueError):
+            CalmarendianDateArray().max()
+
+
+class ComparisonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dates = CalmarendianDateArray([1, 2, 3])
+
+    def test_with_date(self):
+        today = CalmarendianDate(2)
+        self.assertEqual(array('b', [1, 0, 0]), self.dates < today)
+        self.assertEqual(array('b', [1, 1, 0]), self.dates <= today)
+        self.assertEqual(array('b', [0, 1, 0]), self.dates == today)
+        self.assertEqual(array('b', [1, 0, 1]), self.dates != today)
+        self.assertEqual(array('b', [0, 1, 1]), self.dates >= 2)
+        self.assertEqual(array('b', [0, 0, 1]), self.dates > 2)
+        self.assertEqual(array('b', [0, 0, 1]), today < self.dates)
+
+    def test_with_array(self):
+        other = CalmarendianDateArray([3, 2, 1])
+        self.assertEqual(array('b', [1, 0, 0]), self.dates < other)
+        self.assertEqual(array('b', [0, 1, 0]), self.dates == other)
+        with self.assertRaises(CalmarendianDateValueError):
+            _ = self.dates < CalmarendianDateArray([1])
+
+    def test_truth_value_is_ambiguous(self):
+        for result in [self.dates == CalmarendianDateArray([4, 5, 6]), self.dates < 2]:
+            with self.assertRaisesRegex(CalmarendianDateValueError, "truth value .* is ambiguous"):
+                bool(result)
+        with self.assertRaises(CalmarendianDateValueError):
+            _ = self.dates in [CalmarendianDateArray([4, 5, 6])]
+        self.assertTrue(all(self.dates == CalmarendianDateArray([1, 2, 3])))
+        self.assertFalse(any(self.dates == CalmarendianDateArray([4, 5, 6])))
+
+    def test_equals(self):
+        self.assertTrue(self.dates.equals(CalmarendianDateArray([1, 2, 3])))
+        self.assertFalse(self.dates.equals(CalmarendianDateArray([1, 2])))
+        self.assertFalse(self.dates.equals([1, 2, 3]))
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.dates)
+
+    def test_other_types(self):
+        self.assertFalse(self.dates == "1")
+        with self.assertRaises(TypeError):
+            _ = self.dates < "1"
+
+
+class ElementTests(unittest.TestCase):
+    def test_element_columns(self):
+        rng = random.Random(700)
+        adrs = [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(1000)]
+        dates = CalmarendianDateArray(adrs)
+        expected = [CalmarendianDate(adr).date_elements() for adr in adrs]
+        for i, name in enumerate(['grand_cycle', 'cycle', 'season', 'week', 'day']):
+            with self.subTest(element=name):
+                column = getattr(dates, name)
+                self.assertIsInstance(column, memoryview)
+                self.assertTrue(column.readonly)
+                self.assertEqual(ADR_TYPECODE, column.format)
+                self.assertListEqual([e[i].number for e in expected], column.tolist())
+
+    def test_element_columns_are_read_only(self):
+        dates = CalmarendianDateArray([1_906_750, 1])
+        with self.assertRaises(TypeError):
+            dates.season[0] = 99
+        self.assertEqual(7, dates.season[0])
+
+    def test_sorting_resets_elements(self):
+        dates = CalmarendianDateArray([1_906_750, 1])
+        self.assertListEqual([7, 1], dates.season.tolist())
+        dates.sort()
+        self.assertListEqual([1, 7], dates.season.tolist())
+
+    def test_formatting(self):
+        dates = CalmarendianDateArray([1_906_750, 0])
+        self.assertListEqual(['02-077-7-03-1', '00-700-7-51-8'], dates.grand_cycle_notations())
+        self.assertListEqual(['777-7-03-1 CE', '000-7-51-8 BZ'], dates.common_symbolic_notations('CE'))
+        self.assertListEqual(
+            ['Monday of Week 3 of Onset 777', 'Festival Eight of 0 Before Time Zero'],
+            dates.colloquial_dates(verbose=True)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
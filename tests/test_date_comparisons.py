@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from npm_calmarendian_date.calmarendian_date import CalmarendianDate
@@ -37,6 +39,51 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(self.today >= self.election_day)
         self.assertFalse(self.today >= self.tomorrow)
 
+    def test_ne(self):
+        self.assertTrue(self.today != self.yesterday)
+        self.assertFalse(self.today != self.election_day)
+
+    def test_comparison_with_other_types(self):
+        self.assertFalse(self.today == 1_906_904)
+        self.assertTrue(self.today != "777-7-25-1")
+        with self.assertRaises(TypeError):
+            _ = self.today < 1_906_905
+        with self.assertRaises(TypeError):
+            _ = self.today >= None
+
+    def test_sorting(self):
+        dates = [self.tomorrow, self.today, self.yesterday, self.election_day]
+        self.assertEqual([self.yesterday, self.today, self.today, self.tomorrow], sorted(dates))
+        self.assertEqual(self.tomorrow, max(dates))
+
+
+class HashingTests(unittest.TestCase):
+    def test_hash_follows_equality(self):
+        d = CalmarendianDate(1_906_904)
+        self.assertEqual(hash(d), hash(CalmarendianDate.from_date_string('777-7-25-1')))
+
+    def test_sets_and_dictionaries(self):
+        dates = [CalmarendianDate(adr) for adr in (1_906_904, 1_906_903, 1_906_904, 1_906_905, 1_906_903)]
+        self.assertEqual(3, len(set(dates)))
+        events = {CalmarendianDate.from_date_string('777-7-25-1'): "Election Day"}
+        self.assertEqual("Election Day", events[CalmarendianDate(1_906_904)])
+        self.assertNotIn(CalmarendianDate(1_906_905), events)
+
+    def test_immutability(self):
+        d = CalmarendianDate(1_906_904)
+        with self.assertRaises(AttributeError):
+            d.adr = 1
+        with self.assertRaises(AttributeError):
+            d.week = d.week
+
+    def test_pickle_and_copy(self):
+        d = CalmarendianDate(1_906_904)
+        d.date_elements()
+        for dx in (pickle.loads(pickle.dumps(d)), copy.copy(d), copy.deepcopy(d)):
+            self.assertEqual(d, dx)
+            self.assertEqual(d.csn(), dx.csn())
+            self.assertIs(d.week, dx.week)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,9 @@
+import pickle
 import unittest
 
+from npm_calmarendian_date.c_date_config import CDateConfig
 from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day
+from npm_calmarendian_date.date_elements import CYCLE_DAYS_PRIOR, CYCLE_SEASONS_PRIOR
 from npm_calmarendian_date.exceptions import CalmarendianDateError
 
 
@@ -315,5 +318,96 @@ class WeekendTests(unittest.TestCase):
                 self.assertEqual(item['result'][1], w.weekend.duration)
 
 
+class InternedElementTests(unittest.TestCase):
+    def test_shared_instances(self):
+        self.assertIs(GrandCycle.interned(2), GrandCycle.interned(2))
+        self.assertIs(CycleInGrandCycle.interned(77), CycleInGrandCycle.interned(77))
+        self.assertIs(Season.interned(7), Season.interned(7))
+        self.assertIs(Week.interned(51, Season(7)), Week.interned(51, Season.interned(7)))
+        self.assertIs(Season.interned(7), Week.interned(51, Season(7)).season)
+        self.assertIs(
+            Day.interned(3, Week(12, Season(4)), CycleInGrandCycle(100)),
+            Day.interned(3, Week.interned(40, Season.interned(1)), CycleInGrandCycle.interned(5))
+        )
+        self.assertIsNot(Day.interned(3, Week(12, Season(4)), CycleInGrandCycle(100)),
+                         Day.interned(3, Week(51, Season(7)), CycleInGrandCycle(100)))
+
+    def test_interned_values(self):
+        self.assertEqual(99, GrandCycle.interned(99).number)
+        self.assertEqual(700, CycleInGrandCycle.interned(700).number)
+        self.assertEqual("Onset", Season.interned(7).name())
+        w = Week.interned(50, Season.interned(7))
+        self.assertEqual((50, 7, "Festival"), (w.number, w.season.number, w.weekend.descriptor))
+        d = Day.interned(8, Week.interned(51, Season.interned(7)), CycleInGrandCycle.interned(700))
+        self.assertEqual((8, True), (d.number, d.festival))
+
+    def test_interned_validation(self):
+        data = [
+            ("GRAND CYCLE: 100", GrandCycle.interned, (100,)),
+            ("CYCLE in GRAND CYCLE: 0", CycleInGrandCycle.interned, (0,)),
+            ("SEASON: 8", Season.interned, (8,)),
+            ("WEEK: 51 is not valid for season 6", Week.interned, (51, Season(6))),
+            ("DAY must be in \\[1 .. 7\\] for specified week; not 8",
+             Day.interned, (8, Week(50, Season(7)), CycleInGrandCycle(7))),
+            ("DAY must be in \\[1 .. 4\\] for specified week; not 5",
+             Day.interned, (5, Week(51, Season(7)), CycleInGrandCycle(8))),
+            ("DAY must be in \\[1 .. 7\\] for specified week; not 8",
+             Day.interned, (8, Week(51, Season(7)), CycleInGrandCycle(7))),
+        ]
+        for message, factory, args in data:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(CalmarendianDateError, message):
+                    factory(*args)
+
+    def test_precomputed_festival_days(self):
+        for c in range(1, 701):
+            expected = 8 if c == 700 else 7 if c % 7 == 0 else 4
+            self.assertEqual(expected, CycleInGrandCycle.interned(c).festival_days())
+
+    def test_immutability(self):
+        s = Season.interned(3)
+        with self.assertRaises(AttributeError):
+            s.number = 4
+        with self.assertRaises(AttributeError):
+            del s.number
+        with self.assertRaises(AttributeError):
+            Week(3, Season(3)).season = Season(4)
+        self.assertEqual(3, Season.interned(3).number)
+
+    def test_pickling_returns_shared_instances(self):
+        elements = [
+            GrandCycle.interned(2),
+            CycleInGrandCycle.interned(77),
+            Season.interned(7),
+            Week.interned(51, Season.interned(7)),
+            Day.interned(7, Week.interned(51, Season.interned(7)), CycleInGrandCycle.interned(77)),
+        ]
+        for element in elements:
+            with self.subTest(cls=element.__class__.__name__):
+                self.assertIs(element, pickle.loads(pickle.dumps(element)))
+
+
+class CycleBoundaryTableTests(unittest.TestCase):
+    def test_table_lengths(self):
+        self.assertEqual(701, len(CYCLE_DAYS_PRIOR))
+        self.assertEqual(701, len(CYCLE_SEASONS_PRIOR))
+        self.assertEqual(CDateConfig.DAYS_per_GRAND_CYCLE, CYCLE_DAYS_PRIOR[700])
+        self.assertEqual(4900, CYCLE_SEASONS_PRIOR[700])
+
+    def test_days_prior_table(self):
+        for c in range(1, 701):
+            with self.subTest(c=c):
+                # Every cycle has 2454 days; every seventh cycle has an extra three festival days.
+                self.assertEqual((c - 1) * 2454 + (c - 1) // 7 * 3, CYCLE_DAYS_PRIOR[c - 1])
+                self.assertEqual(CYCLE_DAYS_PRIOR[c - 1], CycleInGrandCycle(c).days_prior())
+                self.assertEqual(
+                    2450 + CycleInGrandCycle(c).festival_days(), CYCLE_DAYS_PRIOR[c] - CYCLE_DAYS_PRIOR[c - 1]
+                )
+
+    def test_seasons_prior_table(self):
+        for c in range(1, 701):
+            self.assertEqual((c - 1) * 7, CycleInGrandCycle(c).seasons_prior())
+
+
 if __name__ == '__main__':
     unittest.main()
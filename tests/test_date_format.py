@@ -0,0 +1,86 @@
+import unittest
+
+from npm_calmarendian_date import CalmarendianDate
+from npm_calmarendian_date import date_format
+from npm_calmarendian_date.exceptions import CalmarendianDateFormatError
+
+
+class StrftimeTests(unittest.TestCase):
+    def test_directives(self):
+        d = CalmarendianDate.today()
+        data = [
+            ("%G", "02"), ("%c", "077"), ("%Y", "777"), ("%E", "CE"),
+            ("%m", "7"), ("%B", "Onset"), ("%W", "03"), ("%U", "Marigold"),
+            ("%d", "1"), ("%A", "Monday"), ("%a", "Mon"),
+            ("%j", "1906750"), ("%R", "1"),
+            ("%H:%M:%S", "00:00:00"), ("%%", "%"),
+        ]
+        for format_string, result in data:
+            with self.subTest(format_string=format_string):
+                self.assertEqual(result, d.strftime(format_string))
+
+    def test_notations(self):
+        for date_string in ("777-7-03-1", "001-1-01-1", "013-4-22-6 BZ", "784-7-51-7", "99-700-7-51-8"):
+            d = CalmarendianDate.from_date_string(date_string)
+            with self.subTest(date=date_string):
+                self.assertEqual(d.gcn(), d.strftime("%G-%c-%m-%W-%d"))
+                self.assertEqual(f"{d.absolute_cycle_ref()[0]:03}-{d.season.number}-{d.week.number:02}-"
+                                 f"{d.day.number} {d.absolute_cycle_ref()[1].name}", d.strftime("%Y-%m-%W-%d %E"))
+
+    def test_festival_days(self):
+        d = CalmarendianDate.from_date_string("784-7-51-7")
+        self.assertEqual("Festival Seven, Festival, Ω.7", d.strftime("%A, %U, %a"))
+
+    def test_negative_references(self):
+        d = CalmarendianDate(-5)
+        self.assertEqual("-5 -1906754", d.strftime("%j %R"))
+
+    def test_literals(self):
+        d = CalmarendianDate.today()
+        self.assertEqual("{Onset} 100% {}", d.strftime("{%B} 100%% {}"))
+        self.assertEqual("", d.strftime(""))
+        self.assertEqual("no directives", d.strftime("no directives"))
+
+    def test_unknown_directives(self):
+        d = CalmarendianDate.today()
+        for format_string in ("%q", "%Y-%x", "trailing %"):
+            with self.subTest(format_string=format_string):
+                with self.assertRaises(CalmarendianDateFormatError):
+                    d.strftime(format_string)
+        with self.assertRaises(CalmarendianDateFormatError):
+            d.strftime(None)
+
+    def test_format_protocol(self):
+        d = CalmarendianDate.today()
+        self.assertEqual("Monday, Week 03 of Onset 777", f"{d:%A, Week %W of %B %Y}")
+        self.assertEqual(str(d), f"{d}")
+        self.assertEqual("Onset", "{:%B}".format(d))
+
+
+class FormatCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        date_format.format_cache().clear()
+
+    def test_formats_compiled_once(self):
+        dates = [CalmarendianDate(adr) for adr in range(1, 101)]
+        for d in dates:
+            d.strftime("%G-%c-%m-%W-%d")
+            d.strftime("%A %Y")
+        info = date_format.format_cache().cache_info()
+        self.assertEqual(2, info.misses)
+        self.assertEqual(198, info.hits)
+        self.assertEqual(2, info.currsize)
+
+    def test_compiled_format(self):
+        template, functions = date_format.compiled_format("%G-{%%}-%W %H")
+        self.assertEqual("{0:02}-{{%}}-{1:02} 00", template)
+        self.assertEqual(2, len(functions))
+
+    def test_invalid_formats_are_not_cached(self):
+        with self.assertRaises(CalmarendianDateFormatError):
+            CalmarendianDate.today().strftime("%q")
+        self.assertEqual(0, date_format.format_cache().cache_info().currsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
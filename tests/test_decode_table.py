@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+import unittest
+
+from npm_calmarendian_date import CalmarendianDate, decode_table
+from npm_calmarendian_date import bulk
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.column_file import ColumnElementType, write_column_file
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError, CalmarendianDateFormatError
+
+
+class DecodeTableTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.table = decode_table.built_table()
+        rng = random.Random(777)
+        cls.adrs = [CDateConfig.MIN_ADR, -1, 0, 1, 2450, 2454, 2455, CDateConfig.MAX_ADR]
+        cls.adrs += [rng.randint(CDateConfig.MIN_ADR, CDateConfig.MAX_ADR) for _ in range(20_000)]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "decode.cdcf")
+
+    def tearDown(self) -> None:
+        decode_table.disable_decode_table()
+        self.directory.cleanup()
+
+    def test_packing(self):
+        for numbers in [(1, 1, 1, 1), (700, 7, 51, 8), (777 % 700, 7, 3, 1), (7, 7, 51, 7)]:
+            with self.subTest(numbers=numbers):
+                self.assertEqual(numbers, decode_table.unpacked(decode_table.packed(*numbers)))
+        self.assertLess(decode_table.packed(700, 7, 51, 8), 1 << 32)
+
+    def test_built_table(self):
+        self.assertEqual(CDateConfig.DAYS_per_GRAND_CYCLE, len(self.table))
+        self.assertEqual('I', self.table.typecode)
+        for residue in range(0, CDateConfig.DAYS_per_GRAND_CYCLE, 997):
+            with self.subTest(residue=residue):
+                self.assertEqual(
+                    CalmarendianDate.numbers_from_adr(residue + 1)[1:], decode_table.unpacked(self.table[residue])
+                )
+
+    def test_enabling_is_opt_in(self):
+        self.assertFalse(decode_table.enabled)
+        CalmarendianDate.enable_decode_table()
+        self.assertTrue(decode_table.enabled)
+        CalmarendianDate.disable_decode_table()
+        self.assertFalse(decode_table.enabled)
+
+    def test_numbers_from_adr(self):
+        expected = [CalmarendianDate.numbers_from_adr(adr) for adr in self.adrs]
+        CalmarendianDate.enable_decode_table()
+        self.assertListEqual(expected, [decode_table.numbers_from_adr(adr) for adr in self.adrs])
+        self.assertListEqual(expected, [CalmarendianDate.numbers_from_adr(adr) for adr in self.adrs])
+        self.assertEqual("777-7-03-1", str(CalmarendianDate(CalmarendianDate.today().adr)))
+        date = CalmarendianDate(CDateConfig.MAX_ADR)
+        self.assertEqual((99, 700, 7, 51, 8), tuple(element.number for element in date.date_elements()))
+
+    def test_elements_from_adr(self):
+        expected = [CalmarendianDate(adr).date_elements() for adr in self.adrs]
+        CalmarendianDate.enable_decode_table()
+        for adr, elements in zip(self.adrs, expected):
+            with self.subTest(adr=adr):
+                self.assertEqual(elements, CalmarendianDate(adr).date_elements())
+
+    def test_bulk_numbers_from_adrs(self):
+        expected = [column.tolist() for column in bulk.numbers_from_adrs(self.adrs)]
+        CalmarendianDate.enable_decode_table()
+        self.assertListEqual(expected, [column.tolist() for column in bulk.numbers_from_adrs(self.adrs)])
+        self.assertListEqual(expected, [column.tolist() for column in bulk.numbers_from_adrs(iter(self.adrs))])
+        with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {CDateConfig.MAX_ADR + 1} is out of range"):
+            bulk.numbers_from_adrs([1, CDateConfig.MAX_ADR + 1])
+
+    @unittest.skipIf(bulk.numpy is None, "NumPy is not installed")
+    def test_numpy_numbers_from_adrs(self):
+        adrs = bulk.numpy.array(self.adrs)
+        expected = [column.tolist() for column in bulk.numbers_from_adrs(adrs)]
+        CalmarendianDate.enable_decode_table()
+        self.assertListEqual(expected, [column.tolist() for column in bulk.numbers_from_adrs(adrs)])
+        with self.assertRaisesRegex(CalmarendianDateDomainError, f"ADR: {CDateConfig.MIN_ADR - 1} is out of range"):
+            bulk.numbers_from_adrs(bulk.numpy.array([1, CDateConfig.MIN_ADR - 1]))
+
+    def test_table_file(self):
+        expected = [CalmarendianDate.numbers_from_adr(adr) for adr in self.adrs]
+        CalmarendianDate.enable_decode_table(self.path)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertListEqual(expected, [CalmarendianDate.numbers_from_adr(adr) for adr in self.adrs])
+        self.assertListEqual(self.table.tolist(), decode_table.table().tolist())
+        decode_table.disable_decode_table()
+        # The file now exists, so it is mapped rather than written again.
+        modified = os.stat(self.path).st_mtime_ns
+        CalmarendianDate.enable_decode_table(self.path)
+        self.assertEqual(modified, os.stat(self.path).st_mtime_ns)
+        self.assertListEqual(expected, [CalmarendianDate.numbers_from_adr(adr) for adr in self.adrs])
+        self.assertListEqual([], [name for name in os.listdir(self.directory.name) if name.endswith(".tmp")])
+
+    def test_invalid_table_files(self):
+        write_column_file(self.path, [1, 2, 3])
+        with self.assertRaisesRegex(CalmarendianDateFormatError, "holds ADR_INT32 values"):
+            CalmarendianDate.enable_decode_table(self.path)
+        write_column_file(self.path, self.table[:-1], ColumnElementType.DECODE_UINT32)
+        with self.assertRaisesRegex(CalmarendianDateFormatError, "does not hold a grand cycle decode table"):
+            CalmarendianDate.enable_decode_table(self.path)
+        self.assertFalse(decode_table.enabled)
+
+
+if __name__ == '__main__':
+    unittest.main()
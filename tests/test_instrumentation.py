@@ -0,0 +1,115 @@
+import unittest
+import warnings
+
+from npm_calmarendian_date import CalmarendianDate, CalmarendianDateArray
+from npm_calmarendian_date import bulk, date_format, instrumentation
+from npm_calmarendian_date.exceptions import CalmarendianDateError
+from npm_calmarendian_date.string_conversions import DateString
+
+
+class InstrumentationTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        instrumentation.disable()
+        instrumentation.reset()
+        CalmarendianDate.disable_notation_memo()
+
+    def test_disabled_instrumentation_leaves_nothing_behind(self):
+        originals = [
+            CalmarendianDate.__dict__["sanitized_adr"], CalmarendianDate.__dict__["elements_from_adr"],
+            DateString.__dict__["parsed"], bulk.numbers_from_adrs, date_format.formatted
+        ]
+        instrumentation.enable(timing=True)
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(originals[0], CalmarendianDate.__dict__["sanitized_adr"])
+        self.assertIn("__init__", CalmarendianDateError.__dict__)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertListEqual(originals, [
+            CalmarendianDate.__dict__["sanitized_adr"], CalmarendianDate.__dict__["elements_from_adr"],
+            DateString.__dict__["parsed"], bulk.numbers_from_adrs, date_format.formatted
+        ])
+        self.assertNotIn("__init__", CalmarendianDateError.__dict__)
+        CalmarendianDate(1).gcn()
+        self.assertEqual({}, instrumentation.snapshot().counts)
+
+    def test_counts(self):
+        with instrumentation.instrumented() as recording:
+            date = CalmarendianDate(1_906_750)
+            date.gcn()
+            date.csn()
+            date.common_symbolic_notation("CE")
+            date.colloquial_date()
+            date.strftime("%A")
+            CalmarendianDate.from_date_string("02-077-7-03-1")
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                CalmarendianDate.parse_many(["777-7-03-1", "777-7-03-1 BH"])
+            with self.assertRaises(CalmarendianDateError):
+                CalmarendianDate.from_date_string("777-7-03-1 XX")
+            with self.assertRaises(CalmarendianDateError):
+                CalmarendianDate(-2_000_000)
+            with self.assertRaises(CalmarendianDateError):
+                CalmarendianDate.from_numbers(2, 1, 6, 51, 1)
+            dates = CalmarendianDateArray.from_adrs([1, 2, 3])
+            dates.season
+            dates.common_symbolic_notations()
+        self.assertDictEqual({
+            "sanitized_adr": 2,
+            "decode.elements_from_adr": 1,
+            "decode.numbers_from_adrs": 3,
+            "parse.gcn": 1,
+            "parse.csn": 2,
+            "parse.failed": 1,
+            "render.gcn": 1,
+            "render.csn": 2,
+            "render.colloquial": 1,
+            "render.strftime": 1,
+            "render.bulk_csn": 3,
+            "error.CalmarendianDateFormatError": 1,
+            "error.CalmarendianDateDomainError": 1,
+            "error.CalmarendianDateError": 1,
+        }, recording.counts)
+        self.assertDictEqual({}, recording.seconds)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_memoized_notations_are_not_rendered_again(self):
+        CalmarendianDate.enable_notation_memo()
+        with instrumentation.instrumented() as recording:
+            date = CalmarendianDate(1_906_750)
+            for _ in range(3):
+                date.gcn()
+                str(date)
+        self.assertEqual(1, recording.counts["render.gcn"])
+        self.assertEqual(1, recording.counts["render.csn"])
+
+    def test_timing(self):
+        with instrumentation.instrumented(timing=True) as recording:
+            CalmarendianDate.from_date_string("777-7-03-1").gcn()
+        self.assertEqual({"parse.csn", "render.gcn"}, set(recording.seconds))
+        self.assertTrue(all(seconds > 0 for seconds in recording.seconds.values()))
+
+    def test_snapshot_and_reset(self):
+        instrumentation.enable()
+        CalmarendianDate(1).date_elements()
+        first = instrumentation.snapshot()
+        CalmarendianDate(2).date_elements()
+        self.assertEqual(1, first.counts["decode.elements_from_adr"])
+        self.assertEqual(2, instrumentation.snapshot().counts["decode.elements_from_adr"])
+        instrumentation.disable()
+        self.assertEqual(2, instrumentation.snapshot().counts["decode.elements_from_adr"])
+        instrumentation.reset()
+        self.assertEqual(instrumentation.Snapshot({}, {}), instrumentation.snapshot())
+
+    def test_instrumented_methods_behave_as_before(self):
+        instrumentation.enable(timing=True)
+        date = CalmarendianDate.from_date_string("777-7-03-1")
+        self.assertEqual("02-077-7-03-1", date.gcn())
+        self.assertEqual("777-7-03-1 CE", date.common_symbolic_notation("CE"))
+        self.assertEqual(date, CalmarendianDate(date.adr))
+        self.assertEqual(CalmarendianDate.sanitized_adr.__name__, "sanitized_adr")
+        with self.assertRaisesRegex(CalmarendianDateError, "is an invalid date string"):
+            CalmarendianDate.from_date_string("nonsense")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from npm_calmarendian_date.exceptions import CalmarendianDateDomainError
+from npm_calmarendian_date.lru_cache import CacheInfo, LRUCache
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_bad_size(self):
+        with self.assertRaises(CalmarendianDateDomainError):
+            LRUCache(0)
+
+    def test_hits_and_misses(self):
+        cache = LRUCache(4)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(CacheInfo(hits=2, misses=1, evictions=0, maxsize=4, currsize=1), cache.cache_info())
+
+    def test_least_recently_used_evicted(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(1, cache.cache_info().evictions)
+        self.assertEqual(2, len(cache))
+
+    def test_replacing_an_entry_does_not_evict(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        self.assertEqual(10, cache.get('a'))
+        self.assertEqual(0, cache.cache_info().evictions)
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        for key in 'abc':
+            cache.put(key, key)
+            cache.get(key)
+        cache.clear()
+        self.assertEqual(CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0), cache.cache_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import sys
+import tracemalloc
+import unittest
+
+from npm_calmarendian_date import CalmarendianDate, CalmarendianDateArray, CalmarendianTimeDelta
+from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week
+
+# Per-instance byte budgets, as reported by sys.getsizeof on 64-bit CPython, with some headroom for the
+# differences between the supported Python versions.
+DATE_BYTES = 64
+ELEMENT_BYTES = 64
+
+# Traced allocation per date, including its ADR integer and its slot in the containing list.
+# Decoded dates share interned date element objects so decoding costs little more than the tuple holding them.
+UNDECODED_DATE_BYTES = 96
+DECODED_DATE_BYTES = 192
+
+# Traced allocation per date held in a CalmarendianDateArray.
+DATE_ARRAY_BYTES = 8
+
+
+class SlotsTests(unittest.TestCase):
+    def test_no_instance_dictionaries(self):
+        d = CalmarendianDate(1_906_904)
+        for obj in (d, *d.date_elements()):
+            with self.subTest(cls=obj.__class__.__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_no_arbitrary_attributes(self):
+        d = CalmarendianDate(1_906_904)
+        with self.assertRaises(AttributeError):
+            d.era = "CE"
+        with self.assertRaises(AttributeError):
+            d.season.colour = "Orange"
+
+    def test_instance_sizes(self):
+        d = CalmarendianDate(1_906_904)
+        self.assertLessEqual(sys.getsizeof(d), DATE_BYTES)
+        for element in (GrandCycle(2), CycleInGrandCycle(77), Season(7), Week(51, Season(7)), d.day):
+            with self.subTest(cls=element.__class__.__name__):
+                self.assertLessEqual(sys.getsizeof(element), ELEMENT_BYTES)
+
+    def test_time_delta(self):
+        delta = CalmarendianTimeDelta(days=1, microseconds=1)
+        self.assertFalse(hasattr(delta, '__dict__'))
+        self.assertLessEqual(sys.getsizeof(delta), DATE_BYTES)
+
+
+class TracedAllocationTests(unittest.TestCase):
+    SAMPLE_SIZE = 10_000
+
+    def setUp(self) -> None:
+        tracemalloc.start()
+
+    def tearDown(self) -> None:
+        tracemalloc.stop()
+
+    def traced_bytes_per_date(self, decode: bool) -> float:
+        before, _ = tracemalloc.get_traced_memory()
+        dates = [CalmarendianDate(1_000_000 + i) for i in range(self.SAMPLE_SIZE)]
+        if decode:
+            for d in dates:
+                d.date_elements()
+        after, _ = tracemalloc.get_traced_memory()
+        return (after - before) / len(dates)
+
+    def test_undecoded_dates(self):
+        self.assertLessEqual(self.traced_bytes_per_date(decode=False), UNDECODED_DATE_BYTES)
+
+    def test_decoded_dates(self):
+        self.assertLessEqual(self.traced_bytes_per_date(decode=True), DECODED_DATE_BYTES)
+
+    def test_notation_memo_is_opt_in(self):
+        d = CalmarendianDate(1_906_904)
+        d.grand_cycle_notation()
+        d.common_symbolic_notation()
+        self.assertIsNone(CalmarendianDate.notation_memo_info())
+        self.assertNotIn('_notations', CalmarendianDate.__slots__)
+
+    def test_date_array(self):
+        before, _ = tracemalloc.get_traced_memory()
+        dates = CalmarendianDateArray.from_adrs(range(1_000_000, 1_000_000 + self.SAMPLE_SIZE))
+        after, _ = tracemalloc.get_traced_memory()
+        self.assertLessEqual((after - before) / len(dates), DATE_ARRAY_BYTES + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
+import random
 import unittest
+import warnings
+from math import ceil
 from typing import Any
 
 from npm_calmarendian_date.string_conversions import DateString
+from npm_calmarendian_date.c_date_config import CDateConfig
 from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateFormatError
 
 
@@ -117,5 +121,66 @@ class CSNStringConversionTests(unittest.TestCase):
             self.assertTupleEqual(item["result"], d.elements())
 
 
+class ScannerEquivalenceTests(unittest.TestCase):
+    """
+    The scanner must accept exactly the strings matched by the RegEx definitions of the notations
+    and extract the same elements from them.
+    """
+
+    @staticmethod
+    def regex_parse(date_string: str):
+        m = CDateConfig.GCN_DATE_STRING_RE.match(date_string)
+        if m:
+            return tuple(int(m.group(i)) for i in range(1, 6))
+        m = CDateConfig.CSN_DATE_STRING_RE.match(date_string)
+        if m:
+            c = int(m.group(1))
+            if m.group(5) and m.group(5).upper() == "BZ":
+                c = -c
+            gc = ceil(c / 700)
+            c += 700 * (1 - gc)
+            return gc, c, int(m.group(2)), int(m.group(3)), int(m.group(4))
+        return None
+
+    @staticmethod
+    def scanner_parse(date_string: str):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return DateString(date_string).elements()
+        except CalmarendianDateFormatError:
+            return None
+
+    @staticmethod
+    def corpus():
+        rng = random.Random(700)
+        seeds = [
+            '00-001-1-01-1', '02-077-7-51-7', '99-700-7-51-8', '15-199-3-29-4',
+            '000-7-51-8 BZ', '699-1-01-1 BZ', '423-1-23-4', '777-7-03-1 CE', '9999-7-51-4', '1401-1-23-4 bz',
+            '777-3-48-6 BH', '400-1-23-4 ce', '012-4-05-6    BZ', '777-7-07-7  ',
+        ]
+        alphabet = "0123456789-- Bbz ZHhCcEeA\n\t\u0663\uff11"
+        strings = set(seeds)
+        for seed in seeds:
+            strings.update([seed + "\n", seed + "\n\n", " " + seed, seed + " ", seed.upper(), seed.lower()])
+            for i in range(len(seed) + 1):
+                strings.add(seed[:i] + seed[i + 1:])
+                for ch in rng.sample(alphabet, 6):
+                    strings.add(seed[:i] + ch + seed[i + 1:])
+                    strings.add(seed[:i] + ch + seed[i:])
+        return sorted(strings)
+
+    def test_equivalence(self):
+        for date_string in self.corpus():
+            with self.subTest(date_string=date_string):
+                self.assertEqual(self.regex_parse(date_string), self.scanner_parse(date_string))
+
+    def test_unicode_digits(self):
+        for date_string in ['\u0660\u0662-077-7-07-7', '7\u0667\u0667-7-07-7', '777-7-0\u0667-7']:
+            with self.subTest(date_string=date_string):
+                self.assertIsNotNone(self.regex_parse(date_string))
+                self.assertEqual(self.regex_parse(date_string), self.scanner_parse(date_string))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,146 @@
+import pickle
+import unittest
+
+from npm_calmarendian_date import CalmarendianTimeDelta
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
+from npm_calmarendian_date.exceptions import CalmarendianDateRangeError
+
+DAY_MICROSECONDS = 65_536 * 1_000_000
+
+
+class ConstructionTests(unittest.TestCase):
+    def test_normalization(self):
+        data = [
+            ({}, (0, 0, 0)),
+            ({'days': 1}, (1, 0, 0)),
+            ({'seconds': 65_536}, (1, 0, 0)),
+            ({'hours': 18, 'minutes': 12, 'seconds': 16}, (1, 0, 0)),
+            ({'hours': 1, 'minutes': 1, 'seconds': 1}, (0, 3_661, 0)),
+            ({'milliseconds': 1_500, 'microseconds': 7}, (0, 1, 500_007)),
+            ({'microseconds': -1}, (-1, 65_535, 999_999)),
+            ({'days': -1, 'seconds': 65_536}, (0, 0, 0)),
+        ]
+        for kwargs, components in data:
+            with self.subTest(kwargs=kwargs):
+                delta = CalmarendianTimeDelta(**kwargs)
+                self.assertEqual(components, delta.components())
+                self.assertEqual(components, (delta.days, delta.seconds, delta.microseconds))
+
+    def test_floats_are_exact(self):
+        self.assertEqual(CalmarendianTimeDelta(seconds=32_768), CalmarendianTimeDelta(days=0.5))
+        self.assertEqual(CalmarendianTimeDelta(microseconds=100_000), CalmarendianTimeDelta(seconds=0.1))
+        # 0.1 + 0.2 != 0.3 as floats, but each is converted exactly and only the total is rounded.
+        self.assertEqual(
+            CalmarendianTimeDelta(seconds=0.3),
+            CalmarendianTimeDelta(seconds=0.1, milliseconds=200.0)
+        )
+        # Halves round to even.
+        self.assertEqual(0, CalmarendianTimeDelta(microseconds=0.5).microseconds)
+        self.assertEqual(2, CalmarendianTimeDelta(microseconds=1.5).microseconds)
+        self.assertEqual((-1, 65_535, 999_998), CalmarendianTimeDelta(microseconds=-1.5).components())
+
+    def test_limits(self):
+        self.assertEqual((CDateConfig.MAX_DELTA_DAYS - 1, 65_535, 999_999), CalmarendianTimeDelta.max.components())
+        self.assertEqual((-CDateConfig.MAX_DELTA_DAYS, 0, 0), CalmarendianTimeDelta.min.components())
+        self.assertEqual((0, 0, 1), CalmarendianTimeDelta.resolution.components())
+        self.assertEqual(CalmarendianTimeDelta.min, CalmarendianTimeDelta(days=-CDateConfig.MAX_DELTA_DAYS))
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianTimeDelta(days=CDateConfig.MAX_DELTA_DAYS)
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianTimeDelta(days=-CDateConfig.MAX_DELTA_DAYS, microseconds=-1)
+
+    def test_invalid_components(self):
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianTimeDelta(days="1")
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianTimeDelta(seconds=float("nan"))
+        with self.assertRaises(CalmarendianDateDomainError):
+            CalmarendianTimeDelta(seconds=float("inf"))
+
+
+class ArithmeticTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.day = CalmarendianTimeDelta(days=1)
+        self.hour = CalmarendianTimeDelta(hours=1)
+
+    def test_addition_and_subtraction(self):
+        self.assertEqual(CalmarendianTimeDelta(days=1, hours=1), self.day + self.hour)
+        self.assertEqual(CalmarendianTimeDelta(seconds=65_536 - 3_600), self.day - self.hour)
+        self.assertEqual((-1, 3_600, 0), (self.hour - self.day).components())
+        with self.assertRaises(TypeError):
+            self.day + 1
+        with self.assertRaises(CalmarendianDateRangeError):
+            CalmarendianTimeDelta.max + CalmarendianTimeDelta.resolution
+
+    def test_multiplication(self):
+        self.assertEqual(CalmarendianTimeDelta(days=3), self.day * 3)
+        self.assertEqual(CalmarendianTimeDelta(days=3), 3 * self.day)
+        self.assertEqual(CalmarendianTimeDelta(minutes=90), self.hour * 1.5)
+        self.assertEqual(CalmarendianTimeDelta(microseconds=2), CalmarendianTimeDelta(microseconds=5) * 0.5)
+        with self.assertRaises(CalmarendianDateRangeError):
+            self.day * CDateConfig.MAX_DELTA_DAYS
+
+    def test_division(self):
+        self.assertEqual(65_536 / 3_600, self.day / self.hour)
+        self.assertEqual(18, self.day // self.hour)
+        self.assertEqual(CalmarendianTimeDelta(hours=6), CalmarendianTimeDelta(hours=18) / 3)
+        self.assertEqual(CalmarendianTimeDelta(microseconds=2), CalmarendianTimeDelta(microseconds=5) / 2)
+        self.assertEqual(CalmarendianTimeDelta(microseconds=2), CalmarendianTimeDelta(microseconds=5) // 2)
+        self.assertEqual(CalmarendianTimeDelta(hours=2), self.hour / 0.5)
+        with self.assertRaises(ZeroDivisionError):
+            self.day / CalmarendianTimeDelta()
+
+    def test_modulo(self):
+        self.assertEqual(CalmarendianTimeDelta(seconds=65_536 - 18 * 3_600), self.day % self.hour)
+        self.assertEqual((18, self.day % self.hour), divmod(self.day, self.hour))
+        self.assertEqual((-19, self.hour - self.day % self.hour), divmod(-self.day, self.hour))
+
+    def test_unary_operators(self):
+        self.assertEqual((-1, 0, 0), (-self.day).components())
+        self.assertIs(self.day, +self.day)
+        self.assertEqual(self.day, abs(-self.day))
+        self.assertFalse(CalmarendianTimeDelta())
+        self.assertTrue(CalmarendianTimeDelta.resolution)
+        with self.assertRaises(CalmarendianDateRangeError):
+            -CalmarendianTimeDelta.min
+
+
+class ComparisonTests(unittest.TestCase):
+    def test_ordering(self):
+        deltas = [CalmarendianTimeDelta(microseconds=us) for us in (5, -DAY_MICROSECONDS, 0, DAY_MICROSECONDS, -1)]
+        self.assertEqual([-DAY_MICROSECONDS, -1, 0, 5, DAY_MICROSECONDS],
+                         [d.total_seconds() * 1_000_000 for d in sorted(deltas)])
+        self.assertTrue(CalmarendianTimeDelta(days=1) >= CalmarendianTimeDelta(seconds=65_536))
+        self.assertTrue(CalmarendianTimeDelta(days=1) != CalmarendianTimeDelta(seconds=65_535))
+
+    def test_hashing(self):
+        self.assertEqual(1, len({CalmarendianTimeDelta(days=1), CalmarendianTimeDelta(seconds=65_536)}))
+
+    def test_other_types(self):
+        self.assertNotEqual(CalmarendianTimeDelta(), 0)
+        with self.assertRaises(TypeError):
+            CalmarendianTimeDelta() < 0
+
+
+class RepresentationTests(unittest.TestCase):
+    def test_str_and_repr(self):
+        data = [
+            (CalmarendianTimeDelta(), "0:00:00", "CalmarendianTimeDelta()"),
+            (CalmarendianTimeDelta(days=2, hours=3, seconds=4.5),
+             "2 days, 3:00:04.500000", "CalmarendianTimeDelta(days=2, seconds=10804, microseconds=500000)"),
+            (CalmarendianTimeDelta(microseconds=-1),
+             "-1 day, 18:12:15.999999", "CalmarendianTimeDelta(days=-1, seconds=65535, microseconds=999999)"),
+        ]
+        for delta, text, representation in data:
+            with self.subTest(delta=text):
+                self.assertEqual(text, str(delta))
+                self.assertEqual(representation, repr(delta))
+
+    def test_pickling(self):
+        delta = CalmarendianTimeDelta(days=-7, microseconds=3)
+        self.assertEqual(delta, pickle.loads(pickle.dumps(delta)))
+
+
+if __name__ == '__main__':
+    unittest.main()